@@ -5,6 +5,44 @@
 # game board. First to the opposing side wins. Players can use fences to block
 # each-other's moves. Each player gets 10 fences.
 
+import json
+import os
+import sys
+from array import array
+from types import MappingProxyType
+
+from Quoridor_metrics import Metrics, instrument, uninstrument
+from Quoridor_render import plot_board, render, save_board, write_board
+from Quoridor_state import BoardGeometry, GameState, PathEngine, check_board_size, pack_position, unpack_position
+
+# The bit of a node's wall flags for each of its four sides.
+UP_WALL = 1
+DOWN_WALL = 2
+LEFT_WALL = 4
+RIGHT_WALL = 8
+
+# The offset of each nearby position, in the order get_nearby_nodes lists them.
+NEARBY_OFFSETS = (("up", (0, -1)),
+                  ("down", (0, 1)),
+                  ("right", (1, 0)),
+                  ("left", (-1, 0)),
+                  ("up-right", (1, -1)),
+                  ("up-left", (-1, -1)),
+                  ("down-right", (1, 1)),
+                  ("down-left", (-1, 1)))
+
+# The game main() plays, as (method, arguments) steps. The benchmarks play
+# it too.
+MAIN_SCRIPT = (("move_pawn", (1, (4, 1))), ("move_pawn", (2, (5, 8))), ("place_fence", (1, "v", (7, 6))),
+               ("move_pawn", (2, (5, 8))), ("place_fence", (2, "h", (2, 5))), ("place_fence", (1, "h", (3, 3))),
+               ("place_fence", (2, "h", (0, 3))), ("move_pawn", (1, (4, 2))), ("move_pawn", (2, (4, 7))),
+               ("move_pawn", (2, (4, 8))), ("move_pawn", (1, (4, 3))), ("move_pawn", (2, (5, 7))),
+               ("move_pawn", (2, (4, 7))), ("move_pawn", (1, (4, 4))), ("move_pawn", (2, (4, 6))),
+               ("place_fence", (1, "h", (4, 4))), ("move_pawn", (2, (4, 5))), ("place_fence", (1, "v", (0, 0))),
+               ("place_fence", (1, "v", (4, 0))), ("move_pawn", (2, (5, 4))), ("move_pawn", (1, (6, 4))),
+               ("place_fence", (1, "h", (5, 4))), ("move_pawn", (2, (6, 4))), ("move_pawn", (1, (4, 5))),
+               ("move_pawn", (2, (6, 3))), ("move_pawn", (1, (4, 6))))
+
 
 class YouAlreadyLiveHereError(Exception):
     """
@@ -16,9 +54,23 @@ class YouAlreadyLiveHereError(Exception):
 class Node:
     """
     Represents a single playable position on a game board.
-    Will be composited into our QuoridorGame class.
+    Will be composited into our QuoridorGame class. The walls of a node are
+    kept as four bit flags, and its nearby positions and wall lists are
+    read-only views shared by every node and game.
     """
 
+    # Nearby positions of every coordinate looked up so far, by coordinate.
+    _nearby_tables = dict()
+
+    # One read-only wall list for each of the 16 combinations of wall flags.
+    _wall_tables = tuple(MappingProxyType({"up": bool(flags & UP_WALL),
+                                           "down": bool(flags & DOWN_WALL),
+                                           "left": bool(flags & LEFT_WALL),
+                                           "right": bool(flags & RIGHT_WALL)})
+                         for flags in range(16))
+
+    __slots__ = ("_node_name", "_next_node", "_player_data", "_walls")
+
     def __init__(self, name):
         """
         Initializes a single playable position with 9 outside movement opportunities
@@ -34,21 +86,9 @@ class Node:
         # Can also be a fence.
         self._player_data = None
 
-        # The positions in any cardinal position around the node.
-        self._one_up = None  # The node above this node
-        self._one_down = None  # The node below this node
-        self._one_right = None  # The node right of this node
-        self._one_left = None  # The node left of this node
-        self._one_diag_up_right = None  # The node up/right of this node
-        self._one_diag_up_left = None  # The node up/left of this node
-        self._one_diag_down_right = None  # The node down/right of this node
-        self._one_diag_down_left = None  # The node down/left of this node
-
-        # Defines the four sides of a node that fences can be place
-        self._up_wall = False
-        self._down_wall = False
-        self._left_wall = False
-        self._right_wall = False
+        # Defines the four sides of a node that fences can be place, as the
+        # UP_WALL, DOWN_WALL, LEFT_WALL and RIGHT_WALL bits.
+        self._walls = 0
 
     def __repr__(self):
         """The representation of our object"""
@@ -79,132 +119,149 @@ class Node:
         location"""
         return self._node_name
 
+    def get_wall(self, wall_bit):
+        """Returns whether there is a fence on the side of wall_bit"""
+        return self._walls & wall_bit != 0
+
+    def set_wall(self, wall_bit):
+        """Sets a fence on the side of wall_bit"""
+        if self._walls & wall_bit:
+            return "Wall already exists"
+        self._walls |= wall_bit
+        return True
+
+    def clear_wall(self, wall_bit):
+        """Takes down a fence on the side of wall_bit"""
+        self._walls &= ~wall_bit
+
     def get_up_wall(self):
         """Returns whether there is a fence in north wall"""
-        return self._up_wall
+        return self.get_wall(UP_WALL)
 
     def set_up_wall(self):
         """Sets whether there is a fence in the north wall"""
-        if self.get_up_wall() is False:
-            self._up_wall = True
-            return self._up_wall
-        else:
-            return "Wall already exists"
+        return self.set_wall(UP_WALL)
 
     def get_down_wall(self):
         """Returns whether there is a fence in south wall"""
-        return self._down_wall
+        return self.get_wall(DOWN_WALL)
 
     def set_down_wall(self):
         """Sets whether there is a fence in the south wall"""
-        if self.get_down_wall() is False:
-            self._down_wall = True
-            return self._down_wall
-        else:
-            return "Wall already exists"
+        return self.set_wall(DOWN_WALL)
 
     def get_left_wall(self):
         """Returns whether there is a fence in west wall"""
-        return self._left_wall
+        return self.get_wall(LEFT_WALL)
 
     def set_left_wall(self):
         """Sets whether there is a fence in the west wall"""
-        if self.get_left_wall() is False:
-            self._left_wall = True
-            return self._left_wall
-        else:
-            return "Wall already exists"
+        return self.set_wall(LEFT_WALL)
 
     def get_right_wall(self):
         """Returns whether there is a fence in east wall"""
-        return self._right_wall
+        return self.get_wall(RIGHT_WALL)
 
     def set_right_wall(self):
         """Sets whether there is a fence in the east wall"""
-        if self.get_right_wall() is False:
-            self._right_wall = True
-            return self._right_wall
-        else:
-            return "Wall already exists"
+        return self.set_wall(RIGHT_WALL)
+
+    def clear_up_wall(self):
+        """Takes down a fence in the north wall"""
+        self.clear_wall(UP_WALL)
+
+    def clear_down_wall(self):
+        """Takes down a fence in the south wall"""
+        self.clear_wall(DOWN_WALL)
+
+    def clear_left_wall(self):
+        """Takes down a fence in the west wall"""
+        self.clear_wall(LEFT_WALL)
+
+    def clear_right_wall(self):
+        """Takes down a fence in the east wall"""
+        self.clear_wall(RIGHT_WALL)
 
     def get_list_of_walls(self):
         """
-        Returns the list of all walls
+        Returns the list of all walls, as a read-only view shared by every
+        node with the same walls.
         """
-        list_of_walls = {
-            "up": self.get_up_wall(),
-            "down": self.get_down_wall(),
-            "left": self.get_left_wall(),
-            "right": self.get_right_wall()
-        }
-
-        return list_of_walls
+        return self._wall_tables[self._walls]
 
     def get_nearby_nodes(self):
-        """Returns all spaces touching this Node as index values (row, col)"""
-        list_of_nearby_spaces = {"up": self._one_up,
-                                 "down": self._one_down,
-                                 "right": self._one_right,
-                                 "left": self._one_left,
-                                 "up-right": self._one_diag_up_right,
-                                 "up-left": self._one_diag_up_left,
-                                 "down-right": self._one_diag_down_right,
-                                 "down-left": self._one_diag_down_left
-                                 }
-        return list_of_nearby_spaces
+        """
+        Returns all spaces touching this Node as index values (row, col), as a
+        read-only view shared by every node at this coordinate.
+        """
+        nearby = self._nearby_tables.get(self._node_name)
+        if nearby is None:
+            x, y = self._node_name
+            nearby = MappingProxyType({name: (x + dx, y + dy) for name, (dx, dy) in NEARBY_OFFSETS})
+            self._nearby_tables[self._node_name] = nearby
+        return nearby
 
     def set_nearby_nodes(self):
-        """Sets all nearby nodes of our current node"""
-        current_node = self.get_node_name()
-
-        self._one_up = (current_node[0], current_node[1] - 1)  # (0, -1)
-        self._one_down = (current_node[0], current_node[1] + 1)  # (0, 1)
-        self._one_right = (current_node[0] + 1, current_node[1])  # (1, 0)
-        self._one_left = (current_node[0] - 1, current_node[1])  # (-1, 0)
-        self._one_diag_up_right = (current_node[0] + 1, current_node[1] - 1)  # (1, -1)
-        self._one_diag_up_left = (current_node[0] - 1, current_node[1] - 1)  # (-1, -1)
-        self._one_diag_down_right = (current_node[0] + 1, current_node[1] + 1)  # (1, 1)
-        self._one_diag_down_left = (current_node[0] - 1, current_node[1] + 1)  # (-1, 1)
+        """
+        Kept for backwards compatibility. Nearby nodes come from the shared
+        table, so there is nothing to set.
+        """
+        pass
 
 
 class GameBoard:
     """
     Represents a square game board of nodes as a linked list
-    (will default to 9 x 9 but can be of any size)
+    (will default to 9 x 9 but can be of any size). The nodes are also
+    indexed by coordinate and by player so lookups never walk the list.
     Will be composited into our QuoridorGame class.
     """
 
-    def __init__(self):
+    # Every coordinate tuple handed out by coordinate(), by itself.
+    _coordinates = dict()
+
+    def __init__(self, size=9):
         """
-        Initializes a game board with nodes in every position
+        Initializes a size x size game board with nodes in every position.
+        Raises ValueError if size isn't an int of at least 3.
         """
+        check_board_size(size)
+        self._size = size
+
         # The header of our linked list
         self._board_head = None
 
+        # A flat, row-major index of every node in the list so that a
+        # coordinate can be resolved without walking the list. Filled in
+        # as create_board links each node.
+        self._grid = None
+        self._cols = 0
+        self._rows = 0
+
+        # Maps a player name to the node it currently occupies.
+        self._player_index = dict()
+
         # The dedicated positions that player 1 would need to reach to win
-        self._p2_winning_area = [(0, 0),
-                                 (1, 0),
-                                 (2, 0),
-                                 (3, 0),
-                                 (4, 0),
-                                 (5, 0),
-                                 (6, 0),
-                                 (7, 0),
-                                 (8, 0)]
+        self._p2_winning_area = [self.coordinate(x, 0) for x in range(size)]
 
         # The dedicated positions that player 2 would need to reach to win
-        self._p1_winning_area = [(0, 8),
-                                 (1, 8),
-                                 (2, 8),
-                                 (3, 8),
-                                 (4, 8),
-                                 (5, 8),
-                                 (6, 8),
-                                 (7, 8),
-                                 (8, 8)]
+        self._p1_winning_area = [self.coordinate(x, size - 1) for x in range(size)]
 
         # The extreme bounds of the board
-        self._outer_bounds = [(0, 0), (8, 8)]
+        self._outer_bounds = [(0, 0), (size - 1, size - 1)]
+
+    def get_size(self):
+        """Returns the number of rows (and columns) of the board"""
+        return self._size
+
+    @classmethod
+    def coordinate(cls, x, y):
+        """
+        Returns the (x, y) tuple shared by every board for that coordinate, so
+        each game's nodes don't hold their own copy.
+        """
+        coord_tuple = (x, y)
+        return cls._coordinates.setdefault(coord_tuple, coord_tuple)
 
     def get_head(self):
         """Returns the head of our list"""
@@ -237,148 +294,143 @@ class GameBoard:
         """
         return self._board_head is None
 
-    def create_board(self, previous=None, cols_count=0, rows_count=0, cols=9, rows=9):
+    def add_to_grid(self, node_object, cols, rows):
         """
-        Creates the game board with specific numbers of rows and columns
-        Defaults to ReadMe spec "9 x 9" and Node() objects, but doesn't
-        require these.
+        Records a newly linked node in the flat grid index so it can later be
+        found by its coordinate in constant time.
         """
-        # When our col_count = 9 and row_count =9, we've hit the last node.
-        # Return the list at that point.
-        if cols_count == cols and rows_count == (rows - 1):
-            return
+        # The first node of a board sizes the grid.
+        if self._grid is None:
+            self._grid = [None] * (cols * rows)
+            self._cols = cols
+            self._rows = rows
 
-        # In the case of an empty list -- create the first object.
-        # When we iterate, this will become our previous.
-        elif self.is_empty():
-            node_object = Node((cols_count, rows_count))
-            self.set_head(node_object)
-            return self.create_board(self.get_head(), cols_count + 1, rows_count, cols, rows)
-
-        # If previous isn't none, and we haven't overpopulated our col, create a new node
-        # in this column. Set the previous node's next to the new node and iterate again
-        elif previous is not None and cols_count != cols:
-            current = Node((cols_count, rows_count))
-            previous.set_next(current)
-            return self.create_board(current, cols_count + 1, rows_count, cols, rows)
-
-        # If previous isn't none, but we've overpopulated our col, increment our row first
-        # then create a new node in the first column of new row. Set the previous node's
-        # next to the new node and iterate again
-        elif previous is not None and cols_count == cols:
-            cols_count = 0
-            rows_count += 1
-            current = Node((cols_count, rows_count))
-            previous.set_next(current)
-            return self.create_board(current, cols_count + 1, rows_count, cols, rows)
+        x, y = node_object.get_node_name()
+        self._grid[y * self._cols + x] = node_object
 
-    def find_board_node(self, coord_tuple, pos=None):
+    def create_board(self, previous=None, cols_count=0, rows_count=0, cols=None, rows=None):
         """
-        Will recursively find the node object associated with the coord_tuple by
-        searching through the linked list of our game board and finding the node with
-        the corresponding node name. Will return the node.
+        Creates the game board with specific numbers of rows and columns
+        Defaults to the board's size and Node() objects, but doesn't
+        require these. Nodes are linked one row after another in a loop, so
+        the size of the board isn't limited by the recursion limit. previous,
+        cols_count and rows_count continue a partly built list after previous.
         """
-        # Sets the position parameter to the header (the first in the list)
-        if pos is None:
-            pos = self.get_head()
+        cols = cols or self._size
+        rows = rows or self._size
 
-        # If pos.get_next() is None, that means we've reached the end of the list.
-        if pos.get_next() is None and pos.get_node_name() != coord_tuple:
-            return "The node coordinate you're looking for does not exist."
+        for index in range(rows_count * cols + cols_count, cols * rows):
+            current = Node(self.coordinate(index % cols, index // cols))
 
-        # If the name matches the coordinate name of the node, return the node
-        if pos.get_node_name() == coord_tuple:
-            return pos
+            # In the case of an empty list -- the first node is our head.
+            # Otherwise, set the previous node's next to the new node.
+            if self.is_empty():
+                self.set_head(current)
+            else:
+                previous.set_next(current)
+            self.add_to_grid(current, cols, rows)
+            previous = current
 
-        # Otherwise iterate through the list.
-        else:
-            return self.find_board_node(coord_tuple, pos.get_next())
+    def find_board_node(self, coord_tuple, pos=None):
+        """
+        Returns the node object associated with the coord_tuple. The node is read
+        straight out of the grid index, so the lookup costs the same wherever the
+        node sits in the linked list. pos is kept for backwards compatibility.
+        """
+        # Anything that isn't an (x, y) pair on the board does not exist.
+        try:
+            x, y = coord_tuple
+            if 0 <= x < self._cols and 0 <= y < self._rows:
+                return self._grid[y * self._cols + x]
+        except (TypeError, ValueError):
+            pass
+
+        return "The node coordinate you're looking for does not exist."
 
     def find_player_node(self, player_name, pos=None):
         """
-        Will recursively find the node object associated with the player name by
-        searching through the linked list of our game board and finding the node with
-        the corresponding node data. Will return the node.
+        Returns the node object associated with the player name. The player index
+        is trusted as long as the indexed node still holds that player; otherwise
+        the grid is scanned once and the index refreshed. pos is kept for
+        backwards compatibility.
         """
-        # Sets the position parameter to the header (the first in the list)
-        if pos is None:
-            pos = self.get_head()
+        # The common case: the index is up to date.
+        node = self._player_index.get(player_name)
+        if node is not None and node.get_player_data() == player_name:
+            return node
 
-        # If pos.get_next() is None, that means we've reached the end of the list.
-        if pos.get_next() is None and pos.get_player_data() != player_name:
-            return "The Player you're looking for does not exist."
+        # Someone changed a node's player data directly. Rebuild this entry.
+        for node in self._grid or ():
+            if node is not None and node.get_player_data() == player_name:
+                self._player_index[player_name] = node
+                return node
 
-        # If the name matches the coordinate name of the node, return the node
-        elif pos.get_player_data() == player_name:
-            return pos
+        return "The Player you're looking for does not exist."
 
-        # Otherwise iterate through the list.
-        else:
-            return self.find_player_node(player_name, pos.get_next())
+    def set_player_node(self, player_name, node_object):
+        """
+        Moves a player's data onto node_object, clearing it from the node the
+        player previously occupied, and keeps the player index in sync.
+        """
+        previous = self._player_index.get(player_name)
+        if previous is not None and previous.get_player_data() == player_name:
+            previous.set_player_data(None)
 
-    def establish_outer_fences(self, pos=None, cols=9, rows=9):
+        node_object.set_player_data(player_name)
+        self._player_index[player_name] = node_object
+
+    def establish_outer_fences(self, pos=None, cols=None, rows=None):
         """
-        Takes a linked list. Appends individual nodes for to create the outer fences of
-        the game board. Returns the new list of nodes with updated fence options.
+        Takes a linked list. Turns on the walls of the nodes along the edges of
+        the board, from pos (the head by default) to the end of the list, to
+        create the outer fences of the game board. cols and rows default to
+        the dimensions the board was built with.
         """
+        cols = cols or self._cols or self._size
+        rows = rows or self._rows or self._size
+
         # If pos is none, establish it with the head
         if pos is None:
             pos = self.get_head()
 
-        # Grabs the name of each node.
-        node_name = pos.get_node_name()
-
-        # If the .get_next is None, we're at the bottom right of the board.
-        # Initiate the bottom and right fence of that node.
-        if pos.get_next() is None:
-            pos.set_down_wall()
-            pos.set_right_wall()
-            return
+        while pos is not None:
+            x, y = pos.get_node_name()
 
-        # Otherwise, grab the x and y coordinate of the node's name
-        # and turn on the following fences.
-        else:
-            x = node_name[0]
-            y = node_name[1]
-
-            # If x == 0, we're talking about the left-most row
+            # The left-most and right-most columns
             if x == 0:
                 pos.set_left_wall()
+            if x == (cols - 1):
+                pos.set_right_wall()
 
-            # If x is between 0 and the number of rows and y is zero,
-            # We're talking about the top column
+            # The top and bottom rows
             if y == 0:
                 pos.set_up_wall()
-
-            # If x is between 0 and the number of rows and y is our rows,
-            # We're talking about the bottom column
             if y == (rows - 1):
                 pos.set_down_wall()
 
-            # If x == our cols, we're talking about the right-most row
-            if x == (cols - 1):
-                pos.set_right_wall()
-
-            return self.establish_outer_fences(pos.get_next())
+            pos = pos.get_next()
 
     def rec_display(self, a_node):
-        """Helper function of display. Recursively displays the board
+        """Helper function of display. Displays the board from a_node on
         as a list of node names. Does not account for list of lists."""
-        if a_node is None:
-            return
-        print(a_node.get_node_name(), end=" ")
-        self.rec_display(a_node.get_next())
+        while a_node is not None:
+            print(a_node.get_node_name(), end=" ")
+            a_node = a_node.get_next()
 
     def display(self):
-        """Recursively displays the board as a list of node names.
+        """Displays the board as a list of node names.
         Does not account for a list of lists. """
         self.rec_display(self.get_head())
 
-    def to_plain_board(self, pos=None, result=None, cols_count=0, rows_count=0, cols=9, rows=9):
+    def to_plain_board(self, pos=None, result=None, cols_count=0, rows_count=0, cols=None, rows=None):
         """
-        Recursively returns a bracketed list of lists containing our board values,
-        in the same order, as the linked list
+        Returns a bracketed list of lists containing our board values,
+        in the same order, as the linked list. cols and rows default to the
+        dimensions the board was built with.
         """
+        cols = cols or self._cols or self._size
+        rows = rows or self._rows or self._size
+
         # If our result list doesn't already exist as a list, create it.
         if result is None:
             result = list()
@@ -389,31 +441,28 @@ class GameBoard:
         if pos is None:
             pos = self.get_head()
 
-        # pos.next is None implies that we've reached the last value in our list.
-        # if so, this is our last append. Then return the result.
-        if pos.get_next() is None:
-            result[rows_count].append(pos.get_node_name())
-            return result
-
-        # Otherwise, append appropriately, and move to the next object node.
-        else:
-            if cols_count != cols:
-                result[rows_count].append(pos.get_node_name())
-                return self.to_plain_board(pos.get_next(), result, cols_count + 1, rows_count, cols, rows)
-
-            elif cols_count == cols:
+        # Append each node name to its row, starting a new row once the
+        # current one is full.
+        while pos is not None:
+            if cols_count == cols:
                 cols_count = 0
                 rows_count += 1
-                result[rows_count].append(pos.get_node_name())
-                return self.to_plain_board(pos.get_next(), result, cols_count + 1, rows_count, cols, rows)
+            result[rows_count].append(pos.get_node_name())
+            cols_count += 1
+            pos = pos.get_next()
+
+        return result
 
 
 class Fence:
     """
     Represents a fence object that will block a 1 x 1 move square wall.
-    Will be composited into our Player class.
+    Will be composited into our Player class, which keeps its fences as the
+    integer codes of to_code.
     """
 
+    __slots__ = ("_direction", "_creation_point", "_end_point")
+
     def __init__(self, direction, creation_point):
         """
         Creation of a dedicated fence with direction and end points
@@ -457,6 +506,30 @@ class Fence:
         """
         return self._end_point
 
+    def get_segment(self):
+        """
+        Returns the fence as a line segment [[x1, x2], [y1, y2]] for printing.
+        """
+        if self._end_point is None:
+            self.find_end(self._direction, self._creation_point)
+        return [[self._creation_point[0], self._end_point[0]],
+                [self._creation_point[1], self._end_point[1]]]
+
+    def to_code(self):
+        """
+        Returns the fence packed into one integer: the creation point's x and y
+        in 16 bits each, then one bit that is set for a vertical fence.
+        """
+        x, y = self._creation_point
+        return ((x << 16 | y) << 1) | (self._direction == "v")
+
+    @classmethod
+    def from_code(cls, code):
+        """
+        Returns the Fence packed into code by to_code.
+        """
+        return cls("v" if code & 1 else "h", (code >> 17, code >> 1 & 0xFFFF))
+
 
 class Player:
     """
@@ -464,11 +537,15 @@ class Player:
     Will be composited into our QuoridorGame class.
     """
 
+    __slots__ = ("_player_name", "_home_position", "_fences", "_no_of_fences", "_current_position")
+
     def __init__(self, name, home_position):
         """Creation of a named player, their fences, their home position, and their current position"""
         self._player_name = int(name)
         self._home_position = home_position
-        self._fences = None
+
+        # The fences the player has set, as Fence.to_code integers.
+        self._fences = array("L")
         self._no_of_fences = 10
         self._current_position = None
 
@@ -501,40 +578,46 @@ class Player:
         self._current_position = position
 
     def get_fences(self):
-        """Returns a list of fences the player has set"""
-        if self._fences is None:
-            self._fences = list()
-            return self._fences
-        else:
-            return self._fences
+        """
+        Returns a list of fences the player has set, as the line segments
+        [[x1, x2], [y1, y2]] used for printing. The list is built from the
+        stored fence codes on each call.
+        """
+        return [Fence.from_code(code).get_segment() for code in self._fences]
+
+    def get_fence_codes(self):
+        """Returns the fences the player has set, as Fence.to_code integers"""
+        return self._fences
 
     def get_no_of_fences(self):
         """Returns the number of fences left to a player"""
         return self._no_of_fences
 
+    def set_no_of_fences(self, count):
+        """Sets the number of fences left to a player"""
+        self._no_of_fences = count
+
     def remove_fence(self):
         """Deduction of a fence from a players no. of fences when used"""
         self._no_of_fences -= 1
         return self._no_of_fences
 
+    def take_back_fence(self):
+        """
+        Removes the player's most recent fence and gives it back to them.
+        """
+        self._fences.pop()
+        self._no_of_fences += 1
+        return self._no_of_fences
+
     def add_new_fence(self, direction, pos_tuple):
         """Appends fences list with a new fence input. """
         # If player has available fences:
-        fence_list = self.get_fences()
-
         if self.is_fence_available():
 
-            # Creation of the fence object
-            new_fence = Fence(direction, pos_tuple)
-
-            # Finding of our fence end point.
-            new_fence.find_end(direction, pos_tuple)
-            fence_end = new_fence.get_end_point()
-
-            # Appending the players list of fences with the fence segment.
-            # This is for printing
-            coordinates = [pos_tuple[0], fence_end[0]], [pos_tuple[1], fence_end[1]]
-            fence_list.append(list(coordinates))
+            # Appending the players list of fences with the fence's code.
+            # get_fences turns it back into a segment for printing.
+            self._fences.append(Fence(direction, pos_tuple).to_code())
 
             # Deduction of a fence from players total allowed fences.
             self.remove_fence()
@@ -543,6 +626,13 @@ class Player:
         else:
             return False
 
+    def restore_fence(self, direction, pos_tuple):
+        """
+        Adds a fence the player placed earlier, such as one of a loaded
+        position, without touching their count of fences left.
+        """
+        self._fences.append(Fence(direction, pos_tuple).to_code())
+
     def is_fence_available(self):
         """
         Returns True if player object has remaining fences available, False
@@ -562,27 +652,54 @@ class QuoridorGame:
     our Board, our Fences and our Players. Will also be able to print our board.
     """
 
-    def __init__(self):
+    def __init__(self, size=9):
         """
-        Creation and initialization of all attributes of our Quoridor Game.
+        Creation and initialization of all attributes of our Quoridor Game,
+        on a size x size board (9 x 9 by default). Raises ValueError if size
+        isn't an int of at least 3.
         """
-        # Creation of our game board and outer fences.
-        self._game_board = GameBoard()
+        # Creation of our game board and outer fences, and the shared lookup
+        # tables for a board of its size.
+        self._geometry = BoardGeometry.of_size(size)
+        self._game_board = GameBoard(size)
         self._game_board.create_board()
         self._game_board.establish_outer_fences()
 
-        # Creation of our players
-        self._player_1 = Player(1, (4, 0))
-        self._player_2 = Player(2, (4, 8))
+        # Creation of our players, in the middle of the top and bottom rows
+        self._player_1 = Player(1, (size // 2, 0))
+        self._player_2 = Player(2, (size // 2, size - 1))
 
         self._list_of_players = [None, self._player_1, self._player_2]
 
         self.initialize_start_positions()
 
+        # Distance of every square to each player's winning area. Kept up to
+        # date by make_fence.
+        self._path_engine = PathEngine(self._geometry)
+
+        # Zobrist key of the pawns, fences and fences left, kept up to date by
+        # every move. Whose move it is is mixed in by get_zobrist_key.
+        self._zobrist_key = self._geometry.zobrist_key(
+            (self._geometry.square_of(self._player_1.get_home_position()),
+             self._geometry.square_of(self._player_2.get_home_position())),
+            0, 0, (self._player_1.get_no_of_fences(), self._player_2.get_no_of_fences()), 1)
+
+        # The player who has won, or 0 while nobody has. Kept up to date by
+        # apply_move, the only way a pawn can reach its winning area.
+        self._winner = 0
+
         # Tracker of turns. Will default to player 1.
         self._move_options = [1, 2]
         self._whose_move = self._move_options[0]
 
+        # Every move played, as (player, move code, previous pawn square), and
+        # the moves taken back by unmake that redo can replay.
+        self._history = []
+        self._redo_stack = []
+
+        # Counts and timings of the hot methods, while enable_metrics is on.
+        self._metrics = None
+
     def initialize_start_positions(self):
         """
         Adjusts the nodes of the players start position to reflect their current position.
@@ -604,8 +721,8 @@ class QuoridorGame:
         p2_node = self._game_board.find_board_node(p2_home)
 
         # Updates the nodes corresponding player data.
-        p1_node.set_player_data(p1.get_player_name())
-        p2_node.set_player_data(p2.get_player_name())
+        self._game_board.set_player_node(p1.get_player_name(), p1_node)
+        self._game_board.set_player_node(p2.get_player_name(), p2_node)
 
     def get_game_board(self):
         """
@@ -625,6 +742,20 @@ class QuoridorGame:
         """
         return self._player_2
 
+    def get_path_engine(self):
+        """
+        Returns the PathEngine holding both players' distances to their winning area.
+        """
+        return self._path_engine
+
+    def get_path_distance(self, player):
+        """
+        Returns the number of steps player's pawn needs to reach its winning area,
+        taking fences (but not pawns) into account, or -1 if it is fenced off.
+        """
+        position = self._list_of_players[player].get_current_position()
+        return self._path_engine.get_distance(player, self._geometry.square_of(position))
+
     def get_whose_move(self):
         """
         Returns whose move it is. Will be used to test whether tokens are allowed
@@ -655,20 +786,30 @@ class QuoridorGame:
         Takes a player number integer and returns True if the player has won or False
         if they have not yet won.
         """
-        game_board = self._game_board
+        return self._winner == player
 
-        if player == 1:
-            list_of_nodes = game_board.get_p1_winning_area()
-        else:
-            list_of_nodes = game_board.get_p2_winning_area()
+    def get_winner(self):
+        """
+        Returns the player who has won the game, or 0 if nobody has yet.
+        """
+        return self._winner
 
-        for node in list_of_nodes:
-            temp_node = game_board.find_board_node(node)
+    @property
+    def winner(self):
+        """The player who has won the game, or 0 if nobody has yet"""
+        return self._winner
 
-            if temp_node.get_player_data() == player:
-                return True
+    def update_winner(self):
+        """
+        Sets the winner from the rows the pawns stand on: player 1 wins on the
+        last row and player 2 on the first.
+        """
+        if self._player_1.get_current_position()[1] == self._game_board.get_size() - 1:
+            self._winner = 1
+        elif self._player_2.get_current_position()[1] == 0:
+            self._winner = 2
         else:
-            return False
+            self._winner = 0
 
     def is_player_turn(self, player):
         """
@@ -719,8 +860,8 @@ class QuoridorGame:
 
         if lcd_of_travel in travel_basis:
             return travel_basis[lcd_of_travel]
-        elif lcd_of_travel[0] == 0 and lcd_of_travel[1] == 2 or lcd_of_travel[1] == -2:
-            lcd_of_travel = (lcd_of_travel[0], (lcd_of_travel[1] / 2))
+        elif lcd_of_travel[0] == 0 and lcd_of_travel[1] in (2, -2):
+            lcd_of_travel = (lcd_of_travel[0], (lcd_of_travel[1] // 2))
             return travel_basis[lcd_of_travel]
         else:
             return False
@@ -745,7 +886,11 @@ class QuoridorGame:
         else:
             prop_move_direction = self.get_lcd_direction(node_name, coord_tuple)
 
-            if prop_move_direction and prop_move_direction in ("up", "down", "left", "right"):
+            # A two square move shares its direction with a one square move,
+            # but it is a jump.
+            is_jump = abs(coord_tuple[1] - node_name[1]) == 2
+
+            if prop_move_direction in ("up", "down", "left", "right") and not is_jump:
                 return move_type[0]
 
             elif prop_move_direction and prop_move_direction in ("up-left", "up-right", "down-left", "down-right"):
@@ -823,8 +968,7 @@ class QuoridorGame:
         opposing_player = self.get_opposing_player(player)
         opposing_player_node = self._game_board.find_player_node(opposing_player.get_player_name())
 
-        # Sets all nearby nodes of the current node and determines our direction.
-        current_node.set_nearby_nodes()
+        # Determines our direction.
         prop_move_direction = self.get_lcd_direction(current_node.get_node_name(), coord_tuple)
 
         # Step 1: Determine if the player is traversing up or down.
@@ -859,9 +1003,7 @@ class QuoridorGame:
         opposing_player = self.get_opposing_player(player)
         opp_player_node = self._game_board.find_player_node(opposing_player.get_player_name())
 
-        # Sets all nearby nodes of the current node and determines our direction.
-        current_node.set_nearby_nodes()
-
+        # Determines our direction.
         try:
             self.get_lcd_direction(current_node.get_node_name(), coord_tuple)
         except YouAlreadyLiveHereError:
@@ -877,6 +1019,10 @@ class QuoridorGame:
             else:
                 temp_direction = self.up_or_down(prop_move_direction)
 
+                # The pawns only face each other if no fence is between them.
+                if temp_direction is False or current_node.get_list_of_walls()[temp_direction]:
+                    return False
+
                 # Step 2: Determine if the opposing player is above or below the player token
                 temp_node = self._game_board.find_board_node(current_node.get_nearby_nodes()[temp_direction])
                 temp_node_player_data = temp_node.get_player_data()
@@ -889,26 +1035,82 @@ class QuoridorGame:
                     # Confirm this is the node they're proposing to move to and that it is
                     # empty of player data.
                     new_temp_node = self._game_board.find_board_node(opp_player_node.get_nearby_nodes()[temp_direction])
-                    if new_temp_node is proposed_node and new_temp_node.get_nearby_walls()[opp_dir] is False and \
-                            new_temp_node.get_player_data is None:
+                    if new_temp_node is proposed_node and new_temp_node.get_list_of_walls()[opp_dir] is False and \
+                            new_temp_node.get_player_data() is None:
                         return True
                     else:
                         return False
                 else:
                     return False
 
+    def is_valid_move(self, player, coord_tuple):
+        """
+        Returns True if moving player's pawn to coord_tuple follows the rules
+        for its type of move. Does not check whose turn it is.
+        """
+        # Determine what type of move we're doing.
+        move_type = self.move_type(player, coord_tuple)
+
+        if move_type == "SIMPLE":
+            return self.is_valid_simple_move(player, coord_tuple)
+        elif move_type == "DIAGONAL":
+            return self.is_valid_diag_move(player, coord_tuple)
+        else:
+            return self.is_valid_comp_move(player, coord_tuple)
+
+    def legal_pawn_moves(self, player):
+        """
+        Returns a list of every coordinate player's pawn can legally move to.
+        Only the squares a pawn could reach from its square are tried, and
+        each is checked by the same rules move_pawn uses.
+        """
+        if not self.is_player_turn(player) or self._winner:
+            return []
+
+        position = self._list_of_players[player].get_current_position()
+        candidates = self._geometry.get_pawn_reach(self._geometry.square_of(position))
+
+        return [coord for coord in candidates if self.is_valid_move(player, coord)]
+
+    def legal_fence_placements(self, player):
+        """
+        Returns a list of every (direction, coordinate) fence player can
+        legally place, checked by the same rules place_fence uses, including
+        the fair play rule.
+        """
+        if not self.is_player_turn(player) or self._winner:
+            return []
+
+        return [(direction, coord) for direction in ("h", "v")
+                for coord in self._geometry.get_fence_anchors(direction)
+                if self.is_valid_fence(player, direction, coord) and
+                not self.breaks_fair_play(direction, coord)]
+
     def make_move(self, player, coord_tuple):
         """
         Does all the work when a move is checked as valid.
         """
+        self.record_move(player, self._geometry.pawn_move(coord_tuple))
+        return self.apply_move(player, coord_tuple)
+
+    def apply_move(self, player, coord_tuple):
+        """
+        Moves player's pawn to coord_tuple and passes the turn, without
+        recording it.
+        """
         proposed_node = self._game_board.find_board_node(coord_tuple)
-        current_node = self._game_board.find_player_node(player)
         active_player = self._list_of_players[player]
 
-        proposed_node.set_player_data(player)
-        current_node.set_player_data(None)
+        # Clears the old node and records the new one in the player index.
+        self._game_board.set_player_node(player, proposed_node)
+
+        # Swaps the pawn's old square out of the Zobrist key and the new one in.
+        self._zobrist_key ^= self._geometry.zobrist_pawn(
+            player, self._geometry.square_of(active_player.get_current_position()))
+        self._zobrist_key ^= self._geometry.zobrist_pawn(player, self._geometry.square_of(coord_tuple))
 
         active_player.set_current_position(coord_tuple)
+        self.update_winner()
         self.set_whose_move()
         return True
 
@@ -920,34 +1122,17 @@ class QuoridorGame:
         Updates the node of the new position to reflect the player token.
         """
         # If the game has been won, return False; otherwise, continue.
-        if self.is_winner(1) is False and self.is_winner(2) is False:
+        if not self._winner:
 
             # It needs to be the correct players turn, and the move needs to be
             # on the board.
             if self.is_player_turn(player) and self.is_on_board(coord_tuple):
 
-                # Determine what type of move we're doing.
-                move_type = self.move_type(player, coord_tuple)
-
-                if move_type == "SIMPLE":
-                    if self.is_valid_simple_move(player, coord_tuple):
-                        self.make_move(player, coord_tuple)
-                        return True
-                    else:
-                        return False
-
-                elif move_type == "DIAGONAL":
-                    if self.is_valid_diag_move(player, coord_tuple):
-                        self.make_move(player, coord_tuple)
-                        return True
-                    else:
-                        return False
+                if self.is_valid_move(player, coord_tuple):
+                    self.make_move(player, coord_tuple)
+                    return True
                 else:
-                    if self.is_valid_comp_move(player, coord_tuple):
-                        self.make_move(player, coord_tuple)
-                        return True
-                    else:
-                        return False
+                    return False
             else:
                 return False
         else:
@@ -961,142 +1146,380 @@ class QuoridorGame:
         players remaining available fences.
         """
         # If the game has been won, return False; otherwise, continue.
-        if self.is_winner(1) is False and self.is_winner(2) is False:
+        if not self._winner:
 
-            # It needs to be the correct players turn, and the move needs to be
-            # on the board.
-            if self.is_player_turn(player) and self.is_on_board(coord_tuple):
-                active_player = self._list_of_players[player]
-                active_node = self._game_board.find_board_node(coord_tuple)
-
-                # If it's a vertical wall and there isn't one already on left:
-                # Create the fence. Find the node - set it's left wall. Find the node
-                # to the left and set it's right wall (which is the same wall).
-                # Update player token at end of turn.
-                if fence_direction == "v" and active_node.get_left_wall() is False:
-                    active_player.add_new_fence(fence_direction, coord_tuple)
-                    active_node.set_left_wall()
-                    active_node.set_nearby_nodes()
-                    one_left = active_node.get_nearby_nodes()["left"]  # Pulls one node left
-                    new_node = self._game_board.find_board_node(one_left)
-                    new_node.set_right_wall()
-                    self.set_whose_move()
-                    return True
+            # It needs to be the correct players turn, and the fence needs to
+            # fit on the board.
+            if self.is_player_turn(player) and self.is_valid_fence(player, fence_direction, coord_tuple):
 
-                # If it's a horizontal wall and there isn't one already on top:
-                # Create the fence. Find the node - set it's top wall. Find the node
-                # above and set it's bottom wall (which is the same wall).
-                # Update player token at end of turn.
-                elif fence_direction == "h" and active_node.get_up_wall() is False:
-                    active_player.add_new_fence(fence_direction, coord_tuple)
-                    active_node.set_up_wall()
-                    active_node.set_nearby_nodes()
-                    one_up = active_node.get_nearby_nodes()["up"]  # Pulls one node above
-                    new_node = self._game_board.find_board_node(one_up)
-                    new_node.set_down_wall()
-                    self.set_whose_move()
-                    return True
-                else:
-                    return False
+                # The fence may not lock either pawn away from its winning area.
+                if self.breaks_fair_play(fence_direction, coord_tuple):
+                    return "breaks the fair play rule"
+
+                self.make_fence(player, fence_direction, coord_tuple)
+                return True
             else:
                 return False
         else:
             return False
 
-    def print_board(self):
+    def is_valid_fence(self, player, fence_direction, coord_tuple):
         """
-        Grabs the data from our list of players regarding their current positions and their fence
-        placements as segments. Prints via pyplot the list of line segments as walls and the current
-        positions of the players as (0.5, 0.5) offset from a players current index. Grid will be on and
-        I will ask for the x, y study to include from (0,0) to (8,8) and each players fences and token
-        will be a separate color.
+        Returns True if player can place a fence in fence_direction at coord_tuple:
+        the player must have a fence left, it must be on the board and its wall
+        must not already be fenced. Fences are one cell long, so two fences can
+        only meet end to end and the taken wall is the only overlap to check.
+        Does not check whose turn it is or the fair play rule.
         """
+        if not self._list_of_players[player].is_fence_available() or not self.is_on_board(coord_tuple):
+            return False
 
-        import matplotlib.pyplot as pyplt
+        active_node = self._game_board.find_board_node(coord_tuple)
 
-        player_1_fences = self._player_1.get_fences()
-        player_2_fences = self._player_2.get_fences()
+        # A vertical fence is the node's left wall, a horizontal fence is its top wall.
+        if fence_direction == "v":
+            return active_node.get_left_wall() is False
+        elif fence_direction == "h":
+            return active_node.get_up_wall() is False
+        else:
+            return False
 
-        pyplt.xlim([0, 9])
-        pyplt.ylim([9, 0])
+    def breaks_fair_play(self, fence_direction, coord_tuple):
+        """
+        Returns True if a fence in fence_direction at coord_tuple would leave
+        either pawn with no way to its winning area. The board is only searched
+        again when the fence cuts every shortest path of a player.
+        """
+        pawn_squares = [None]
+        for player in (self._player_1, self._player_2):
+            pawn_squares.append(self._geometry.square_of(player.get_current_position()))
 
-        pyplt.grid("on")
+        return self._path_engine.would_seal(fence_direction, self._geometry.square_of(coord_tuple),
+                                            pawn_squares)
 
-        p1_location = self.get_player_1().get_current_position()
-        p2_location = self.get_player_2().get_current_position()
+    def make_fence(self, player, fence_direction, coord_tuple):
+        """
+        Does all the work when a fence is checked as valid.
+        """
+        self.record_move(player, self._geometry.fence_move(fence_direction, coord_tuple))
+        return self.apply_fence(player, fence_direction, coord_tuple)
 
-        pyplt.plot((p1_location[0] + 0.5), (p1_location[1] + 0.5), 'ro', label="P1")
-        pyplt.plot((p2_location[0] + 0.5), (p2_location[1] + 0.5), 'bo', label="P2")
+    def apply_fence(self, player, fence_direction, coord_tuple):
+        """
+        Places player's fence at coord_tuple and passes the turn, without
+        recording it.
+        """
+        active_player = self._list_of_players[player]
+        fences_before = active_player.get_no_of_fences()
+        active_player.add_new_fence(fence_direction, coord_tuple)
+        self.update_fence_key(player, fence_direction, coord_tuple, fences_before)
+        self.build_fence(fence_direction, coord_tuple)
 
-        for segment in player_1_fences:
-            x1 = segment[0]
-            y1 = segment[1]
-            pyplt.plot(x1, y1, '-ro')
+        # Update the distances to the winning areas and player token at end of turn.
+        self._path_engine.add_fence(fence_direction, self._geometry.square_of(coord_tuple))
+        self.set_whose_move()
+        return True
 
-        for segment in player_2_fences:
-            x1 = segment[0]
-            y1 = segment[1]
-            pyplt.plot(x1, y1, '-bo')
+    def build_fence(self, fence_direction, coord_tuple):
+        """
+        Sets the walls on both sides of a fence at coord_tuple.
+        """
+        active_node = self._game_board.find_board_node(coord_tuple)
 
-        pyplt.legend()
-        pyplt.show()
+        # If it's a vertical wall: Find the node - set it's left wall. Find the node
+        # to the left and set it's right wall (which is the same wall).
+        if fence_direction == "v":
+            active_node.set_left_wall()
+            one_left = active_node.get_nearby_nodes()["left"]  # Pulls one node left
+            self._game_board.find_board_node(one_left).set_right_wall()
 
+        # If it's a horizontal wall: Find the node - set it's top wall. Find the node
+        # above and set it's bottom wall (which is the same wall).
+        else:
+            active_node.set_up_wall()
+            one_up = active_node.get_nearby_nodes()["up"]  # Pulls one node above
+            self._game_board.find_board_node(one_up).set_down_wall()
 
-def main():
-    """Tests for Game, will not run if imported"""
-    q = QuoridorGame()
+    def record_move(self, player, move):
+        """
+        Adds a move code to the history, with the square player's pawn stood on
+        before it. A new move can't be redone past, so the redo stack is cleared.
+        """
+        position = self._list_of_players[player].get_current_position()
+        self._history.append((player, move, self._geometry.square_of(position)))
+        self._redo_stack.clear()
 
-    print(q.move_pawn(1, (4, 1)))
+    def get_history(self):
+        """
+        Returns the moves played so far as (player, move code, previous pawn square).
+        """
+        return self._history
 
-    print(q.move_pawn(2, (5, 8)))
+    def unmake(self):
+        """
+        Takes back the most recent move. Returns True if a move was taken back,
+        False if there was none.
+        """
+        if not self._history:
+            return False
 
-    print(q.place_fence(1, "v", (7, 6)))
+        player, move, previous_square = self._history.pop()
+        kind, coord_tuple = self._geometry.describe_move(move)
 
-    print(q.move_pawn(2, (5, 8)))
+        if kind == "pawn":
+            self.apply_move(player, self._geometry.coord_of(previous_square))
+        else:
+            self.remove_fence(player, kind, coord_tuple)
 
-    print(q.place_fence(2, "h", (2, 5)))
+        # Whoever made the move is the one to move again.
+        self._whose_move = player
+        self._redo_stack.append((player, move, previous_square))
+        return True
 
-    print(q.place_fence(1, "h", (3, 3)))
+    def redo(self):
+        """
+        Plays again the most recent move taken back by unmake. Returns True if
+        a move was replayed, False if there was none.
+        """
+        if not self._redo_stack:
+            return False
 
-    print(q.place_fence(2, "h", (0, 3)))
+        entry = self._redo_stack.pop()
+        player, move, previous_square = entry
+        kind, coord_tuple = self._geometry.describe_move(move)
 
-    print(q.move_pawn(1, (4, 2)))
+        if kind == "pawn":
+            self.apply_move(player, coord_tuple)
+        else:
+            self.apply_fence(player, kind, coord_tuple)
 
-    print(q.move_pawn(2, (4, 7)))
+        self._history.append(entry)
+        return True
 
-    print(q.move_pawn(2, (4, 8)))
+    def remove_fence(self, player, fence_direction, coord_tuple):
+        """
+        Takes down the fence player placed at coord_tuple and gives it back to them.
+        """
+        active_node = self._game_board.find_board_node(coord_tuple)
+        x, y = coord_tuple
 
-    print(q.move_pawn(1, (4, 3)))
+        # Both sides of the wall come down.
+        if fence_direction == "v":
+            active_node.clear_left_wall()
+            self._game_board.find_board_node((x - 1, y)).clear_right_wall()
+        else:
+            active_node.clear_up_wall()
+            self._game_board.find_board_node((x, y - 1)).clear_down_wall()
 
-    print(q.move_pawn(2, (5, 7)))
+        fences_before = self._list_of_players[player].get_no_of_fences()
+        self._list_of_players[player].take_back_fence()
+        self.update_fence_key(player, fence_direction, coord_tuple, fences_before)
+        self._path_engine.remove_fence(fence_direction, self._geometry.square_of(coord_tuple))
 
-    print(q.move_pawn(2, (4, 7)))
+    def update_fence_key(self, player, fence_direction, coord_tuple, fences_before):
+        """
+        Toggles a fence in the Zobrist key and swaps player's fences-left count
+        from fences_before to what they have now.
+        """
+        geometry = self._geometry
+        self._zobrist_key ^= geometry.zobrist_fence(geometry.fence_move(fence_direction, coord_tuple))
+        self._zobrist_key ^= geometry.zobrist_fences_left(player, fences_before)
+        self._zobrist_key ^= geometry.zobrist_fences_left(
+            player, self._list_of_players[player].get_no_of_fences())
 
-    print(q.move_pawn(1, (4, 4)))
+    def enable_metrics(self, metrics=None):
+        """
+        Starts counting and timing node lookups, move validation, fence
+        attempts and path searches of this game, into metrics or a new
+        Metrics. Returns the Metrics in use.
+        """
+        self.disable_metrics()
+        self._metrics = metrics if metrics is not None else Metrics()
+        instrument(self, self._metrics)
+        return self._metrics
 
-    print(q.move_pawn(2, (4, 6)))
+    def disable_metrics(self):
+        """
+        Stops instrumenting this game; its methods run uninstrumented again.
+        """
+        if self._metrics is not None:
+            uninstrument(self)
+            self._metrics = None
 
-    print(q.place_fence(1, "h", (4, 4)))
+    def get_metrics(self):
+        """
+        Returns the Metrics this game records into, or None if metrics are off.
+        """
+        return self._metrics
 
-    print(q.move_pawn(2, (4, 5)))
+    def get_zobrist_key(self):
+        """
+        Returns the 64-bit Zobrist key of the current position. Equal positions
+        have equal keys however they were reached, and the key matches the one
+        of the same position as a GameState.
+        """
+        return self._zobrist_key ^ self._geometry.zobrist_turn(self._whose_move)
 
-    print(q.place_fence(1, "v", (0, 0)))
+    def to_state(self):
+        """
+        Returns a compact GameState copy of the current position, for callers
+        that need to copy, hash or search positions cheaply.
+        """
+        state = GameState(self._geometry.get_size(), no_of_fences=0)
+        geometry = state.get_geometry()
+        h_walls = 0
+        v_walls = 0
 
-    print(q.place_fence(1, "v", (4, 0)))
+        # Outer fences are implied by the board edge; only inner ones are recorded.
+        for node in self.iter_board_nodes():
+            x, y = node.get_node_name()
+            if y > 0 and node.get_up_wall():
+                h_walls |= 1 << geometry.square_of((x, y))
+            if x > 0 and node.get_left_wall():
+                v_walls |= 1 << geometry.square_of((x, y))
 
-    print(q.move_pawn(2, (5, 4)))
+        pawns = (geometry.square_of(self._player_1.get_current_position()),
+                 geometry.square_of(self._player_2.get_current_position()))
+        fences = (self._player_1.get_no_of_fences(), self._player_2.get_no_of_fences())
+        state.set_position(pawns, h_walls, v_walls, fences, self._whose_move)
+        return state
 
-    print(q.move_pawn(1, (6, 4)))
+    def get_placed_fences(self):
+        """
+        Returns every fence on the board as (player, direction, coordinate),
+        each player's in the order they were placed.
+        """
+        return [(player.get_player_name(), fence.get_direction(), fence.get_creation_point())
+                for player in (self._player_1, self._player_2)
+                for fence in map(Fence.from_code, player.get_fence_codes())]
+
+    def load_position(self, pawns, fences, fences_left, whose_move):
+        """
+        Sets up a new game at a position: pawns is the (p1, p2) coordinates,
+        fences a list of (player, direction, coordinate) fences already
+        placed, fences_left the (p1, p2) fences in hand and whose_move the
+        player to move. The position starts with no history.
+        """
+        for player, coord_tuple in zip((1, 2), pawns):
+            self._game_board.set_player_node(player, self._game_board.find_board_node(tuple(coord_tuple)))
+            self._list_of_players[player].set_current_position(tuple(coord_tuple))
+        self.update_winner()
+        walls = {"h": 0, "v": 0}
+        for player, fence_direction, coord_tuple in fences:
+            self._list_of_players[player].restore_fence(fence_direction, tuple(coord_tuple))
+            self.build_fence(fence_direction, tuple(coord_tuple))
+            walls[fence_direction] |= 1 << self._geometry.square_of(tuple(coord_tuple))
+        for player, count in zip((1, 2), fences_left):
+            self._list_of_players[player].set_no_of_fences(count)
+
+        # One search of the finished board, rather than a repair per fence.
+        self._path_engine.reset(walls["h"], walls["v"])
+        self._zobrist_key = self._geometry.zobrist_key(
+            [self._geometry.square_of(tuple(coord_tuple)) for coord_tuple in pawns],
+            walls["h"], walls["v"], fences_left, 1)
+        self._whose_move = whose_move
+
+    def to_bytes(self):
+        """
+        Returns the pawns, fences, fences left and turn as a fixed-size record:
+        53 bytes on a 9 x 9 board. History is not kept.
+        """
+        geometry = self._geometry
+        owner_h = owner_v = 0
+        for player, fence_direction, coord_tuple in self.get_placed_fences():
+            if player == 2 and fence_direction == "h":
+                owner_h |= 1 << geometry.square_of(coord_tuple)
+            elif player == 2:
+                owner_v |= 1 << geometry.square_of(coord_tuple)
+
+        pawns = [geometry.square_of(player.get_current_position()) for player in (self._player_1, self._player_2)]
+        fences = [player.get_no_of_fences() for player in (self._player_1, self._player_2)]
+        masks = (self._path_engine.get_h_walls(), self._path_engine.get_v_walls(), owner_h, owner_v)
+        return pack_position(geometry.get_size(), pawns, fences, self._whose_move, masks)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Returns a new game at the position of a to_bytes record. Raises
+        ValueError if data isn't one.
+        """
+        size, pawns, fences_left, whose_move, masks = unpack_position(data)
+        geometry = BoardGeometry.of_size(size)
+        fences = [(2 if owners >> square & 1 else 1, direction, geometry.coord_of(square))
+                  for direction, walls, owners in (("h", masks[0], masks[2]), ("v", masks[1], masks[3]))
+                  for square in range(size * size) if walls >> square & 1]
+
+        game = cls(size)
+        game.load_position([geometry.coord_of(square) for square in pawns], fences, fences_left, whose_move)
+        return game
+
+    def to_json(self):
+        """
+        Returns the same position as to_bytes, as a JSON string.
+        """
+        return json.dumps({"size": self._game_board.get_size(),
+                           "pawns": [self._player_1.get_current_position(),
+                                     self._player_2.get_current_position()],
+                           "fences": self.get_placed_fences(),
+                           "fences_left": [self._player_1.get_no_of_fences(),
+                                           self._player_2.get_no_of_fences()],
+                           "whose_move": self._whose_move})
 
-    print(q.place_fence(1, "h", (5, 4)))
+    @classmethod
+    def from_json(cls, text):
+        """
+        Returns a new game at the position of a to_json string.
+        """
+        position = json.loads(text)
+        game = cls(position["size"])
+        game.load_position(position["pawns"], position["fences"], position["fences_left"],
+                           position["whose_move"])
+        return game
 
-    print(q.move_pawn(2, (6, 4)))
+    def iter_board_nodes(self):
+        """
+        Yields every node of the game board in linked list order.
+        """
+        pos = self._game_board.get_head()
+        while pos is not None:
+            yield pos
+            pos = pos.get_next()
 
-    print(q.move_pawn(1, (4, 5)))
+    def __str__(self):
+        """
+        Returns the board drawn as ASCII text, with the pawns, fences and
+        coordinates.
+        """
+        return render(self)
 
-    print(q.move_pawn(2, (6, 3)))
+    def print_board(self, backend="matplotlib", stream=None, unicode=False, path=None):
+        """
+        Grabs the data from our list of players regarding their current positions and their fence
+        placements as segments. With the "matplotlib" backend, plots via pyplot the line segments
+        as walls and the players' positions in the middle of their squares, each player in their
+        own color; matplotlib is only imported then. Given a path, such as "board.png", the plot is
+        saved there with the non-interactive Agg backend instead of shown. The "svg" backend writes
+        an SVG image to path, or to stream, with no matplotlib at all. The "text" backend writes the
+        board as ASCII (or Unicode) text to stream. stream is standard output by default.
+        """
+        if backend == "text":
+            write_board(self, stream, unicode)
+        elif backend == "svg":
+            save_board(self, path if path is not None else stream or sys.stdout, "svg")
+        elif backend == "matplotlib" and path is not None:
+            save_board(self, path, os.path.splitext(path)[1][1:].lower() or "png")
+        elif backend == "matplotlib":
+            plot_board(self)
+        else:
+            raise ValueError("unknown board backend: " + repr(backend))
+
+
+def main():
+    """Tests for Game, will not run if imported"""
+    q = QuoridorGame()
 
-    print(q.move_pawn(1, (4, 6)))
+    for method, args in MAIN_SCRIPT:
+        print(getattr(q, method)(*args))
 
     # q.print_board()
 
@@ -0,0 +1,305 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Batch evaluation of many Quoridor positions at once with NumPy.
+# K positions are stacked into arrays: pawn coordinates (K, 2, 2), fence
+# grids (K, size, size), fences left (K, 2) and whose move (K,). Distances
+# to the goal rows are found by a wavefront search over all K boards at
+# once, one masked shift per direction per step, and the legal moves of
+# every position come back as a (K, 3 * size * size) mask lined up with the
+# move codes of BoardGeometry. Only the few fence slots that could seal a
+# pawn in get a search of their own. NumPy is only needed by this module.
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# The open_steps arrays, in the order of Quoridor_state's directions, and
+# the (dx, dy) step each one takes.
+STEP_OFFSETS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+LEFT_STEP = 2
+RIGHT_STEP = 3
+
+
+def require_numpy():
+    """Raises ImportError if NumPy is missing"""
+    if np is None:
+        raise ImportError("Quoridor_batch needs NumPy: pip install numpy")
+
+
+def make_batch(pawns, h_walls, v_walls, fences, whose_move):
+    """
+    Returns a batch of positions from stacked arrays: pawns (K, 2, 2) of
+    each player's (x, y), h_walls and v_walls (K, size, size) of fence bits
+    indexed [y, x] as in BoardGeometry, fences (K, 2) left per player and
+    whose_move (K,) of 1 or 2. The batch is a dict of those arrays plus
+    each position's winner (0 for none).
+    """
+    require_numpy()
+    pawns = np.asarray(pawns, dtype=np.intp)
+    h_walls = np.asarray(h_walls, dtype=bool)
+    v_walls = np.asarray(v_walls, dtype=bool)
+    count, size = h_walls.shape[0], h_walls.shape[1]
+    if pawns.shape != (count, 2, 2) or v_walls.shape != h_walls.shape or h_walls.shape[2] != size:
+        raise ValueError("pawns must be (K, 2, 2) and both fence grids (K, size, size)")
+
+    winner = np.where(pawns[:, 0, 1] == size - 1, 1, np.where(pawns[:, 1, 1] == 0, 2, 0))
+    return {"pawns": pawns, "h_walls": h_walls, "v_walls": v_walls,
+            "fences": np.asarray(fences, dtype=np.intp).reshape(count, 2),
+            "whose_move": np.asarray(whose_move, dtype=np.intp).reshape(count), "winner": winner}
+
+
+def wall_grids(masks, size):
+    """
+    Returns fence bit masks (Python ints, as GameState keeps them) as a
+    (K, size, size) bool array.
+    """
+    width = (size * size + 7) // 8
+    raw = np.frombuffer(b"".join(mask.to_bytes(width, "little") for mask in masks), dtype=np.uint8)
+    bits = np.unpackbits(raw.reshape(len(masks), width), axis=1, bitorder="little")[:, :size * size]
+    return bits.reshape(len(masks), size, size).astype(bool)
+
+
+def stack_states(states):
+    """
+    Returns the batch of a list of GameStates, all of one board size.
+    """
+    require_numpy()
+    size = states[0].get_size()
+    if any(state.get_size() != size for state in states):
+        raise ValueError("every state of a batch must have the same board size")
+
+    return make_batch([[state.get_pawn(1), state.get_pawn(2)] for state in states],
+                      wall_grids([state.get_h_walls() for state in states], size),
+                      wall_grids([state.get_v_walls() for state in states], size),
+                      [[state.get_no_of_fences(1), state.get_no_of_fences(2)] for state in states],
+                      [state.get_whose_move() for state in states])
+
+
+def open_steps(h_walls, v_walls):
+    """
+    Returns, for up, down, left and right, a (K, size, size) array of the
+    squares that can step that way without crossing a fence or the edge.
+    """
+    up = ~h_walls
+    up[:, 0, :] = False
+    down = np.zeros_like(h_walls)
+    down[:, :-1, :] = ~h_walls[:, 1:, :]
+    left = ~v_walls
+    left[:, :, 0] = False
+    right = np.zeros_like(v_walls)
+    right[:, :, :-1] = ~v_walls[:, :, 1:]
+    return up, down, left, right
+
+
+def distance_fields(h_walls, v_walls, player):
+    """
+    Returns a (K, size, size) array of every square's number of steps to
+    player's goal row, ignoring pawns, or -1 where it is fenced off. The
+    search spreads out from the goal row over every board at once.
+    """
+    up, down, left, right = open_steps(h_walls, v_walls)
+    count, size = h_walls.shape[0], h_walls.shape[1]
+    distances = np.full((count, size, size), -1, dtype=np.int16)
+    frontier = np.zeros((count, size, size), dtype=bool)
+    frontier[:, size - 1 if player == 1 else 0, :] = True
+
+    step = 0
+    while frontier.any():
+        distances[frontier] = step
+
+        # A square is one step further out if it can step onto the frontier.
+        reached = np.zeros_like(frontier)
+        reached[:, 1:, :] |= frontier[:, :-1, :] & up[:, 1:, :]
+        reached[:, :-1, :] |= frontier[:, 1:, :] & down[:, :-1, :]
+        reached[:, :, 1:] |= frontier[:, :, :-1] & left[:, :, 1:]
+        reached[:, :, :-1] |= frontier[:, :, 1:] & right[:, :, :-1]
+        frontier = reached & (distances < 0)
+        step += 1
+    return distances
+
+
+def goal_fields(h_walls, v_walls):
+    """
+    Returns the (K, 2, size, size) distance fields of both players.
+    """
+    return np.stack((distance_fields(h_walls, v_walls, 1), distance_fields(h_walls, v_walls, 2)), axis=1)
+
+
+def pawn_distances(h_walls, v_walls, pawns, fields=None):
+    """
+    Returns a (K, 2) array of both pawns' steps to their goal rows, or -1
+    for a pawn that is fenced off. fields are the goal_fields of the boards,
+    if already known.
+    """
+    if fields is None:
+        fields = goal_fields(h_walls, v_walls)
+    rows = np.arange(len(pawns))
+    return np.stack([fields[rows, index, pawns[:, index, 1], pawns[:, index, 0]] for index in (0, 1)], axis=1)
+
+
+def path_distances(batch, fields=None):
+    """Returns the (K, 2) pawn distances of a batch"""
+    return pawn_distances(batch["h_walls"], batch["v_walls"], batch["pawns"], fields)
+
+
+def pawn_move_masks(batch):
+    """
+    Returns a (K, size, size) mask of the squares the player to move can move
+    their pawn to, by the same rules as GameState.pawn_moves.
+    """
+    pawns = batch["pawns"]
+    rows = np.arange(len(pawns))
+    own = pawns[rows, batch["whose_move"] - 1]
+    opponent = pawns[rows, 2 - batch["whose_move"]]
+    steps = open_steps(batch["h_walls"], batch["v_walls"])
+    masks = np.zeros(batch["h_walls"].shape, dtype=bool)
+
+    for direction, (dx, dy) in enumerate(STEP_OFFSETS):
+        can_step = steps[direction][rows, own[:, 1], own[:, 0]]
+        to_x, to_y = own[:, 0] + dx, own[:, 1] + dy
+        onto = can_step & (to_x == opponent[:, 0]) & (to_y == opponent[:, 1])
+        plain = can_step & ~onto
+        masks[rows[plain], to_y[plain], to_x[plain]] = True
+        if dy:
+            jump_around(masks, steps, direction, rows[onto], opponent[onto])
+
+    masks[batch["winner"] > 0] = False
+    return masks
+
+
+def jump_around(masks, steps, direction, rows, opponent):
+    """
+    Marks in masks the moves of pawns facing their opponent vertically in
+    direction: the jump over them, or the steps to either side of them if a
+    fence or the edge is behind them.
+    """
+    dy = STEP_OFFSETS[direction][1]
+    beyond = steps[direction][rows, opponent[:, 1], opponent[:, 0]]
+    masks[rows[beyond], opponent[beyond, 1] + dy, opponent[beyond, 0]] = True
+
+    blocked = ~beyond
+    for side in (LEFT_STEP, RIGHT_STEP):
+        open_side = blocked & steps[side][rows, opponent[:, 1], opponent[:, 0]]
+        masks[rows[open_side], opponent[open_side, 1], opponent[open_side, 0] + STEP_OFFSETS[side][0]] = True
+
+
+def fence_move_masks(batch, check_paths=True, chunk_size=8192, fields=None):
+    """
+    Returns a (K, 2, size, size) mask of the horizontal and vertical fence
+    slots the player to move can fence, by anchor square. With check_paths,
+    slots that would seal a pawn off from its goal row are left out, as
+    GameState.fence_moves does; fields are the batch's goal_fields, if
+    already known.
+    """
+    count, size = batch["h_walls"].shape[0], batch["h_walls"].shape[1]
+    rows = np.arange(count)
+    in_hand = (batch["fences"][rows, batch["whose_move"] - 1] > 0) & (batch["winner"] == 0)
+
+    # Outer edges are already fences: no h fence on the top row, no v fence
+    # on the left column.
+    masks = np.zeros((count, 2, size, size), dtype=bool)
+    masks[:, 0, 1:, :] = ~batch["h_walls"][:, 1:, :]
+    masks[:, 1, :, 1:] = ~batch["v_walls"][:, :, 1:]
+    masks &= in_hand[:, None, None, None]
+
+    if check_paths:
+        if fields is None:
+            fields = goal_fields(batch["h_walls"], batch["v_walls"])
+        candidates = masks & choke_points(batch, fields)
+        if candidates.any():
+            masks &= ~sealing_fences(batch, candidates, chunk_size)
+    return masks
+
+
+def choke_points(batch, fields):
+    """
+    Returns a (K, 2, size, size) mask of the fence slots that might seal a
+    pawn in, found by walking each pawn down its distance field. A fence is
+    one edge, so only a step of that walk can be cut, and not even one of
+    those if the square it starts from has another way out that is no
+    further from the goal: every square's walk down from there stays open.
+    Everything else is left out of the board searches.
+    """
+    steps = open_steps(batch["h_walls"], batch["v_walls"])
+    count, size = batch["h_walls"].shape[0], batch["h_walls"].shape[1]
+    rows = np.arange(count)
+    step_x, step_y = np.array(STEP_OFFSETS).T
+    found = np.zeros((count, 2, size, size), dtype=bool)
+
+    for index in (0, 1):
+        field = fields[:, index]
+        x, y = batch["pawns"][:, index, 0].copy(), batch["pawns"][:, index, 1].copy()
+        here = field[rows, y, x]
+        walking = (here > 0) & (batch["winner"] == 0)
+        while walking.any():
+            downhill = np.zeros((4, count), dtype=bool)
+            level = np.zeros(count, dtype=np.intp)
+            for direction, (dx, dy) in enumerate(STEP_OFFSETS):
+                can_step = steps[direction][rows, y, x]
+                there = field[rows, np.clip(y + dy, 0, size - 1), np.clip(x + dx, 0, size - 1)]
+                downhill[direction] = can_step & (there == here - 1)
+                level += can_step & (there == here)
+
+            # The walk takes the first step down; it is a choke point if it is
+            # the only step that doesn't lead further from the goal.
+            direction = np.argmax(downhill, axis=0)
+            choke = walking & (downhill.sum(axis=0) == 1) & (level == 0)
+            dx, dy = step_x[direction], step_y[direction]
+            # The fence across a step up or left is anchored on its start
+            # square, across a step down or right on the square it lands on.
+            ahead = (dx > 0) | (dy > 0)
+            kind = (dx != 0).astype(np.intp)
+            found[rows[choke], kind[choke], (y + dy * ahead)[choke], (x + dx * ahead)[choke]] = True
+
+            x = np.where(walking, x + dx, x)
+            y = np.where(walking, y + dy, y)
+            here = field[rows, y, x]
+            walking &= here > 0
+    return found
+
+
+def sealing_fences(batch, candidates, chunk_size):
+    """
+    Returns the subset of a (K, 2, size, size) candidate fence mask that
+    would leave a pawn with no way to its goal row. Every candidate gets its
+    own board with the fence added, and the boards are searched together.
+    """
+    found = np.nonzero(candidates)
+    sealed = np.zeros(len(found[0]), dtype=bool)
+
+    for start in range(0, len(sealed), chunk_size):
+        part = slice(start, start + chunk_size)
+        positions, kinds, ys, xs = (axis[part] for axis in found)
+        boards = np.arange(len(positions))
+        h_walls = batch["h_walls"][positions]
+        v_walls = batch["v_walls"][positions]
+        horizontal = kinds == 0
+        h_walls[boards[horizontal], ys[horizontal], xs[horizontal]] = True
+        v_walls[boards[~horizontal], ys[~horizontal], xs[~horizontal]] = True
+        sealed[part] = (pawn_distances(h_walls, v_walls, batch["pawns"][positions]) < 0).any(axis=1)
+
+    result = np.zeros(candidates.shape, dtype=bool)
+    result[tuple(axis[sealed] for axis in found)] = True
+    return result
+
+
+def legal_move_masks(batch, check_paths=True, fields=None):
+    """
+    Returns a (K, 3 * size * size) mask of the legal moves of each position,
+    where column c is move code c of BoardGeometry: pawn squares, then h and
+    then v fence anchors.
+    """
+    count = len(batch["pawns"])
+    return np.concatenate((pawn_move_masks(batch).reshape(count, -1),
+                           fence_move_masks(batch, check_paths, fields=fields).reshape(count, -1)), axis=1)
+
+
+def evaluate_batch(batch, check_paths=True):
+    """
+    Returns the "distances" (K, 2) and "legal_moves" (K, 3 * size * size) of
+    a batch. The distance fields are found once and used for both.
+    """
+    fields = goal_fields(batch["h_walls"], batch["v_walls"])
+    return {"distances": path_distances(batch, fields),
+            "legal_moves": legal_move_masks(batch, check_paths, fields)}
@@ -0,0 +1,84 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Unit Test for the NumPy batch evaluation of Quoridor positions
+
+import random
+import unittest
+from Quoridor_batch import evaluate_batch, fence_move_masks, make_batch, np, pawn_move_masks, stack_states
+from Quoridor_state import GameState
+
+
+def random_states(count, seed, size=9):
+    """
+    Returns count positions reached by random legal moves, fences included,
+    from the start of a game.
+    """
+    rng = random.Random(seed)
+    states = []
+    for _ in range(count):
+        state = GameState(size)
+        for _ in range(rng.randrange(40)):
+            moves = state.legal_moves()
+            if not moves:
+                break
+            state.make_move(rng.choice(moves))
+        states.append(state)
+    return states
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestBatch(unittest.TestCase):
+    """Contains the unit test for the batch evaluation"""
+
+    def test_matches_game_state(self):
+        """
+        Tests that the distances and legal move masks of a batch are the ones
+        GameState finds for each of its positions.
+        """
+        states = random_states(60, 4)
+        result = evaluate_batch(stack_states(states))
+
+        for index, state in enumerate(states):
+            self.assertEqual(list(result["distances"][index]), [state.shortest_path(1), state.shortest_path(2)])
+            self.assertEqual(list(np.flatnonzero(result["legal_moves"][index])), sorted(state.legal_moves()))
+
+    def test_jumps_and_sealed_fences(self):
+        """
+        Tests a jump, the steps around a fenced-in opponent and a fence that
+        would seal a pawn in, on a 5 x 5 board.
+        """
+        facing = GameState(5)
+        facing.set_position((7, 12), 0, 0, (3, 3), 1)
+        fenced = GameState(5)
+        fenced.set_position((7, 12), 1 << 17, 0, (3, 3), 1)
+        corner = GameState(5)
+        corner.set_position((0, 22), 1 << 5, 0, (3, 3), 1)
+
+        batch = stack_states([facing, fenced, corner])
+        pawns = pawn_move_masks(batch)
+        for index, state in enumerate((facing, fenced, corner)):
+            self.assertEqual(list(np.flatnonzero(pawns[index])), sorted(state.pawn_moves()))
+        self.assertTrue(pawns[0, 3, 2])
+        self.assertTrue(pawns[1, 2, 1] and pawns[1, 2, 3])
+
+        # With the top left square walled in below, a fence on its right
+        # would shut player 1 in.
+        fences = fence_move_masks(batch)
+        self.assertTrue(fence_move_masks(batch, check_paths=False)[2, 1, 0, 1])
+        self.assertFalse(fences[2, 1, 0, 1])
+        self.assertEqual(list(np.flatnonzero(fences[2]) + 25), sorted(corner.fence_moves()))
+
+    def test_array_input(self):
+        """
+        Tests building a batch straight from arrays, and its shape checks.
+        """
+        walls = np.zeros((2, 9, 9), dtype=bool)
+        batch = make_batch([[[4, 0], [4, 8]], [[4, 8], [4, 7]]], walls, walls, [[10, 10], [0, 4]], [1, 2])
+
+        result = evaluate_batch(batch)
+        self.assertEqual(list(batch["winner"]), [0, 1])
+        self.assertEqual(result["distances"].tolist(), [[8, 8], [0, 7]])
+        self.assertFalse(result["legal_moves"][1].any())
+        self.assertEqual(int(result["legal_moves"][0].sum()), 3 + 72 + 72)
+
+        self.assertRaises(ValueError, make_batch, [[4, 0], [4, 8]], walls, walls, [[10, 10]], [1])
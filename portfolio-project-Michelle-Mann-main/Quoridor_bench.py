@@ -0,0 +1,218 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Benchmarks for the core QuoridorGame API.
+# Times game construction, pawn moves (simple, diagonal and jump), fence
+# placement, win checks, board lookups across board sizes and the scripted
+# game of Quoridor.main, and, when NumPy is installed, evaluating a batch of
+# positions with Quoridor_batch against a loop over the same GameStates.
+# Every case starts from the same fixed positions, so runs are comparable. Results are written as JSON and can be compared with
+# a stored baseline to catch regressions.
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+from Quoridor import MAIN_SCRIPT, QuoridorGame
+from Quoridor_batch import evaluate_batch, np, stack_states
+from Quoridor_state import GameState
+
+# Board sizes the size-dependent cases are run on.
+SIZES = (5, 9, 17)
+
+# How many positions the batch cases evaluate per call.
+BATCH_SIZE = 32
+
+# How much slower than its baseline a case may be before it is a regression.
+TOLERANCE = 0.10
+
+# The stored baseline runs are compared with unless told otherwise. Rewrite
+# it with --out when a change is meant to move the numbers.
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Quoridor_bench_baseline.json")
+
+
+def facing_pawns(fences=()):
+    """
+    Returns a game with player 1 to move at (4, 3), right below player 2 at
+    (4, 4), with fences already placed.
+    """
+    game = QuoridorGame()
+    game.load_position(((4, 3), (4, 4)), list(fences), (10, 10), 1)
+    return game
+
+
+def play_script(game):
+    """
+    Plays the scripted game of Quoridor.main on game and returns what each
+    step returned.
+    """
+    return [getattr(game, method)(*args) for method, args in MAIN_SCRIPT]
+
+
+def sample_positions(count=BATCH_SIZE, seed=9):
+    """
+    Returns count GameStates reached by up to 40 random legal moves from the
+    start of a game, the same ones for the same seed.
+    """
+    rng = random.Random(seed)
+    states = []
+    for _ in range(count):
+        state = GameState()
+        for _ in range(rng.randrange(40)):
+            moves = state.legal_moves()
+            if not moves:
+                break
+            state.make_move(rng.choice(moves))
+        states.append(state)
+    return states
+
+
+def evaluate_loop(states):
+    """
+    Returns the legal moves and both distances of each of states, asked of
+    one GameState at a time as evaluate_batch would find them.
+    """
+    return [(state.legal_moves(), state.shortest_path(1), state.shortest_path(2)) for state in states]
+
+
+def benchmark_cases(sizes=SIZES):
+    """
+    Returns the benchmark cases as {name: (prepare, action)}. prepare takes
+    no arguments and returns what action is timed on, so that setup is
+    never timed.
+    """
+    cases = {
+        "move_pawn.simple": (QuoridorGame, lambda game: game.move_pawn(1, (4, 1))),
+        "move_pawn.jump": (facing_pawns, lambda game: game.move_pawn(1, (4, 5))),
+        "move_pawn.diagonal": (lambda: facing_pawns([(2, "h", (4, 5))]),
+                               lambda game: game.move_pawn(1, (3, 4))),
+        "place_fence": (QuoridorGame, lambda game: game.place_fence(1, "h", (4, 4))),
+        "is_winner": (QuoridorGame, lambda game: game.is_winner(1) or game.is_winner(2)),
+        "scripted_game": (QuoridorGame, play_script),
+    }
+    for size in sizes:
+        cases["new_game.%d" % size] = (lambda size=size: size, QuoridorGame)
+        far_corner = (size - 1, size - 1)
+        cases["find_board_node.%d" % size] = (
+            lambda size=size: QuoridorGame(size).get_game_board(),
+            lambda board, far_corner=far_corner: board.find_board_node(far_corner))
+    if np is not None:
+        # The same positions for both, so the batch and the loop compare.
+        states = sample_positions()
+        cases["batch.evaluate"] = (lambda: states, lambda states: evaluate_batch(stack_states(states)))
+        cases["batch.loop"] = (lambda: states, evaluate_loop)
+    return cases
+
+
+def time_case(prepare, action, number, repeat):
+    """
+    Returns the microseconds per call of each of repeat runs of number calls
+    of action, each on a fresh result of prepare. The garbage collector is
+    off while timing, as in timeit.
+    """
+    runs = []
+    for _ in range(repeat):
+        subjects = [prepare() for _ in range(number)]
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for subject in subjects:
+                action(subject)
+            runs.append((time.perf_counter() - start) * 1e6 / number)
+        finally:
+            if collecting:
+                gc.enable()
+    return runs
+
+
+def run_benchmarks(number=200, repeat=5, sizes=SIZES, names=None):
+    """
+    Runs the benchmark cases (only those in names, if given) and returns the
+    results as a JSON-ready dict: the machine they ran on, and for each case
+    its median and best microseconds per call.
+    """
+    results = {}
+    for name, (prepare, action) in sorted(benchmark_cases(sizes).items()):
+        if names is None or name in names:
+            runs = time_case(prepare, action, number, repeat)
+            results[name] = {"us_per_call": statistics.median(runs), "best_us_per_call": min(runs),
+                             "number": number, "repeat": repeat}
+    return {"machine": {"python": platform.python_version(), "implementation": platform.python_implementation(),
+                        "platform": platform.platform(), "processor": platform.machine()},
+            "results": results}
+
+
+def compare(current, baseline, tolerance=TOLERANCE):
+    """
+    Compares two run_benchmarks results case by case. Returns {name: {...}}
+    with both medians, their ratio and a status: "slower" past tolerance,
+    "faster" past tolerance, "same", or "new" for cases the baseline lacks.
+    """
+    report = {}
+    for name, result in sorted(current["results"].items()):
+        now = result["us_per_call"]
+        before = baseline["results"].get(name, {}).get("us_per_call")
+        if before is None:
+            report[name] = {"current": now, "baseline": None, "ratio": None, "status": "new"}
+            continue
+        ratio = now / before if before else float("inf")
+        status = "slower" if ratio > 1 + tolerance else "faster" if ratio < 1 - tolerance else "same"
+        report[name] = {"current": now, "baseline": before, "ratio": ratio, "status": status}
+    return report
+
+
+def regressions(report):
+    """Returns the names of the cases a compare report finds slower"""
+    return [name for name, entry in report.items() if entry["status"] == "slower"]
+
+
+def write_results(results, path):
+    """
+    Writes benchmark results, or a comparison report, to a JSON file.
+    """
+    with open(path, "w") as out:
+        json.dump(results, out, indent=2, sort_keys=True)
+
+
+def load_results(path):
+    """Reads benchmark results written by write_results"""
+    with open(path) as source:
+        return json.load(source)
+
+
+def main():
+    """
+    Runs the benchmarks from the command line, will not run if imported.
+    Exits with status 1 if any case regressed against the baseline.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the QuoridorGame API.")
+    parser.add_argument("--number", type=int, default=200, help="calls per run")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case")
+    parser.add_argument("--case", action="append", dest="names", help="only run this case")
+    parser.add_argument("--out", default=None, help="write the results to this JSON file")
+    parser.add_argument("--baseline", default=BASELINE, help="compare with results in this JSON file")
+    parser.add_argument("--no-baseline", action="store_true", help="only print the results")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.number, args.repeat, names=args.names)
+    if args.out:
+        write_results(results, args.out)
+    if args.no_baseline:
+        print(json.dumps(results, indent=2, sort_keys=True))
+        return
+
+    report = compare(results, load_results(args.baseline), args.tolerance)
+    print(json.dumps(report, indent=2, sort_keys=True))
+    if regressions(report):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
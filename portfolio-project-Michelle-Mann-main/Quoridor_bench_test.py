@@ -0,0 +1,72 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Unit Test for the Quoridor benchmarks
+
+import os
+import tempfile
+import unittest
+from Quoridor import MAIN_SCRIPT, QuoridorGame
+from Quoridor_batch import np
+from Quoridor_bench import BASELINE, benchmark_cases, compare, load_results, play_script, regressions, \
+    run_benchmarks, write_results
+
+
+class TestBench(unittest.TestCase):
+    """Contains the unit test for the benchmarks"""
+
+    def test_cases_do_what_they_say(self):
+        """
+        Tests that each move case makes a legal move of its kind, and that the
+        scripted game plays out as it does in Quoridor.main.
+        """
+        cases = benchmark_cases((5,))
+        for name in ("move_pawn.simple", "move_pawn.jump", "move_pawn.diagonal", "place_fence"):
+            prepare, action = cases[name]
+            self.assertTrue(action(prepare()), name)
+
+        steps = play_script(QuoridorGame())
+        self.assertEqual(len(steps), len(MAIN_SCRIPT))
+        self.assertEqual(steps.count(True), 21)
+        self.assertEqual(cases["find_board_node.5"][1](cases["find_board_node.5"][0]()).get_node_name(), (4, 4))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_batch_cases(self):
+        """
+        Tests that the batch case and the loop it is compared with find the
+        same legal moves and distances for the same positions.
+        """
+        cases = benchmark_cases((5,))
+        batch = cases["batch.evaluate"][1](cases["batch.evaluate"][0]())
+        loop = cases["batch.loop"][1](cases["batch.loop"][0]())
+        for index, (moves, distance_1, distance_2) in enumerate(loop):
+            self.assertEqual(list(np.flatnonzero(batch["legal_moves"][index])), sorted(moves))
+            self.assertEqual(list(batch["distances"][index]), [distance_1, distance_2])
+
+    def test_results_and_baseline(self):
+        """
+        Tests the results of a short run, and comparing them with a baseline
+        saved to JSON.
+        """
+        results = run_benchmarks(number=2, repeat=2, sizes=(5,), names=["is_winner", "new_game.5"])
+        self.assertEqual(sorted(results["results"]), ["is_winner", "new_game.5"])
+        self.assertGreater(results["results"]["new_game.5"]["us_per_call"], 0)
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "baseline.json")
+            write_results(results, path)
+            baseline = load_results(path)
+        self.assertEqual(baseline, results)
+
+        baseline["results"]["is_winner"]["us_per_call"] *= 10
+        baseline["results"]["new_game.5"]["us_per_call"] /= 10
+        report = compare(results, baseline)
+        self.assertEqual([report["is_winner"]["status"], report["new_game.5"]["status"]], ["faster", "slower"])
+        self.assertEqual(regressions(report), ["new_game.5"])
+
+        del baseline["results"]["is_winner"]
+        self.assertEqual(compare(results, baseline)["is_winner"]["status"], "new")
+
+        # The stored baseline has every case, so none of them is ever new.
+        stored = load_results(BASELINE)
+        self.assertLessEqual(set(benchmark_cases()), set(stored["results"]))
+        self.assertNotIn("new", [entry["status"] for entry in compare(results, stored).values()])
@@ -0,0 +1,203 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Quoridor opening book.
+# Maps the Zobrist key of each position of the first plies of a game, from
+# the standard start, to the move the search engine picked for it. The
+# book is built offline, spreading the searches over a process pool, and
+# written as one table of (key, move) entries sorted by key. A book is
+# memory-mapped when loaded and looked up by binary search, so a bot can
+# answer a book position without searching.
+
+import argparse
+import mmap
+import multiprocessing
+import struct
+
+from Quoridor_engine import SearchEngine
+from Quoridor_state import GameState
+
+# The file header: magic, format version, board size, plies covered and
+# number of entries.
+BOOK_HEADER = struct.Struct("<4sBBBxI")
+MAGIC = b"QRBK"
+VERSION = 1
+
+# Each entry is a position's 64-bit Zobrist key and its move code.
+ENTRY = struct.Struct("<QH")
+
+
+class BookFormatError(Exception):
+    """
+    Raised when a file is not a Quoridor opening book.
+    """
+    pass
+
+
+def best_move_job(job):
+    """
+    Returns the (Zobrist key, move code) the search engine picks for a
+    position. job is a (state, time_budget, max_depth) tuple so it can be
+    sent to a worker process.
+    """
+    state, time_budget, max_depth = job
+    return state.get_zobrist_key(), SearchEngine(time_budget, max_depth).choose_move(state)
+
+
+def next_positions(state, move):
+    """
+    Returns the positions the book follows on from state: every pawn move,
+    and the book move itself if it is a fence.
+    """
+    moves = state.pawn_moves()
+    if move not in moves:
+        moves.append(move)
+
+    children = []
+    for child_move in moves:
+        child = state.copy()
+        child.make_move(child_move)
+        if not child.get_winner():
+            children.append(child)
+    return children
+
+
+def book_entries(plies, size=9, time_budget=0.1, max_depth=4, workers=None):
+    """
+    Searches the positions of the first plies of a game and returns their
+    {Zobrist key: move code} table. Each ply's positions are searched in
+    parallel, then followed on by every pawn move and by the book move.
+    """
+    entries = dict()
+    layer = [GameState(size)]
+    with multiprocessing.Pool(workers) as pool:
+        for _ in range(plies):
+            jobs = [(state, time_budget, max_depth) for state in layer]
+            moves = dict(pool.map(best_move_job, jobs))
+            entries.update((key, move) for key, move in moves.items() if move >= 0)
+
+            seen = set(entries)
+            children = []
+            for state in layer:
+                for child in next_positions(state, moves[state.get_zobrist_key()]):
+                    if child.get_zobrist_key() not in seen:
+                        seen.add(child.get_zobrist_key())
+                        children.append(child)
+            layer = children
+    return entries
+
+
+def write_book(path, entries, size=9, plies=0):
+    """
+    Writes a {Zobrist key: move code} table as an opening book file.
+    """
+    with open(path, "wb") as book_file:
+        book_file.write(BOOK_HEADER.pack(MAGIC, VERSION, size, plies, len(entries)))
+        for key in sorted(entries):
+            book_file.write(ENTRY.pack(key, entries[key]))
+
+
+def build_book(path, plies=4, size=9, time_budget=0.1, max_depth=4, workers=None):
+    """
+    Builds an opening book of the first plies of a game and writes it to
+    path. Returns the number of positions in it.
+    """
+    entries = book_entries(plies, size, time_budget, max_depth, workers)
+    write_book(path, entries, size, plies)
+    return len(entries)
+
+
+class OpeningBook:
+    """
+    Represents an opening book file, memory-mapped for lookups.
+    """
+
+    def __init__(self, path):
+        """
+        Opens and maps an opening book file.
+        """
+        self._file = open(path, "rb")
+        header = self._file.read(BOOK_HEADER.size)
+        if len(header) < BOOK_HEADER.size or header[:4] != MAGIC:
+            self._file.close()
+            raise BookFormatError(path + " is not a Quoridor opening book")
+
+        _, version, self._size, self._plies, self._count = BOOK_HEADER.unpack(header)
+        if version != VERSION or self._file.seek(0, 2) != BOOK_HEADER.size + self._count * ENTRY.size:
+            self._file.close()
+            raise BookFormatError(path + " is not a version " + str(VERSION) + " opening book")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __enter__(self):
+        """Returns the book, so it is closed at the end of a with block"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Closes the book's file"""
+        self.close()
+
+    def __len__(self):
+        """Returns the number of positions in the book"""
+        return self._count
+
+    def __contains__(self, key):
+        """Returns True if the book has a move for a Zobrist key"""
+        return self.lookup(key) >= 0
+
+    def close(self):
+        """
+        Unmaps and closes the book file.
+        """
+        self._map.close()
+        self._file.close()
+
+    def get_size(self):
+        """Returns the board size of the book's positions"""
+        return self._size
+
+    def get_plies(self):
+        """Returns the number of plies from the start the book covers"""
+        return self._plies
+
+    def lookup(self, key):
+        """
+        Returns the move code the book has for a Zobrist key, or -1 if the
+        position isn't in the book.
+        """
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            found, move = ENTRY.unpack_from(self._map, BOOK_HEADER.size + middle * ENTRY.size)
+            if found == key:
+                return move
+            if found < key:
+                low = middle + 1
+            else:
+                high = middle
+        return -1
+
+    def probe(self, state):
+        """
+        Returns the book move for a GameState, or -1 if it isn't in the book.
+        """
+        if state.get_size() != self._size:
+            return -1
+        return self.lookup(state.get_zobrist_key())
+
+
+def main():
+    """Builds an opening book from the command line, will not run if imported"""
+    parser = argparse.ArgumentParser(description="Build a Quoridor opening book.")
+    parser.add_argument("path")
+    parser.add_argument("--plies", type=int, default=4)
+    parser.add_argument("--size", type=int, default=9)
+    parser.add_argument("--budget", type=float, default=0.1, help="seconds of search per position")
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    count = build_book(args.path, args.plies, args.size, args.budget, args.depth, args.workers)
+    print(str(count) + " positions written to " + args.path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Unit Test for the Quoridor opening book
+
+import os
+import tempfile
+import unittest
+from Quoridor import QuoridorGame
+from Quoridor_book import BookFormatError, OpeningBook, book_entries, build_book, write_book
+from Quoridor_engine import MCTSEngine, SearchEngine
+from Quoridor_state import GameState
+
+
+class TestBook(unittest.TestCase):
+    """Contains the unit test for the opening book"""
+
+    def setUp(self):
+        """Makes a folder for the test's book files"""
+        self._folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self._folder.cleanup)
+
+    def test_build_and_probe(self):
+        """
+        Tests that a built book has the engine's move for the start and for
+        every pawn reply to it, and that engines play book moves unsearched.
+        """
+        path = os.path.join(self._folder.name, "book.qb")
+        count = build_book(path, plies=2, time_budget=None, max_depth=1, workers=2)
+
+        with OpeningBook(path) as book:
+            self.assertEqual([len(book), book.get_size(), book.get_plies()], [count, 9, 2])
+            start = GameState()
+            first = book.probe(start)
+            self.assertEqual(first, SearchEngine(None, 1).choose_move(start))
+
+            after = start.copy()
+            after.make_move(first)
+            for reply in after.pawn_moves():
+                position = after.copy()
+                position.make_move(reply)
+                self.assertNotIn(position.get_zobrist_key(), book)
+                self.assertEqual(book.probe(position), -1)
+            self.assertIn(after.get_zobrist_key(), book)
+
+            engine = SearchEngine(book=book)
+            self.assertEqual(engine.choose_move(after), book.probe(after))
+            self.assertEqual(engine.get_node_count(), 0)
+            self.assertEqual(MCTSEngine(workers=1, book=book).choose_move(start), first)
+
+            # A game played by the book engine follows the book.
+            game = QuoridorGame()
+            self.assertTrue(engine.play(game))
+            self.assertEqual(game.get_history()[0][1], first)
+            self.assertEqual(book.probe(GameState(5)), -1)
+
+    def test_lookup_and_bad_files(self):
+        """
+        Tests lookups in a hand-written book, and that files which are not
+        books are refused.
+        """
+        path = os.path.join(self._folder.name, "book.qb")
+        entries = {key * 7919: key % 200 for key in range(1, 500)}
+        write_book(path, entries, 9, 3)
+        with OpeningBook(path) as book:
+            self.assertEqual([book.lookup(key) for key in sorted(entries)], [entries[key] for key in sorted(entries)])
+            self.assertEqual([book.lookup(0), book.lookup(7920), book.lookup(1 << 63)], [-1, -1, -1])
+
+        with open(path, "r+b") as book_file:
+            book_file.truncate(os.path.getsize(path) - 1)
+        self.assertRaises(BookFormatError, OpeningBook, path)
+
+        other = os.path.join(self._folder.name, "other.qb")
+        with open(other, "wb") as book_file:
+            book_file.write(b"not a book")
+        self.assertRaises(BookFormatError, OpeningBook, other)
+        self.assertEqual(len(book_entries(1, size=5, time_budget=None, max_depth=1, workers=1)), 1)
@@ -0,0 +1,688 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Quoridor search tools.
+# A bounded transposition table keyed by Zobrist key, so positions reached
+# by different move orders are only evaluated once, an alpha-beta search
+# engine that picks a move for the player to move within a time budget,
+# and a Monte Carlo tree search engine that spreads its playouts over every
+# core of the machine.
+
+import math
+import multiprocessing
+import os
+import random
+import time
+
+from Quoridor_state import UNREACHABLE
+
+# What a stored value means: the exact value of the position, or a bound
+# the true value is at least (LOWER) or at most (UPPER).
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+# Scores are from the point of view of the player to move. A won game is
+# worth WIN_SCORE less the number of moves it took, so quicker wins are
+# preferred. Otherwise every step of shortest path is worth PATH_WEIGHT
+# and every fence in hand FENCE_WEIGHT.
+WIN_SCORE = 1000000
+PATH_WEIGHT = 100
+FENCE_WEIGHT = 10
+
+
+class SearchTimeout(Exception):
+    """
+    Raised inside a search when its time budget runs out.
+    """
+    pass
+
+
+def fences_across(state, route, limit):
+    """
+    Returns the move codes of the free fence slots blocking the first limit
+    steps of route, a list of (square, direction) steps, nearest first. The
+    fair play rule is not checked. Empty if the player to move has no fences.
+    """
+    if state.get_no_of_fences(state.get_whose_move()) <= 0:
+        return []
+
+    geometry = state.get_geometry()
+    square_count = geometry.get_square_count()
+    moves = []
+    for square, direction in route[:limit]:
+        move = geometry.blocking_fence(square, direction)
+        walls = state.get_h_walls() if move < 2 * square_count else state.get_v_walls()
+        if not walls & (1 << (move % square_count)):
+            moves.append(move)
+    return moves
+
+
+def opponent_route(state):
+    """
+    Returns the shortest path of the player not to move as (square, direction)
+    steps, or None if they are sealed in.
+    """
+    geometry = state.get_geometry()
+    opponent = 3 - state.get_whose_move()
+    return geometry.path_steps(state.get_h_walls(), state.get_v_walls(),
+                               state.get_pawn_square(opponent), geometry.get_goal_row(opponent))
+
+
+class TranspositionTable:
+    """
+    Represents a fixed-size table of evaluated positions keyed by their 64-bit
+    Zobrist key. Each key maps to one slot. A slot is overwritten by a new entry
+    for the same key, by a deeper search, or by anything once its entry is left
+    over from an earlier search.
+    """
+
+    def __init__(self, size=1 << 16):
+        """
+        Creates an empty table with size slots, rounded up to a power of two.
+        """
+        slot_count = 1
+        while slot_count < size:
+            slot_count <<= 1
+
+        self._mask = slot_count - 1
+        self._slots = [None] * slot_count
+        self._generation = 0
+
+        # Counters of how the table has been used.
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+
+    def __len__(self):
+        """Returns the number of slots in use"""
+        return sum(1 for entry in self._slots if entry is not None)
+
+    def get_size(self):
+        """Returns the number of slots of the table"""
+        return self._mask + 1
+
+    def new_search(self):
+        """
+        Marks every stored entry as belonging to an earlier search, so they give
+        way to the next search's entries.
+        """
+        self._generation += 1
+
+    def clear(self):
+        """Empties the table"""
+        self._slots = [None] * (self._mask + 1)
+
+    def lookup(self, key):
+        """
+        Returns the (depth, value, bound, move) stored for key, or None.
+        """
+        entry = self._slots[key & self._mask]
+        if entry is not None and entry[0] == key:
+            self._hits += 1
+            return entry[1:5]
+
+        self._misses += 1
+        return None
+
+    def store(self, key, depth, value, bound=EXACT, move=-1):
+        """
+        Stores what is known about the position with key: the value found
+        searching depth moves ahead, whether it is EXACT or a LOWER/UPPER
+        bound, and the best move found. Returns True if it was stored.
+        """
+        index = key & self._mask
+        entry = self._slots[index]
+
+        if entry is not None and entry[0] != key:
+            if entry[5] == self._generation and entry[1] > depth:
+                return False
+            self._evictions += 1
+
+        self._slots[index] = (key, depth, value, bound, move, self._generation)
+        self._stores += 1
+        return True
+
+    def get_stats(self):
+        """
+        Returns the hit, miss, store and eviction counts as a dictionary.
+        """
+        return {"hits": self._hits,
+                "misses": self._misses,
+                "stores": self._stores,
+                "evictions": self._evictions}
+
+
+class SearchEngine:
+    """
+    Represents a negamax alpha-beta search over GameState positions with
+    iterative deepening. Each deeper search is started only while there is
+    time left, and the best move of the deepest finished search is played.
+    Pawn moves that shorten the mover's path are tried first, then fences
+    across the start of the opponent's shortest path. A fence that seals a
+    pawn in is found illegal when its position is searched, and is skipped.
+    """
+
+    def __init__(self, time_budget=0.1, max_depth=4, max_fences=8, table=None, book=None,
+                 tablebase=None):
+        """
+        Creates an engine that thinks for at most time_budget seconds (None for
+        no limit) and max_depth moves ahead, trying fences on the first
+        max_fences steps of the opponent's path. Positions in book, an
+        OpeningBook, are answered from it without searching, and fenceless
+        endgames from tablebase, a Tablebase.
+        """
+        self._time_budget = time_budget
+        self._max_depth = max_depth
+        self._max_fences = max_fences
+        self._table = table if table is not None else TranspositionTable()
+        self._book = book
+        self._tablebase = tablebase
+
+        self._deadline = None
+        self._node_count = 0
+        self._completed_depth = 0
+
+    def get_table(self):
+        """Returns the transposition table of the engine"""
+        return self._table
+
+    def get_node_count(self):
+        """Returns the number of positions visited by the last search"""
+        return self._node_count
+
+    def get_completed_depth(self):
+        """Returns the depth of the deepest finished search of the last move"""
+        return self._completed_depth
+
+    def choose_move(self, state):
+        """
+        Returns the move code the engine picks for the player to move in state,
+        or -1 if there is no legal move.
+        """
+        self._node_count = 0
+        self._completed_depth = 0
+        book_move = self._book.probe(state) if self._book is not None else -1
+        if book_move >= 0:
+            return book_move
+        if self._tablebase is not None and self._tablebase.covers(state):
+            return self._tablebase.best_move(state)
+
+        self._table.new_search()
+        self._deadline = None if self._time_budget is None else time.perf_counter() + self._time_budget
+        best_move = -1
+
+        for depth in range(1, self._max_depth + 1):
+            try:
+                move = self._search_root(state, depth, best_move)
+            except SearchTimeout:
+                break
+            if move < 0:
+                break
+            best_move = move
+            self._completed_depth = depth
+
+        # Out of time before even one move ahead, or none of the moves searched
+        # was legal: take the best looking legal move, else any legal one.
+        if best_move < 0 and not state.get_winner():
+            analysis = self._analyse(state)
+            moves = self._ordered_moves(state, analysis, -1) if analysis is not None else []
+            best_move = next((move for move in moves if state.is_legal(move)), -1)
+            if best_move < 0:
+                best_move = next(iter(state.legal_moves()), -1)
+        return best_move
+
+    def play(self, game):
+        """
+        Picks and plays a move for the player to move in a QuoridorGame.
+        Returns what move_pawn or place_fence returned, or False if there was
+        no move to play.
+        """
+        state = game.to_state()
+        move = self.choose_move(state)
+        if move < 0:
+            return False
+
+        kind, coord_tuple = state.get_geometry().describe_move(move)
+        if kind == "pawn":
+            return game.move_pawn(state.get_whose_move(), coord_tuple)
+        return game.place_fence(state.get_whose_move(), kind, coord_tuple)
+
+    def _search_root(self, state, depth, first_move):
+        """
+        Searches every move of state depth moves ahead and returns the best,
+        or -1 if none is legal. first_move is tried first.
+        """
+        analysis = self._analyse(state)
+        if analysis is None or state.get_winner():
+            return -1
+
+        best_move = -1
+        alpha = -WIN_SCORE - 1
+        for move in self._ordered_moves(state, analysis, first_move):
+            child = state.copy()
+            child.make_move(move)
+            score = self._negamax(child, depth - 1, -WIN_SCORE - 1, -alpha, 1)
+            if score is not None and -score > alpha:
+                alpha = -score
+                best_move = move
+        return best_move
+
+    def _negamax(self, state, depth, alpha, beta, ply):
+        """
+        Returns the score of state for the player to move searched depth moves
+        ahead, or None if the move that led to it sealed a pawn in.
+        """
+        self._tick()
+        if state.get_winner():
+            return ply - WIN_SCORE
+        endgame = self._endgame_score(state, ply)
+        if endgame is not None:
+            return endgame
+        if depth == 0:
+            return self._evaluate(state)
+
+        key = state.get_zobrist_key()
+        stored, table_move = self._probe(key, depth, alpha, beta)
+        if stored is not None:
+            return stored
+
+        analysis = self._analyse(state)
+        if analysis is None:
+            return None
+
+        best, best_move = self._search_moves(state, analysis, table_move, depth, alpha, beta, ply)
+        if best is None:
+            return self._evaluate(state)
+
+        bound = UPPER if best <= alpha else LOWER if best >= beta else EXACT
+        self._table.store(key, depth, best, bound, best_move)
+        return best
+
+    def _endgame_score(self, state, ply):
+        """
+        Returns the exact score of a fenceless endgame whose wall layout the
+        tablebase has already solved, or None. Layouts are not solved during
+        a search, which would blow its time budget.
+        """
+        tablebase = self._tablebase
+        if tablebase is None or not tablebase.covers(state) or \
+                not tablebase.has_table(state.get_size(), state.get_h_walls(), state.get_v_walls()):
+            return None
+
+        plies = tablebase.value(state)
+        if plies < 0:
+            return 0
+        return WIN_SCORE - ply - plies if plies % 2 else ply + plies - WIN_SCORE
+
+    def _search_moves(self, state, analysis, first_move, depth, alpha, beta, ply):
+        """
+        Searches the moves of state and returns the best (score, move) pair,
+        stopping early once a move scores beta or more.
+        """
+        best = None
+        best_move = -1
+        for move in self._ordered_moves(state, analysis, first_move):
+            child = state.copy()
+            child.make_move(move)
+            floor = alpha if best is None else max(alpha, best)
+            score = self._negamax(child, depth - 1, -beta, -floor, ply + 1)
+            if score is None:
+                continue
+            if best is None or -score > best:
+                best = -score
+                best_move = move
+                if best >= beta:
+                    break
+        return best, best_move
+
+    def _probe(self, key, depth, alpha, beta):
+        """
+        Returns (score, move) from the transposition table. score is None unless
+        the stored entry settles the position for this window and depth.
+        """
+        entry = self._table.lookup(key)
+        if entry is None:
+            return None, -1
+
+        stored_depth, value, bound, move = entry
+        if stored_depth >= depth and (bound == EXACT or (bound == LOWER and value >= beta) or
+                                      (bound == UPPER and value <= alpha)):
+            return value, move
+        return None, move
+
+    def _tick(self):
+        """
+        Counts a visited position and stops the search once time is up.
+        """
+        self._node_count += 1
+        if self._deadline is not None and not self._node_count & 15 and \
+                time.perf_counter() > self._deadline:
+            raise SearchTimeout()
+
+    def _evaluate(self, state):
+        """
+        Returns the shortest path difference score of state for the player to
+        move, or None if a pawn is sealed in.
+        """
+        player = state.get_whose_move()
+        own = state.shortest_path(player)
+        other = state.shortest_path(3 - player)
+        if own < 0 or other < 0:
+            return None
+
+        fences = state.get_no_of_fences(player) - state.get_no_of_fences(3 - player)
+        return (other - own) * PATH_WEIGHT + fences * FENCE_WEIGHT
+
+    def _analyse(self, state):
+        """
+        Returns the mover's distance to goal from every square and the
+        opponent's shortest path as (square, direction) steps, or None if
+        either pawn is sealed in.
+        """
+        player = state.get_whose_move()
+        geometry = state.get_geometry()
+        field = geometry.distance_field(state.get_h_walls(), state.get_v_walls(), player)
+        if field[state.get_pawn_square(player)] == UNREACHABLE:
+            return None
+
+        route = opponent_route(state)
+        if route is None:
+            return None
+        return field, route
+
+    def _ordered_moves(self, state, analysis, first_move):
+        """
+        Returns the moves to search in order: first_move, pawn moves that get
+        closer to the goal, fences across the opponent's path, other pawn moves.
+        """
+        field, route = analysis
+        here = field[state.get_pawn_square(state.get_whose_move())]
+        pawn_moves = sorted(state.pawn_moves(), key=field.__getitem__)
+        closer = [move for move in pawn_moves if field[move] < here]
+        moves = closer + fences_across(state, route, self._max_fences) + pawn_moves[len(closer):]
+
+        if first_move in moves:
+            moves.remove(first_move)
+            moves.insert(0, first_move)
+        return moves
+
+
+class MCTSEngine:
+    """
+    Represents a Monte Carlo tree search engine. Every worker process grows its
+    own tree from the same root for the whole time budget (root parallel
+    search), and the move visited most across all trees is played. Playouts
+    mostly walk each pawn down its shortest path, now and then dropping a fence
+    across the opponent's path. Tree moves are the pawn moves plus the legal
+    fences across the opponent's path.
+    """
+
+    def __init__(self, time_budget=1.0, workers=None, exploration=1.4, max_fences=8,
+                 max_playout_length=100, seed=None, book=None):
+        """
+        Creates an engine that thinks for time_budget seconds on workers
+        processes (every core by default; 1 searches in this process).
+        Positions in book, an OpeningBook, are answered from it.
+        """
+        self._time_budget = time_budget
+        self._workers = workers or os.cpu_count() or 1
+        self._exploration = exploration
+        self._max_fences = max_fences
+        self._max_playout_length = max_playout_length
+        self._rng = random.Random(seed)
+        self._book = book
+        self._pool = None
+
+        self._playout_count = 0
+        self._elapsed = 0.0
+
+    def __enter__(self):
+        """Returns the engine, so it can close its workers at the end of a with block"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Closes the engine's worker processes"""
+        self.close()
+
+    def close(self):
+        """
+        Shuts down the worker processes, if any were started.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def get_workers(self):
+        """Returns the number of worker processes the engine searches on"""
+        return self._workers
+
+    def get_playout_count(self):
+        """Returns the number of playouts run for the last move"""
+        return self._playout_count
+
+    def get_playouts_per_second(self):
+        """Returns the playout rate of the last move, over all workers"""
+        return self._playout_count / self._elapsed if self._elapsed else 0.0
+
+    def choose_move(self, state):
+        """
+        Returns the move code the engine picks for the player to move in state,
+        or -1 if the game is over.
+        """
+        if state.get_winner():
+            return -1
+        self._playout_count, self._elapsed = 0, 0.0
+        book_move = self._book.probe(state) if self._book is not None else -1
+        if book_move >= 0:
+            return book_move
+
+        # Playouts can't tell a win now from a win later, so take it here.
+        goal_row = state.get_geometry().get_goal_row(state.get_whose_move())
+        for move in state.pawn_moves():
+            if state.get_geometry().row_of(move) == goal_row:
+                return move
+
+        start = time.perf_counter()
+        jobs = [(state, self._time_budget, self._exploration, self._max_fences,
+                 self._max_playout_length, self._rng.getrandbits(32)) for _ in range(self._workers)]
+        if self._workers == 1:
+            results = [grow_tree(jobs[0])]
+        else:
+            results = self._get_pool().map(grow_tree, jobs)
+        self._elapsed = time.perf_counter() - start
+
+        visits = dict()
+        self._playout_count = 0
+        for tree_visits, playouts in results:
+            self._playout_count += playouts
+            for move, count in tree_visits.items():
+                visits[move] = visits.get(move, 0) + count
+        return max(visits, key=visits.get) if visits else -1
+
+    def play(self, game):
+        """
+        Picks and plays a move for the player to move in a QuoridorGame.
+        Returns what move_pawn or place_fence returned, or False if there was
+        no move to play.
+        """
+        state = game.to_state()
+        move = self.choose_move(state)
+        if move < 0:
+            return False
+
+        kind, coord_tuple = state.get_geometry().describe_move(move)
+        if kind == "pawn":
+            return game.move_pawn(state.get_whose_move(), coord_tuple)
+        return game.place_fence(state.get_whose_move(), kind, coord_tuple)
+
+    def _get_pool(self):
+        """Returns the worker pool, starting it on first use"""
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(self._workers)
+        return self._pool
+
+
+class TreeNode:
+    """
+    Represents one position in a Monte Carlo search tree: the move that led to
+    it, the moves not tried from it yet, and how often playouts through it were
+    won by the player who made that move.
+    """
+
+    __slots__ = ("_move", "_parent", "_mover", "_children", "_untried", "_visits", "_wins")
+
+    def __init__(self, move, parent, mover, untried):
+        """
+        Creates a node reached by mover playing move from parent.
+        """
+        self._move = move
+        self._parent = parent
+        self._mover = mover
+        self._children = []
+        self._untried = untried
+        self._visits = 0
+        self._wins = 0
+
+    def get_move(self):
+        """Returns the move that led to this node"""
+        return self._move
+
+    def get_parent(self):
+        """Returns the node this node's move was played from"""
+        return self._parent
+
+    def get_children(self):
+        """Returns the nodes expanded from this node"""
+        return self._children
+
+    def get_visits(self):
+        """Returns the number of playouts through this node"""
+        return self._visits
+
+    def has_untried(self):
+        """Returns True if some move of this node has not been expanded yet"""
+        return bool(self._untried)
+
+    def take_untried(self, rng):
+        """Removes and returns a random untried move"""
+        return self._untried.pop(rng.randrange(len(self._untried)))
+
+    def add_child(self, move, untried):
+        """Expands move from this node and returns the new node"""
+        child = TreeNode(move, self, 3 - self._mover, untried)
+        self._children.append(child)
+        return child
+
+    def best_child(self, exploration):
+        """
+        Returns the child with the highest upper confidence bound.
+        """
+        log_visits = math.log(self._visits)
+        return max(self._children, key=lambda child: child._wins / child._visits +
+                   exploration * math.sqrt(log_visits / child._visits))
+
+    def record(self, winner):
+        """Counts a playout through this node won by winner"""
+        self._visits += 1
+        if winner == self._mover:
+            self._wins += 1
+
+
+def grow_tree(job):
+    """
+    Grows one search tree from a root state for a time budget. job is a
+    (state, time_budget, exploration, max_fences, max_playout_length, seed)
+    tuple so it can be sent to a worker process. Returns the visit count of
+    every root move and the number of playouts run.
+    """
+    root_state, time_budget, exploration, max_fences, max_playout_length, seed = job
+    rng = random.Random(seed)
+    root = TreeNode(-1, None, 3 - root_state.get_whose_move(), tree_moves(root_state, max_fences))
+    deadline = time.perf_counter() + time_budget
+    playouts = 0
+
+    while playouts == 0 or time.perf_counter() < deadline:
+        node, state = select_and_expand(root, root_state.copy(), exploration, max_fences, rng)
+        winner = playout(state, rng, max_fences, max_playout_length)
+        while node is not None:
+            node.record(winner)
+            node = node.get_parent()
+        playouts += 1
+
+    return {child.get_move(): child.get_visits() for child in root.get_children()}, playouts
+
+
+def select_and_expand(node, state, exploration, max_fences, rng):
+    """
+    Walks down the tree by upper confidence bound, playing the moves on state,
+    and expands one untried move. Returns the new node and its state.
+    """
+    while not node.has_untried() and node.get_children():
+        node = node.best_child(exploration)
+        state.make_move(node.get_move())
+
+    if node.has_untried() and not state.get_winner():
+        move = node.take_untried(rng)
+        state.make_move(move)
+        node = node.add_child(move, tree_moves(state, max_fences))
+    return node, state
+
+
+def tree_moves(state, max_fences):
+    """
+    Returns the moves a search tree considers from state: every pawn move and
+    every legal fence across the first max_fences steps of the opponent's path.
+    """
+    if state.get_winner():
+        return []
+
+    route = opponent_route(state) or []
+    fences = [move for move in fences_across(state, route, max_fences) if state.is_legal(move)]
+    return state.pawn_moves() + fences
+
+
+def playout(state, rng, max_fences, max_length):
+    """
+    Plays state out to the end with a quick heuristic policy and returns the
+    winner. After max_length moves the player with the shorter path wins.
+    """
+    # Distance fields only change when a fence goes up.
+    fields = dict()
+    for _ in range(max_length):
+        if state.get_winner():
+            return state.get_winner()
+        move = playout_move(state, rng, max_fences, fields)
+        if move < 0:
+            break
+        state.make_move(move)
+
+    if state.get_winner():
+        return state.get_winner()
+    return 1 if state.shortest_path(1) <= state.shortest_path(2) else 2
+
+
+def playout_move(state, rng, max_fences, fields):
+    """
+    Returns a playout move: now and then a fence across the opponent's path,
+    mostly the pawn move that gets closest to the goal, otherwise a random
+    pawn move. -1 if there is no move. fields caches distance fields by walls.
+    """
+    if rng.random() < 0.1:
+        fences = fences_across(state, opponent_route(state) or [], max_fences)
+        if fences:
+            move = rng.choice(fences)
+            if state.is_legal(move):
+                return move
+
+    pawn_moves = state.pawn_moves()
+    if not pawn_moves:
+        return -1
+    if rng.random() < 0.8:
+        player = state.get_whose_move()
+        walls = (state.get_h_walls(), state.get_v_walls(), player)
+        if walls not in fields:
+            fields[walls] = state.get_geometry().distance_field(walls[0], walls[1], player)
+        return min(pawn_moves, key=fields[walls].__getitem__)
+    return rng.choice(pawn_moves)
@@ -0,0 +1,120 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Unit Test for the Quoridor search tools
+
+import time
+import unittest
+from Quoridor import QuoridorGame
+from Quoridor_state import GameState
+from Quoridor_engine import MCTSEngine, SearchEngine, TranspositionTable, EXACT, LOWER
+
+
+class TestEngine(unittest.TestCase):
+    """Contains the unit test for the Quoridor search tools"""
+
+    def test_transposition_table(self):
+        """
+        Tests storing, finding and replacing transposition table entries.
+        """
+        table = TranspositionTable(size=100)
+
+        # Sizes are rounded up to a power of two.
+        self.assertEqual(table.get_size(), 128)
+
+        self.assertTrue(table.store(5, 3, 10, EXACT, 40))
+        self.assertEqual(table.lookup(5), (3, 10, EXACT, 40))
+        self.assertIsNone(table.lookup(5 + 128))
+
+        # A shallower entry for another key sharing the slot is turned away...
+        self.assertFalse(table.store(5 + 128, 1, -4, LOWER))
+        self.assertEqual(table.lookup(5), (3, 10, EXACT, 40))
+
+        # ...unless the stored entry is from an earlier search.
+        table.new_search()
+        self.assertTrue(table.store(5 + 128, 1, -4, LOWER))
+        self.assertIsNone(table.lookup(5))
+        self.assertEqual(table.lookup(5 + 128), (1, -4, LOWER, -1))
+
+        stats = table.get_stats()
+        self.assertEqual([stats["hits"], stats["misses"], stats["evictions"]], [3, 2, 1])
+        self.assertEqual(len(table), 1)
+
+    def test_engine_takes_the_win(self):
+        """
+        Tests that the engine plays a winning move when it has one, and blocks
+        the opponent's winning move when it doesn't.
+        """
+        state = GameState()
+        geometry = state.get_geometry()
+        engine = SearchEngine(time_budget=None, max_depth=3)
+
+        state.set_position((geometry.square_of((2, 7)), geometry.square_of((6, 4))), 0, 0, (10, 10), 1)
+        self.assertEqual(engine.choose_move(state), geometry.pawn_move((2, 8)))
+
+        # Player 2 is a step from winning and player 1 is far away: fence them.
+        state.set_position((geometry.square_of((2, 2)), geometry.square_of((6, 1))), 0, 0, (10, 10), 1)
+        self.assertEqual(engine.choose_move(state), geometry.fence_move("h", (6, 1)))
+
+    def test_engine_only_has_fences(self):
+        """
+        Tests that a boxed in engine whose only fence across the opponent's
+        path would seal them in still plays a legal fence, and gives up only
+        once it has no fences left.
+        """
+        state = GameState()
+        state.set_position((43, 42), 9806597568812023808, 2343020797527934048, (3, 3), 1)
+        self.assertEqual(state.pawn_moves(), [])
+        self.assertFalse(state.is_legal(123))
+
+        move = SearchEngine(time_budget=None, max_depth=2, max_fences=1).choose_move(state)
+        self.assertTrue(state.is_legal(move))
+
+        state.set_position((43, 42), 9806597568812023808, 2343020797527934048, (0, 3), 1)
+        self.assertEqual(SearchEngine(time_budget=None, max_depth=2).choose_move(state), -1)
+
+    def test_engine_plays_a_game(self):
+        """
+        Tests that the engine only plays legal moves, within its time budget,
+        through to the end of a QuoridorGame.
+        """
+        q = QuoridorGame()
+        engine = SearchEngine(time_budget=0.05, max_depth=3)
+
+        for _ in range(300):
+            if q.is_winner(1) or q.is_winner(2):
+                break
+            start = time.perf_counter()
+            self.assertIs(engine.play(q), True)
+            self.assertLess(time.perf_counter() - start, 0.5)
+            self.assertGreaterEqual(engine.get_completed_depth(), 1)
+
+        self.assertTrue(q.is_winner(1) or q.is_winner(2))
+
+    def test_mcts_takes_the_win(self):
+        """
+        Tests that the Monte Carlo engine steps onto the goal row when it can,
+        and otherwise plays a legal move and reports its playouts.
+        """
+        state = GameState()
+        geometry = state.get_geometry()
+        state.set_position((geometry.square_of((2, 7)), geometry.square_of((6, 4))), 0, 0, (10, 10), 1)
+        engine = MCTSEngine(time_budget=0.2, workers=1, seed=3)
+
+        self.assertEqual(engine.choose_move(state), geometry.pawn_move((2, 8)))
+
+        state = GameState()
+        self.assertIn(engine.choose_move(state), state.legal_moves())
+        self.assertGreater(engine.get_playout_count(), 0)
+        self.assertGreater(engine.get_playouts_per_second(), 0)
+
+    def test_mcts_workers(self):
+        """
+        Tests that a search spread over worker processes plays legal moves and
+        counts the playouts of every worker.
+        """
+        q = QuoridorGame()
+
+        with MCTSEngine(time_budget=0.1, workers=2, seed=5) as engine:
+            for _ in range(4):
+                self.assertIs(engine.play(q), True)
+                self.assertGreaterEqual(engine.get_playout_count(), 2)
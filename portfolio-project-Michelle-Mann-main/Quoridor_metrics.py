@@ -0,0 +1,166 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Optional instrumentation of a QuoridorGame.
+# instrument() swaps counting, timing wrappers in for the hot methods of one
+# game, its board and its path engine, as attributes of those objects. The
+# classes themselves are never touched, so games that are not instrumented
+# run exactly the code they always did. Counts and seconds are kept in a
+# Metrics object, which gives a snapshot dict or a Prometheus text dump.
+
+import time
+
+
+def accepted(result):
+    """Labels a move by whether it was played"""
+    return {"result": "accepted" if result is True else "rejected"}
+
+
+def fence_outcome(result):
+    """Labels a fence attempt as accepted, rejected, or refused by the fair play rule"""
+    if isinstance(result, str):
+        return {"result": "fair_play"}
+    return accepted(result)
+
+
+def move_kind(result):
+    """Labels a move_type call by the kind of move it found"""
+    return {"type": result or "NONE"}
+
+
+# What instrument wraps: for the game ("game"), its board ("board") and its
+# path engine ("paths"), (method, metric name, labels, outcome) entries. An
+# outcome turns a call's return value into extra labels. path_engine_calls
+# counts calls into the path engine, many of them answered from its cached
+# distances and bridges; path_searches only counts the searches it runs.
+INSTRUMENTED = {
+    "board": [("find_board_node", "node_lookups", {"method": "find_board_node"}, None),
+              ("find_player_node", "node_lookups", {"method": "find_player_node"}, None)],
+    "game": [("move_pawn", "pawn_moves", {}, accepted),
+             ("move_type", "move_types", {}, move_kind),
+             ("is_valid_simple_move", "validations", {"branch": "SIMPLE"}, accepted),
+             ("is_valid_diag_move", "validations", {"branch": "DIAGONAL"}, accepted),
+             ("is_valid_comp_move", "validations", {"branch": "COMPLICATED"}, accepted),
+             ("place_fence", "fence_attempts", {}, fence_outcome),
+             ("breaks_fair_play", "fair_play_checks", {}, None)],
+    "paths": [("reset", "path_engine_calls", {"op": "reset"}, None),
+              ("add_fence", "path_engine_calls", {"op": "add_fence"}, None),
+              ("remove_fence", "path_engine_calls", {"op": "remove_fence"}, None),
+              ("would_seal", "path_engine_calls", {"op": "would_seal"}, None),
+              ("_full_search", "path_searches", {"op": "full_search"}, None),
+              ("_find_affected", "path_searches", {"op": "repair"}, None),
+              ("_find_bridges", "path_searches", {"op": "bridges"}, None),
+              ("_seal_search", "path_searches", {"op": "seal_check"}, None)],
+}
+
+# What each metric counts, for the Prometheus HELP lines.
+DESCRIPTIONS = {
+    "node_lookups": "Board node lookups",
+    "pawn_moves": "move_pawn calls",
+    "move_types": "Pawn moves classified by move_type",
+    "validations": "Pawn move validations per move_type branch",
+    "fence_attempts": "place_fence calls",
+    "fair_play_checks": "Fair play checks of fences",
+    "path_engine_calls": "Path engine updates and fair play queries",
+    "path_searches": "Board searches run by the path engine",
+}
+
+
+class Metrics:
+    """
+    Represents the counts and total seconds of instrumented calls, per metric
+    name and set of labels. Times are inclusive: a move_pawn call's time
+    includes the lookups and validation it did.
+    """
+
+    def __init__(self):
+        """Creates empty metrics"""
+        self._counts = dict()
+        self._seconds = dict()
+
+    def record(self, name, labels, seconds):
+        """
+        Counts one call of metric name with labels (a dict) that took seconds.
+        """
+        key = (name, tuple(sorted(labels.items())))
+        self._counts[key] = self._counts.get(key, 0) + 1
+        self._seconds[key] = self._seconds.get(key, 0.0) + seconds
+
+    def get_count(self, name, **labels):
+        """
+        Returns the number of calls of metric name whose labels include labels.
+        """
+        wanted = set(labels.items())
+        return sum(count for (key_name, key_labels), count in self._counts.items()
+                   if key_name == name and wanted <= set(key_labels))
+
+    def reset(self):
+        """Forgets everything counted so far"""
+        self._counts.clear()
+        self._seconds.clear()
+
+    def snapshot(self):
+        """
+        Returns the metrics as a JSON-ready dict: for each metric name, a list
+        of {"labels", "count", "seconds"} entries.
+        """
+        result = dict()
+        for key in sorted(self._counts):
+            name, labels = key
+            result.setdefault(name, []).append({"labels": dict(labels), "count": self._counts[key],
+                                                "seconds": self._seconds[key]})
+        return result
+
+    def to_prometheus(self, prefix="quoridor"):
+        """
+        Returns the metrics in the Prometheus text format: a <name>_total and
+        a <name>_seconds_total counter per metric.
+        """
+        lines = []
+        for name, entries in self.snapshot().items():
+            for suffix, field, what in (("_total", "count", "calls"), ("_seconds_total", "seconds", "seconds")):
+                metric = prefix + "_" + name + suffix
+                lines.append("# HELP %s %s, %s." % (metric, DESCRIPTIONS.get(name, name), what))
+                lines.append("# TYPE %s counter" % metric)
+                for entry in entries:
+                    labels = ",".join('%s="%s"' % item for item in sorted(entry["labels"].items()))
+                    lines.append("%s{%s} %r" % (metric, labels, entry[field]) if labels
+                                 else "%s %r" % (metric, entry[field]))
+        return "\n".join(lines) + "\n"
+
+
+def wrap(metrics, method, name, labels, outcome):
+    """
+    Returns a stand-in for a bound method that counts and times its calls.
+    """
+    clock = time.perf_counter
+
+    def instrumented(*args, **kwargs):
+        start = clock()
+        result = method(*args, **kwargs)
+        elapsed = clock() - start
+        metrics.record(name, dict(labels, **outcome(result)) if outcome else labels, elapsed)
+        return result
+
+    return instrumented
+
+
+def targets(game):
+    """Returns the objects of a game that instrument wraps, by INSTRUMENTED key"""
+    return {"board": game.get_game_board(), "game": game, "paths": game.get_path_engine()}
+
+
+def instrument(game, metrics):
+    """
+    Wraps the hot methods of game, its board and its path engine so their
+    calls are recorded in metrics.
+    """
+    for key, target in targets(game).items():
+        for method, name, labels, outcome in INSTRUMENTED[key]:
+            setattr(target, method, wrap(metrics, getattr(type(target), method).__get__(target), name, labels, outcome))
+
+
+def uninstrument(game):
+    """Takes instrument's wrappers off game, leaving its classes' methods"""
+    for key, target in targets(game).items():
+        for method, _, _, _ in INSTRUMENTED[key]:
+            target.__dict__.pop(method, None)
@@ -0,0 +1,72 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Unit Test for the Quoridor instrumentation
+
+import unittest
+from Quoridor import QuoridorGame
+from Quoridor_metrics import Metrics
+
+
+class TestMetrics(unittest.TestCase):
+    """Contains the unit test for the instrumentation"""
+
+    def test_counts(self):
+        """
+        Tests that an instrumented game counts its moves by kind and outcome,
+        its fence attempts and its path searches.
+        """
+        q = QuoridorGame()
+        metrics = q.enable_metrics()
+
+        q.move_pawn(1, (4, 1))
+        q.move_pawn(2, (4, 6))
+        q.move_pawn(1, (4, 2))
+        q.place_fence(2, "h", (4, 4))
+        q.place_fence(1, "h", (4, 4))
+        q.place_fence(1, "h", (3, 4))
+
+        self.assertIs(q.get_metrics(), metrics)
+        self.assertEqual(metrics.get_count("pawn_moves"), 3)
+        self.assertEqual(metrics.get_count("pawn_moves", result="rejected"), 2)
+        self.assertEqual(metrics.get_count("move_types", type="SIMPLE"), 1)
+        self.assertEqual(metrics.get_count("validations", branch="COMPLICATED"), 1)
+        self.assertEqual(metrics.get_count("validations", branch="DIAGONAL"), 0)
+        self.assertEqual(metrics.get_count("fence_attempts", result="accepted"), 2)
+        self.assertEqual(metrics.get_count("fence_attempts", result="rejected"), 1)
+        self.assertGreater(metrics.get_count("node_lookups"), 0)
+
+        # Neither fence is on a bridge, so the fair play checks are answered
+        # from the bridge masks without a search of their own.
+        self.assertEqual(metrics.get_count("path_engine_calls", op="would_seal"), 2)
+        self.assertEqual(metrics.get_count("path_engine_calls", op="add_fence"), 2)
+        self.assertEqual(metrics.get_count("path_searches", op="bridges"), 2)
+        self.assertEqual(metrics.get_count("path_searches", op="seal_check"), 0)
+        self.assertEqual(metrics.get_count("path_searches", op="repair"), 4)
+
+        entry = metrics.snapshot()["fence_attempts"][0]
+        self.assertEqual(entry["labels"], {"result": "accepted"})
+        self.assertGreater(entry["seconds"], 0)
+
+    def test_prometheus_and_disable(self):
+        """
+        Tests the Prometheus text dump, and that a game with metrics turned
+        off records nothing and runs its class's own methods.
+        """
+        q = QuoridorGame()
+        metrics = q.enable_metrics(Metrics())
+        q.move_pawn(1, (4, 1))
+
+        text = metrics.to_prometheus()
+        self.assertIn("# TYPE quoridor_pawn_moves_total counter\n", text)
+        self.assertIn('quoridor_pawn_moves_total{result="accepted"} 1\n', text)
+        self.assertIn('quoridor_node_lookups_seconds_total{method="find_board_node"} ', text)
+
+        q.disable_metrics()
+        q.move_pawn(2, (4, 7))
+        self.assertIsNone(q.get_metrics())
+        self.assertEqual(metrics.get_count("pawn_moves"), 1)
+        self.assertNotIn("move_pawn", vars(q))
+        self.assertNotIn("find_board_node", vars(q.get_game_board()))
+
+        metrics.reset()
+        self.assertEqual(metrics.snapshot(), {})
@@ -0,0 +1,327 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Compact binary Quoridor game records.
+# A record file holds whole games, each as its move codes (see
+# BoardGeometry.describe_move). On a 9 x 9 board every pawn move and every
+# fence fits in one byte. Files can be appended to, read as a stream, or
+# memory-mapped and read by game index through a small index file kept
+# next to them.
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from Quoridor import QuoridorGame
+from Quoridor_state import BoardGeometry, GameState
+
+# The file header: magic, format version, board size, bytes per move code
+# and fences per player.
+FILE_HEADER = struct.Struct("<4sBBBB")
+MAGIC = b"QRDR"
+VERSION = 1
+
+# Each game starts with its number of moves and its winner (0 if unfinished).
+GAME_HEADER = struct.Struct("<HB")
+
+# Array type codes for one and two byte move codes. Codes and index
+# entries are stored little-endian whatever the machine.
+CODE_TYPES = {1: "B", 2: "H"}
+SWAP_BYTES = sys.byteorder != "little"
+
+
+class RecordFormatError(Exception):
+    """
+    Raised when a file is not a Quoridor record file, or doesn't match the
+    board it is being used with.
+    """
+    pass
+
+
+def code_width(size):
+    """
+    Returns the number of bytes one move code of a size x size board takes.
+    """
+    return 1 if 3 * size * size <= 256 else 2
+
+
+def encode_moves(moves, width=1):
+    """
+    Returns a list of move codes packed width bytes each.
+    """
+    codes = array(CODE_TYPES[width], moves)
+    if SWAP_BYTES:
+        codes.byteswap()
+    return codes.tobytes()
+
+
+def decode_moves(data, width=1):
+    """
+    Returns the list of move codes packed into data by encode_moves.
+    """
+    codes = array(CODE_TYPES[width])
+    codes.frombytes(data)
+    if SWAP_BYTES:
+        codes.byteswap()
+    return codes.tolist()
+
+
+def index_path(path):
+    """Returns the path of the index file kept next to a record file"""
+    return path + ".idx"
+
+
+class RecordWriter:
+    """
+    Represents a record file opened for appending games. A new file gets a
+    header for the board; an existing one must have been written for the
+    same board size and fence count.
+    """
+
+    def __init__(self, path, size=9, no_of_fences=10):
+        """
+        Opens path for appending games of a size x size board.
+        """
+        self._size = size
+        self._width = code_width(size)
+        header = FILE_HEADER.pack(MAGIC, VERSION, size, self._width, no_of_fences)
+
+        # An existing file must match the board, and loses any game cut short
+        # by a crash so new games start on a clean boundary.
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            if read_header(path) != header:
+                raise RecordFormatError(path + " was written for a different board")
+            repair(path)
+
+        self._file = open(path, "ab")
+        self._index = open(index_path(path), "ab")
+        if self._file.tell() == 0:
+            self._file.write(header)
+
+    def __enter__(self):
+        """Returns the writer, so it is closed at the end of a with block"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Closes the writer's files"""
+        self.close()
+
+    def close(self):
+        """
+        Flushes and closes the record and index files.
+        """
+        self._file.close()
+        self._index.close()
+
+    def write_game(self, moves, winner=0):
+        """
+        Appends a game given as its list of move codes, player 1's first, and
+        the player who won it (0 if nobody has yet).
+        """
+        offset = self._file.tell()
+        self._file.write(GAME_HEADER.pack(len(moves), winner))
+        self._file.write(encode_moves(moves, self._width))
+        self._index.write(struct.pack("<Q", offset))
+
+    def write_history(self, game):
+        """
+        Appends the moves played so far in a QuoridorGame.
+        """
+        winner = game.get_winner()
+        self.write_game([move for _, move, _ in game.get_history()], winner)
+
+
+def read_header(path):
+    """
+    Returns the raw header of a record file, or raises RecordFormatError if
+    it doesn't start with one.
+    """
+    with open(path, "rb") as record_file:
+        header = record_file.read(FILE_HEADER.size)
+    if len(header) < FILE_HEADER.size or header[:4] != MAGIC:
+        raise RecordFormatError(path + " is not a Quoridor record file")
+    return header
+
+
+class RecordReader:
+    """
+    Represents a record file opened for reading. The file is memory-mapped,
+    so any game can be read by its index without reading the ones before it.
+    """
+
+    def __init__(self, path):
+        """
+        Opens and maps a record file, and loads (or rebuilds) its game index.
+        """
+        _, version, self._size, self._width, self._no_of_fences = FILE_HEADER.unpack(read_header(path))
+        if version != VERSION:
+            raise RecordFormatError(path + " has unknown format version " + str(version))
+
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._offsets = self.load_index(index_path(path))
+
+    def __enter__(self):
+        """Returns the reader, so it is closed at the end of a with block"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Closes the reader's file"""
+        self.close()
+
+    def __len__(self):
+        """Returns the number of games in the file"""
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        """
+        Returns game number index as a (list of move codes, winner) pair.
+        """
+        offset = self._offsets[index]
+        count, winner = GAME_HEADER.unpack_from(self._map, offset)
+        start = offset + GAME_HEADER.size
+        return decode_moves(self._map[start:start + count * self._width], self._width), winner
+
+    def __iter__(self):
+        """Yields every game in the file in order"""
+        for index in range(len(self._offsets)):
+            yield self[index]
+
+    def close(self):
+        """
+        Unmaps and closes the record file.
+        """
+        self._map.close()
+        self._file.close()
+
+    def get_size(self):
+        """Returns the board size the games were played on"""
+        return self._size
+
+    def get_no_of_fences(self):
+        """Returns the number of fences each player started with"""
+        return self._no_of_fences
+
+    def load_index(self, path):
+        """
+        Returns the offset of every complete game. The index file is trusted
+        when its last entry ends exactly at the end of the record file;
+        otherwise the record file is scanned.
+        """
+        offsets = array("Q")
+        if os.path.exists(path):
+            with open(path, "rb") as index_file:
+                data = index_file.read()
+            offsets.frombytes(data[:len(data) // 8 * 8])
+            if SWAP_BYTES:
+                offsets.byteswap()
+        return offsets if self.ends_file(offsets) else self.scan()
+
+    def get_offsets(self):
+        """Returns the offset of every game in the file"""
+        return self._offsets
+
+    def get_end(self):
+        """Returns the offset just past the last complete game"""
+        if not self._offsets:
+            return FILE_HEADER.size
+        count, _ = GAME_HEADER.unpack_from(self._map, self._offsets[-1])
+        return self._offsets[-1] + GAME_HEADER.size + count * self._width
+
+    def ends_file(self, offsets):
+        """
+        Returns True if the last game in offsets ends at the end of the file.
+        """
+        if not offsets:
+            return len(self._map) == FILE_HEADER.size
+        if offsets[-1] + GAME_HEADER.size > len(self._map):
+            return False
+        count, _ = GAME_HEADER.unpack_from(self._map, offsets[-1])
+        return offsets[-1] + GAME_HEADER.size + count * self._width == len(self._map)
+
+    def scan(self):
+        """
+        Returns the offset of every complete game found by walking the file.
+        A game cut short at the end of the file is left out.
+        """
+        offsets = array("Q")
+        offset = FILE_HEADER.size
+        while offset + GAME_HEADER.size <= len(self._map):
+            count, _ = GAME_HEADER.unpack_from(self._map, offset)
+            end = offset + GAME_HEADER.size + count * self._width
+            if end > len(self._map):
+                break
+            offsets.append(offset)
+            offset = end
+        return offsets
+
+
+def repair(path):
+    """
+    Cuts a record file back to its last complete game and rewrites its index
+    file to match.
+    """
+    with RecordReader(path) as reader:
+        offsets = reader.get_offsets()
+        end = reader.get_end()
+
+    if os.path.getsize(path) != end:
+        os.truncate(path, end)
+    if SWAP_BYTES:
+        offsets = array("Q", offsets)
+        offsets.byteswap()
+    with open(index_path(path), "wb") as index_file:
+        index_file.write(offsets.tobytes())
+
+
+def replay_game(moves, game):
+    """
+    Plays a list of move codes into a QuoridorGame through move_pawn and
+    place_fence, player 1 first. Returns True if every move was accepted,
+    False as soon as one isn't.
+    """
+    geometry = BoardGeometry.of_size(game.get_game_board().get_size())
+    for number, move in enumerate(moves):
+        player = 1 + number % 2
+        kind, coord_tuple = geometry.describe_move(move)
+        if kind == "pawn":
+            result = game.move_pawn(player, coord_tuple)
+        else:
+            result = game.place_fence(player, kind, coord_tuple)
+        if result is not True:
+            return False
+    return True
+
+
+def replay_state(moves, state):
+    """
+    Plays a list of move codes into a GameState, checking each one. Returns
+    True if every move was legal, False as soon as one isn't.
+    """
+    for move in moves:
+        if not state.play(move):
+            return False
+    return True
+
+
+def load_game(reader, index):
+    """
+    Returns game number index of a RecordReader replayed into a new
+    QuoridorGame, or False if one of its moves is rejected.
+    """
+    game = QuoridorGame(reader.get_size())
+    no_of_fences = reader.get_no_of_fences()
+    if no_of_fences != game.get_player_1().get_no_of_fences():
+        game.load_position((game.get_player_1().get_home_position(), game.get_player_2().get_home_position()),
+                           [], (no_of_fences, no_of_fences), 1)
+    return game if replay_game(reader[index][0], game) else False
+
+
+def load_state(reader, index):
+    """
+    Returns the final GameState of game number index of a RecordReader, or
+    False if one of its moves is illegal.
+    """
+    state = GameState(reader.get_size(), reader.get_no_of_fences())
+    return state if replay_state(reader[index][0], state) else False
@@ -0,0 +1,138 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Unit Test for the Quoridor game records
+
+import os
+import random
+import tempfile
+import unittest
+from Quoridor import QuoridorGame
+from Quoridor_records import RecordFormatError, RecordReader, RecordWriter, code_width, \
+    decode_moves, encode_moves, load_game, load_state
+from Quoridor_sim import make_policy
+from Quoridor_state import GameState
+
+
+def random_games(count, seed):
+    """Returns count (moves, winner) games of a greedy player against a random one"""
+    rng = random.Random(seed)
+    policies = (make_policy("greedy"), make_policy("random"))
+    games = []
+    for _ in range(count):
+        state = GameState()
+        moves = []
+        while not state.get_winner():
+            moves.append(policies[state.get_whose_move() - 1].choose_move(state, rng))
+            state.make_move(moves[-1])
+        games.append((moves, state.get_winner()))
+    return games
+
+
+class TestRecords(unittest.TestCase):
+    """Contains the unit test for the game record files"""
+
+    def setUp(self):
+        """Makes a folder for the test's record files"""
+        self._folder = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._folder.name, "games.qr")
+
+    def tearDown(self):
+        """Removes the test's record files"""
+        self._folder.cleanup()
+
+    def test_move_codes(self):
+        """
+        Tests that a 9 x 9 board packs each move into one byte and larger
+        boards into two.
+        """
+        self.assertEqual(code_width(9), 1)
+        self.assertEqual(code_width(11), 2)
+        self.assertEqual(len(encode_moves([4, 242, 13])), 3)
+        self.assertEqual(decode_moves(encode_moves([4, 242, 13])), [4, 242, 13])
+        self.assertEqual(decode_moves(encode_moves([362, 1], 2), 2), [362, 1])
+
+    def test_write_and_read(self):
+        """
+        Tests appending games in two sessions and reading them back by index
+        and as a stream.
+        """
+        games = random_games(12, 3)
+
+        with RecordWriter(self._path) as writer:
+            for moves, winner in games[:5]:
+                writer.write_game(moves, winner)
+        with RecordWriter(self._path) as writer:
+            for moves, winner in games[5:]:
+                writer.write_game(moves, winner)
+
+        with RecordReader(self._path) as reader:
+            self.assertEqual(len(reader), 12)
+            self.assertEqual(reader[8], games[8])
+            self.assertEqual(list(reader), games)
+
+        # A file for another board size can't be appended to.
+        self.assertRaises(RecordFormatError, RecordWriter, self._path, 11)
+
+    def test_cut_short_game(self):
+        """
+        Tests that a game cut short at the end of the file is skipped by
+        readers and dropped before the next game is appended.
+        """
+        games = random_games(3, 5)
+        with RecordWriter(self._path) as writer:
+            for moves, winner in games[:2]:
+                writer.write_game(moves, winner)
+
+        with open(self._path, "ab") as record_file:
+            record_file.write(b"\x09\x00\x01\x04")
+
+        with RecordReader(self._path) as reader:
+            self.assertEqual(len(reader), 2)
+
+        with RecordWriter(self._path) as writer:
+            writer.write_game(*games[2])
+        with RecordReader(self._path) as reader:
+            self.assertEqual(list(reader), games)
+
+    def test_replay(self):
+        """
+        Tests that a recorded QuoridorGame replays to the same position into
+        a new game and into a GameState.
+        """
+        q = QuoridorGame()
+        for player, direction, coord in ((1, None, (4, 1)), (2, "h", (4, 2)), (1, None, (3, 1)),
+                                         (2, "v", (3, 1)), (1, None, (3, 2)), (2, None, (4, 7))):
+            if direction is None:
+                self.assertTrue(q.move_pawn(player, coord))
+            else:
+                self.assertTrue(q.place_fence(player, direction, coord))
+
+        with RecordWriter(self._path) as writer:
+            writer.write_history(q)
+            writer.write_game([4, 76, 4], 0)
+
+        with RecordReader(self._path) as reader:
+            self.assertEqual(load_game(reader, 0).to_state(), q.to_state())
+            self.assertEqual(load_state(reader, 0), q.to_state())
+
+            # Player 1 can't move back onto its own square.
+            self.assertFalse(load_game(reader, 1))
+            self.assertFalse(load_state(reader, 1))
+
+    def test_replay_fence_count(self):
+        """
+        Tests that both loaders give each player the record's fence count,
+        rejecting a second fence from a 1-fence record.
+        """
+        geometry = GameState().get_geometry()
+        one_fence = [geometry.fence_move("h", (4, 2)), geometry.fence_move("h", (4, 6))]
+        two_fences = one_fence + [geometry.pawn_move((4, 1)), geometry.fence_move("v", (1, 5))]
+        with RecordWriter(self._path, no_of_fences=1) as writer:
+            writer.write_game(one_fence, 0)
+            writer.write_game(two_fences, 0)
+
+        with RecordReader(self._path) as reader:
+            self.assertEqual(load_game(reader, 0).get_player_1().get_no_of_fences(), 0)
+            self.assertEqual(load_game(reader, 0).to_state(), load_state(reader, 0))
+            self.assertFalse(load_game(reader, 1))
+            self.assertFalse(load_state(reader, 1))
@@ -0,0 +1,302 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Board renderers for Quoridor.
+# The text renderer draws a position in plain ASCII or Unicode box lines,
+# with both pawns, fences of both orientations and the coordinates, and
+# the SVG renderer writes an image directly; neither needs anything outside
+# the standard library. matplotlib is an optional backend, imported only
+# when a plot or a PNG is asked for. BoardFigure keeps one figure with its
+# grid and artists, so many positions can be drawn without rebuilding it.
+
+import sys
+
+# Characters of the text renderer. A cell is three characters wide; fences
+# replace the edge they stand on.
+ASCII = {"corner": "+", "edge": "---", "h_fence": "===", "side": "|", "v_fence": "#",
+         "pawns": (" ", "1", "2")}
+UNICODE = {"corner": "·", "edge": "───", "h_fence": "━━━",
+           "side": "│", "v_fence": "┃", "pawns": (" ", "1", "2")}
+
+
+def position_of(position):
+    """
+    Returns the (size, (p1 square, p2 square), h_walls, v_walls) of a
+    QuoridorGame or a GameState.
+    """
+    if hasattr(position, "get_path_engine"):
+        size = position.get_game_board().get_size()
+        squares = tuple(y * size + x for x, y in (position.get_player_1().get_current_position(),
+                                                  position.get_player_2().get_current_position()))
+        engine = position.get_path_engine()
+        return size, squares, engine.get_h_walls(), engine.get_v_walls()
+    return position.get_size(), (position.get_pawn_square(1), position.get_pawn_square(2)), \
+        position.get_h_walls(), position.get_v_walls()
+
+
+# The lines of an empty board, per (size, charset, coordinates), shared by
+# every render of that board.
+_empty_boards = dict()
+
+
+def empty_board(size, charset, coordinates):
+    """
+    Returns the text lines of an empty board: the coordinate header, then a
+    border line and a row line per row, then the bottom border.
+    """
+    key = (size, charset["corner"], charset["edge"], charset["side"], coordinates)
+    lines = _empty_boards.get(key)
+    if lines is None:
+        margin = " " * (len(str(size - 1)) + 1) if coordinates else ""
+        header = [margin + " " + "".join(" %-3d" % x for x in range(size)).rstrip()] if coordinates else []
+        border = margin + charset["corner"] + (charset["edge"] + charset["corner"]) * size
+        lines = header
+        for y in range(size):
+            label = ("%*d " % (len(margin) - 1, y)) if coordinates else ""
+            lines += [border, label + (charset["side"] + "   ") * size + charset["side"]]
+        lines.append(border)
+        _empty_boards[key] = lines
+    return lines
+
+
+def render_text(size, pawns, h_walls, v_walls, charset=ASCII, coordinates=True):
+    """
+    Returns a position drawn as text, one line per board row and one per
+    border between rows. pawns is the (p1, p2) squares and h_walls and
+    v_walls the fence masks of BoardGeometry: bit s of h_walls is a fence
+    above square s, and bit s of v_walls one to its left. Only the lines
+    with a pawn or a fence on them are drawn; the rest are an empty board's.
+    """
+    lines = list(empty_board(size, charset, coordinates))
+    first = 1 if coordinates else 0
+    margin = len(str(size - 1)) + 1 if coordinates else 0
+    row_mask = (1 << size) - 1
+    pawn_rows = (pawns[0] // size, pawns[1] // size)
+
+    for y in range(size):
+        row = y * size
+        if h_walls >> row & row_mask:
+            lines[first + 2 * y] = lines[first + 2 * y][:margin] + charset["corner"] + "".join(
+                (charset["h_fence"] if h_walls >> (row + x) & 1 else charset["edge"]) + charset["corner"]
+                for x in range(size))
+        if v_walls >> row & row_mask or y in pawn_rows:
+            lines[first + 2 * y + 1] = lines[first + 2 * y + 1][:margin] + draw_row(
+                size, row, pawns, v_walls, charset)
+    return "\n".join(lines) + "\n"
+
+
+def draw_row(size, row, pawns, v_walls, charset):
+    """
+    Returns the cells of the board row starting at square row, with its
+    pawns and the vertical fences on its squares' left sides.
+    """
+    marks = charset["pawns"]
+    cells = []
+    for square in range(row, row + size):
+        mark = marks[1] if square == pawns[0] else marks[2] if square == pawns[1] else marks[0]
+        cells.append((charset["v_fence"] if v_walls >> square & 1 else charset["side"]) + " " + mark + " ")
+    return "".join(cells) + charset["side"]
+
+
+def render(position, unicode=False, coordinates=True):
+    """
+    Returns a QuoridorGame or GameState drawn as ASCII (or Unicode) text.
+    """
+    return render_text(*position_of(position), charset=UNICODE if unicode else ASCII,
+                       coordinates=coordinates)
+
+
+def write_board(position, stream=None, unicode=False, coordinates=True):
+    """
+    Writes a QuoridorGame or GameState as text to stream (standard output
+    by default).
+    """
+    (stream if stream is not None else sys.stdout).write(render(position, unicode, coordinates))
+
+
+# Colours of fences and pawns: fences of unknown owner, then players 1 and 2.
+COLOURS = ("black", "red", "blue")
+
+
+def fence_segment(direction, coord_tuple):
+    """
+    Returns the line segment [[x1, x2], [y1, y2]] of a fence, as
+    Fence.get_segment does.
+    """
+    x, y = coord_tuple
+    if direction == "h":
+        return [[x, x + 1], [y, y]]
+    return [[x, x], [y, y + 1]]
+
+
+def mask_segments(size, walls, direction):
+    """Returns the segments of the fences in a fence mask"""
+    segments = []
+    while walls:
+        low_bit = walls & -walls
+        square = low_bit.bit_length() - 1
+        segments.append(fence_segment(direction, (square % size, square // size)))
+        walls ^= low_bit
+    return segments
+
+
+def picture_of(position):
+    """
+    Returns what the image renderers draw of a QuoridorGame or GameState:
+    (size, (p1, p2) pawn coordinates, (fences of unknown owner, player 1's
+    fences, player 2's fences)) with fences as segments. A GameState doesn't
+    know who placed its fences.
+    """
+    if hasattr(position, "get_path_engine"):
+        players = (position.get_player_1(), position.get_player_2())
+        return (position.get_game_board().get_size(),
+                tuple(tuple(player.get_current_position()) for player in players),
+                ([],) + tuple(player.get_fences() for player in players))
+    size = position.get_size()
+    fences = mask_segments(size, position.get_h_walls(), "h") + mask_segments(size, position.get_v_walls(), "v")
+    return size, (position.get_pawn(1), position.get_pawn(2)), (fences, [], [])
+
+
+# The opening of an SVG image with an empty board, per (size, cell).
+_svg_boards = dict()
+
+
+def svg_board(size, cell):
+    """
+    Returns the start of an SVG image of an empty size x size board with
+    cells of cell pixels: the white background and the grid lines.
+    """
+    key = (size, cell)
+    start = _svg_boards.get(key)
+    if start is None:
+        side = size * cell
+        pad = cell // 4
+        grid = " ".join("M%d 0V%dM0 %dH%d" % (i * cell, side, i * cell, side) for i in range(size + 1))
+        start = ('<svg xmlns="http://www.w3.org/2000/svg" width="%d" height="%d" viewBox="%d %d %d %d">'
+                 % (side + 2 * pad, side + 2 * pad, -pad, -pad, side + 2 * pad, side + 2 * pad) +
+                 '<rect x="%d" y="%d" width="%d" height="%d" fill="white"/>' % (-pad, -pad, side + 2 * pad,
+                                                                                 side + 2 * pad) +
+                 '<path d="%s" stroke="#c8c8c8" stroke-width="1" fill="none"/>' % grid)
+        _svg_boards[key] = start
+    return start
+
+
+def render_svg(picture, cell=32):
+    """
+    Returns an SVG image of a picture_of result, with cells of cell pixels.
+    """
+    size, pawns, fences = picture
+    parts = [svg_board(size, cell)]
+    for owner, segments in enumerate(fences):
+        if segments:
+            path = "".join("M%d %dL%d %d" % (xs[0] * cell, ys[0] * cell, xs[1] * cell, ys[1] * cell)
+                           for xs, ys in segments)
+            parts.append('<path d="%s" stroke="%s" stroke-width="%d" stroke-linecap="round"/>'
+                         % (path, COLOURS[owner], max(cell // 6, 1)))
+    for player, (x, y) in enumerate(pawns, 1):
+        parts.append('<circle cx="%g" cy="%g" r="%g" fill="%s"/>'
+                     % ((x + 0.5) * cell, (y + 0.5) * cell, 0.3 * cell, COLOURS[player]))
+    parts.append("</svg>\n")
+    return "".join(parts)
+
+
+class BoardFigure:
+    """
+    Represents a matplotlib figure of a board, drawn with the
+    non-interactive Agg canvas. The grid is drawn once; each draw only moves
+    the pawn markers and swaps the fence segments, so one figure can render
+    any number of positions of its board size.
+    """
+
+    def __init__(self, size=9, inches=3.0, dpi=100):
+        """
+        Creates the figure of a size x size board, inches square at dpi.
+        """
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.collections import LineCollection
+        from matplotlib.figure import Figure
+
+        self._size = size
+        self._figure = Figure(figsize=(inches, inches), dpi=dpi)
+        FigureCanvasAgg(self._figure)
+        axes = self._figure.add_axes((0.02, 0.02, 0.96, 0.96))
+        axes.set_xlim(0, size)
+        axes.set_ylim(size, 0)
+        axes.set_xticks(range(size + 1))
+        axes.set_yticks(range(size + 1))
+        axes.tick_params(length=0, labelbottom=False, labelleft=False)
+        axes.grid(True, color="#c8c8c8")
+        axes.set_aspect("equal")
+
+        self._fences = [axes.add_collection(LineCollection([], colors=colour, linewidths=3, capstyle="round"))
+                        for colour in COLOURS]
+        # Pawn markers are sized in points: a bit over half a cell across.
+        self._pawns = [axes.plot([], [], "o", color=colour, markersize=0.55 * 72 * inches / size)[0]
+                       for colour in COLOURS[1:]]
+
+    def get_size(self):
+        """Returns the board size of the figure"""
+        return self._size
+
+    def get_figure(self):
+        """Returns the matplotlib Figure"""
+        return self._figure
+
+    def draw(self, picture):
+        """
+        Moves the figure's artists to a picture_of result of its board size.
+        """
+        _, pawns, fences = picture
+        for marker, (x, y) in zip(self._pawns, pawns):
+            marker.set_data([x + 0.5], [y + 0.5])
+        for collection, segments in zip(self._fences, fences):
+            collection.set_segments([list(zip(xs, ys)) for xs, ys in segments])
+
+    def save(self, target, image_format=None):
+        """
+        Writes the figure to a path or binary stream, as PNG, SVG or any
+        other format matplotlib knows (by default from the path's extension).
+        """
+        self._figure.savefig(target, format=image_format)
+
+
+def save_board(position, target, image_format="svg", cell=32):
+    """
+    Writes an image of a QuoridorGame or GameState to a path or stream.
+    "svg" is written directly; other formats, such as "png", are drawn
+    with matplotlib.
+    """
+    picture = picture_of(position)
+    if image_format == "svg":
+        text = render_svg(picture, cell)
+        if hasattr(target, "write"):
+            target.write(text)
+        else:
+            with open(target, "w") as image_file:
+                image_file.write(text)
+    else:
+        figure = BoardFigure(picture[0])
+        figure.draw(picture)
+        figure.save(target, image_format)
+
+
+def plot_board(game):
+    """
+    Plots a QuoridorGame with matplotlib and shows the plot: the grid, each
+    player's pawn and fences in their own colour. matplotlib is imported
+    here, so it is only needed when a plot is asked for.
+    """
+    import matplotlib.pyplot as pyplt
+
+    size = game.get_game_board().get_size()
+    pyplt.xlim([0, size])
+    pyplt.ylim([size, 0])
+    pyplt.grid("on")
+
+    for player, colour in ((game.get_player_1(), "r"), (game.get_player_2(), "b")):
+        location = player.get_current_position()
+        pyplt.plot(location[0] + 0.5, location[1] + 0.5, colour + "o", label="P" + str(player.get_player_name()))
+        for segment in player.get_fences():
+            pyplt.plot(segment[0], segment[1], "-" + colour + "o")
+
+    pyplt.legend()
+    pyplt.show()
@@ -0,0 +1,119 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Unit Test for the Quoridor board renderers
+
+import importlib.util
+import io
+import os
+import sys
+import tempfile
+import unittest
+from Quoridor import QuoridorGame
+from Quoridor_render import BoardFigure, picture_of, render, render_svg, save_board, write_board
+
+HAS_MATPLOTLIB = importlib.util.find_spec("matplotlib") is not None
+
+
+class TestRender(unittest.TestCase):
+    """Contains the unit test for the board renderers"""
+
+    def test_text_board(self):
+        """
+        Tests the ASCII drawing of a 5 x 5 game with a fence of each kind, and
+        that a game and its GameState draw the same.
+        """
+        q = QuoridorGame(5)
+        q.move_pawn(1, (2, 1))
+        q.place_fence(2, "h", (1, 3))
+        q.place_fence(1, "v", (4, 4))
+
+        self.assertEqual(str(q), "    0   1   2   3   4\n"
+                                 "  +---+---+---+---+---+\n"
+                                 "0 |   |   |   |   |   |\n"
+                                 "  +---+---+---+---+---+\n"
+                                 "1 |   |   | 1 |   |   |\n"
+                                 "  +---+---+---+---+---+\n"
+                                 "2 |   |   |   |   |   |\n"
+                                 "  +---+===+---+---+---+\n"
+                                 "3 |   |   |   |   |   |\n"
+                                 "  +---+---+---+---+---+\n"
+                                 "4 |   |   | 2 |   #   |\n"
+                                 "  +---+---+---+---+---+\n")
+        self.assertEqual(render(q.to_state()), str(q))
+
+        lines = render(q, unicode=True, coordinates=False).splitlines()
+        self.assertEqual(lines[6], "·───·━━━·───·───·───·")
+        self.assertEqual(lines[9], "│   │   │ 2 │   ┃   │")
+
+        # Two digit rows get a wider margin.
+        lines = render(QuoridorGame(11)).splitlines()
+        self.assertEqual(lines[0][:7], "     0 ")
+        self.assertEqual(lines[-2][:5], "10 | ")
+
+    def test_streams_and_backends(self):
+        """
+        Tests writing the board to a stream through write_board and
+        print_board, without matplotlib being imported.
+        """
+        q = QuoridorGame()
+        imported = "matplotlib" in sys.modules
+        stream = io.StringIO()
+        write_board(q, stream)
+        q.print_board("text", stream, unicode=True)
+
+        text = stream.getvalue()
+        self.assertEqual(text, str(q) + render(q, unicode=True))
+        self.assertEqual(text.count("\n"), 2 * 20)
+        self.assertEqual("matplotlib" in sys.modules, imported)
+        self.assertRaises(ValueError, q.print_board, "ascii")
+
+    def test_svg(self):
+        """
+        Tests the SVG image of a game, drawn with no matplotlib: each player's
+        fences and pawn in their colour, and a GameState's fences in black.
+        """
+        q = QuoridorGame()
+        q.place_fence(1, "v", (5, 7))
+        q.place_fence(2, "h", (4, 2))
+        imported = "matplotlib" in sys.modules
+
+        stream = io.StringIO()
+        q.print_board("svg", stream)
+        image = stream.getvalue()
+        self.assertEqual(image, render_svg(picture_of(q)))
+        self.assertTrue(image.startswith("<svg ") and image.endswith("</svg>\n"))
+        self.assertIn('<path d="M160 224L160 256" stroke="red"', image)
+        self.assertIn('<path d="M128 64L160 64" stroke="blue"', image)
+        self.assertIn('<circle cx="144" cy="272" r="9.6" fill="blue"/>', image)
+
+        picture = picture_of(q.to_state())
+        self.assertEqual(picture[2], ([[[4, 5], [2, 2]], [[5, 5], [7, 8]]], [], []))
+        self.assertIn('stroke="black"', render_svg(picture, cell=16))
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "board.svg")
+            q.print_board("svg", path=path)
+            with open(path) as image_file:
+                self.assertEqual(image_file.read(), image)
+        self.assertEqual("matplotlib" in sys.modules, imported)
+
+    @unittest.skipIf(not HAS_MATPLOTLIB, "matplotlib is not installed")
+    def test_figure(self):
+        """
+        Tests that one BoardFigure draws several positions as PNG, and that
+        print_board saves a PNG without opening a window.
+        """
+        figure = BoardFigure(9)
+        q = QuoridorGame()
+        for _ in range(2):
+            figure.draw(picture_of(q))
+            image = io.BytesIO()
+            figure.save(image, "png")
+            self.assertEqual(image.getvalue()[:8], b"\x89PNG\r\n\x1a\n")
+            q.place_fence(q.get_whose_move(), "h", (4, 4 + q.get_whose_move()))
+        self.assertEqual(len(figure.get_figure().axes[0].collections), 3)
+
+        with tempfile.TemporaryDirectory() as folder:
+            q.print_board(path=os.path.join(folder, "board.png"))
+            save_board(q, os.path.join(folder, "state.png"), "png")
+            self.assertEqual(sorted(os.listdir(folder)), ["board.png", "state.png"])
@@ -0,0 +1,158 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Replay and validation of recorded Quoridor games.
+# Checks move sequences end to end: turn order, the legality of every move,
+# no moves after a win, and the recorded winner. The full path replays
+# through QuoridorGame.move_pawn and place_fence; the fast path replays on a
+# GameState and skips the linked-list board entirely. Batches can be spread
+# over a process pool.
+
+import argparse
+import json
+import multiprocessing
+import os
+
+from Quoridor import QuoridorGame
+from Quoridor_records import RecordReader
+from Quoridor_state import BoardGeometry, GameState
+
+# Why a game failed validation.
+WRONG_PLAYER = "wrong player"
+ILLEGAL_MOVE = "illegal move"
+MOVE_AFTER_WIN = "move after the game was won"
+WRONG_WINNER = "wrong winner"
+
+
+def split_move(number, move):
+    """
+    Returns the (player, move code) of move number of a game. A move is
+    either a move code, played by whoever's turn it is, or a (player, move
+    code) pair.
+    """
+    if isinstance(move, tuple):
+        return move
+    return 1 + number % 2, move
+
+
+def result(move, reason, winner):
+    """
+    Returns a validation result: the index of the first bad move (-1 if
+    none), why it is bad ("" if nothing is) and who won (0 if nobody).
+    """
+    return {"valid": not reason, "move": move, "reason": reason, "winner": winner}
+
+
+def validate_game(moves, size=9, winner=None, no_of_fences=10):
+    """
+    Replays a game through QuoridorGame, with no_of_fences fences a player,
+    and returns its validation result. If winner is given, the game must end
+    won by that player (0 for an unfinished game).
+    """
+    game = QuoridorGame(size)
+    if no_of_fences != game.get_player_1().get_no_of_fences():
+        game.load_position((game.get_player_1().get_home_position(), game.get_player_2().get_home_position()),
+                           [], (no_of_fences, no_of_fences), 1)
+    geometry = BoardGeometry.of_size(size)
+    for number, move in enumerate(moves):
+        player, code = split_move(number, move)
+        if game.get_winner():
+            return result(number, MOVE_AFTER_WIN, game.get_winner())
+        if player != game.get_whose_move():
+            return result(number, WRONG_PLAYER, 0)
+
+        kind, coord_tuple = geometry.describe_move(code) if 0 <= code < 3 * size * size else (None, None)
+        if kind == "pawn":
+            played = game.move_pawn(player, coord_tuple)
+        else:
+            played = kind is not None and game.place_fence(player, kind, coord_tuple)
+        if played is not True:
+            return result(number, ILLEGAL_MOVE, 0)
+
+    return check_winner(len(moves), game.get_winner(), winner)
+
+
+def validate_state(moves, size=9, winner=None, no_of_fences=10):
+    """
+    Replays a game on a GameState and returns its validation result, the
+    same one validate_game gives.
+    """
+    state = GameState(size, no_of_fences)
+    for number, move in enumerate(moves):
+        player, code = split_move(number, move)
+        if state.get_winner():
+            return result(number, MOVE_AFTER_WIN, state.get_winner())
+        if player != state.get_whose_move():
+            return result(number, WRONG_PLAYER, 0)
+        if not state.play(code):
+            return result(number, ILLEGAL_MOVE, 0)
+
+    return check_winner(len(moves), state.get_winner(), winner)
+
+
+def check_winner(count, final, winner):
+    """
+    Returns the result of a game whose moves were all legal, given who won
+    it and who was recorded as winning it (None if not recorded).
+    """
+    if winner is not None and winner != final:
+        return result(count, WRONG_WINNER, final)
+    return result(-1, "", final)
+
+
+def validate_job(job):
+    """
+    Validates a list of (moves, winner) games. job is a (games, size,
+    no_of_fences, fast) tuple so it can be sent to a worker process.
+    """
+    games, size, no_of_fences, fast = job
+    if fast:
+        return [validate_state(moves, size, winner, no_of_fences) for moves, winner in games]
+    return [validate_game(moves, size, winner, no_of_fences) for moves, winner in games]
+
+
+def validate_batch(games, size=9, no_of_fences=10, fast=True, workers=1, chunk_size=500):
+    """
+    Validates a list of (moves, winner) games and returns their results in
+    order. fast picks the GameState path; workers above 1 spreads the games
+    over a process pool.
+    """
+    if workers == 1:
+        return validate_job((games, size, no_of_fences, fast))
+
+    jobs = [(games[start:start + chunk_size], size, no_of_fences, fast)
+            for start in range(0, len(games), chunk_size)]
+    with multiprocessing.Pool(workers) as pool:
+        return [outcome for chunk in pool.map(validate_job, jobs) for outcome in chunk]
+
+
+def validate_file(path, fast=True, workers=1):
+    """
+    Validates every game of a record file. Returns a summary: the number of
+    games, the number that failed, wins per player, and the index and
+    result of each game that failed.
+    """
+    with RecordReader(path) as reader:
+        games = list(reader)
+        outcomes = validate_batch(games, reader.get_size(), reader.get_no_of_fences(), fast, workers)
+
+    failures = {index: outcome for index, outcome in enumerate(outcomes) if not outcome["valid"]}
+    wins = [0, 0, 0]
+    for outcome in outcomes:
+        wins[outcome["winner"]] += 1
+    return {"games": len(outcomes), "failed": len(failures),
+            "wins": {"1": wins[1], "2": wins[2], "unfinished": wins[0]}, "failures": failures}
+
+
+def main():
+    """Validates a record file from the command line, will not run if imported"""
+    parser = argparse.ArgumentParser(description="Validate the games of a Quoridor record file.")
+    parser.add_argument("path")
+    parser.add_argument("--full", action="store_true", help="replay through QuoridorGame")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    print(json.dumps(validate_file(args.path, not args.full, args.workers), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Unit Test for the Quoridor replay and validation tool
+
+import os
+import tempfile
+import unittest
+from Quoridor_records import RecordWriter
+from Quoridor_records_test import random_games
+from Quoridor_replay import ILLEGAL_MOVE, MOVE_AFTER_WIN, WRONG_PLAYER, WRONG_WINNER, \
+    validate_batch, validate_file, validate_game, validate_state
+from Quoridor_state import BoardGeometry
+
+
+class TestReplay(unittest.TestCase):
+    """Contains the unit test for the replay and validation tool"""
+
+    def test_valid_games(self):
+        """
+        Tests that the full and fast paths pass the same finished games and
+        find the same winners, in one process and over two.
+        """
+        games = random_games(20, 13)
+        full = validate_batch(games, fast=False)
+        fast = validate_batch(games, fast=True)
+
+        self.assertEqual(full, fast)
+        self.assertTrue(all(outcome["valid"] for outcome in fast))
+        self.assertEqual([outcome["winner"] for outcome in fast], [winner for _, winner in games])
+        self.assertEqual(validate_batch(games, workers=2, chunk_size=6), fast)
+
+    def test_bad_games(self):
+        """
+        Tests that both paths find the first bad move of a game and say why.
+        """
+        geometry = BoardGeometry.of_size(9)
+        up, down = geometry.pawn_move((4, 1)), geometry.pawn_move((4, 7))
+        fence = geometry.fence_move("h", (6, 5))
+
+        for validate in (validate_game, validate_state):
+            self.assertEqual(validate([up, down, fence, 999])["move"], 3)
+            self.assertEqual(validate([up, down, fence, 999])["reason"], ILLEGAL_MOVE)
+            self.assertEqual(validate([up, fence, fence])["reason"], ILLEGAL_MOVE)
+            self.assertEqual(validate([(1, up), (1, fence)])["reason"], WRONG_PLAYER)
+            self.assertEqual(validate([up, down], winner=1)["reason"], WRONG_WINNER)
+            self.assertTrue(validate([(1, up), (2, down), (1, fence)], winner=0)["valid"])
+
+        # Nothing may be played once the game is won.
+        moves, winner = random_games(1, 2)[0]
+        outcome = validate_state(moves + [moves[-2]])
+        self.assertEqual([outcome["move"], outcome["reason"], outcome["winner"]],
+                         [len(moves), MOVE_AFTER_WIN, winner])
+
+    def test_fence_count(self):
+        """
+        Tests that both paths, and a record file, play by a fence count other
+        than 10.
+        """
+        geometry = BoardGeometry.of_size(9)
+        fences = [geometry.fence_move("h", (x, y)) for y in (2, 6) for x in range(6)]
+        moves = [fences[i // 2 + 6 * (i % 2)] for i in range(12)]
+
+        for validate in (validate_game, validate_state):
+            self.assertTrue(validate(moves[:4], no_of_fences=2)["valid"])
+            self.assertEqual(validate(moves[:5], no_of_fences=2)["reason"], ILLEGAL_MOVE)
+            self.assertTrue(validate(moves, no_of_fences=12)["valid"])
+        self.assertEqual(validate_batch([(moves, 0)], no_of_fences=6, fast=False),
+                         validate_batch([(moves, 0)], no_of_fences=6))
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "games.qr")
+            with RecordWriter(path, no_of_fences=3) as writer:
+                writer.write_game(moves[:6], 0)
+                writer.write_game(moves[:7], 0)
+            for fast in (False, True):
+                summary = validate_file(path, fast)
+                self.assertEqual(list(summary["failures"]), [1])
+                self.assertEqual(summary["failures"][1]["move"], 6)
+
+    def test_validate_file(self):
+        """
+        Tests the summary of a record file holding one bad game.
+        """
+        games = random_games(5, 21)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "games.qr")
+            with RecordWriter(path) as writer:
+                for moves, winner in games:
+                    writer.write_game(moves, winner)
+                writer.write_game(games[0][0], 3 - games[0][1])
+
+            summary = validate_file(path)
+
+        self.assertEqual([summary["games"], summary["failed"]], [6, 1])
+        self.assertEqual(list(summary["failures"]), [5])
+        self.assertEqual(summary["failures"][5]["reason"], WRONG_WINNER)
+        self.assertEqual(summary["wins"]["1"] + summary["wins"]["2"], 6)
@@ -0,0 +1,323 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Asyncio host for many Quoridor games.
+# Clients talk to the server over TCP, one JSON object per line. Requests
+# are routed to QuoridorGame objects by game id, and everyone watching a
+# game is sent its new state after every move, until the game is ended
+# and forgotten. Engine moves are searched in a process pool so the event
+# loop only ever does quick game updates.
+
+import asyncio
+import concurrent.futures
+import itertools
+import json
+
+from Quoridor import QuoridorGame
+from Quoridor_engine import SearchEngine
+from Quoridor_state import MIN_BOARD_SIZE
+
+# The largest board a client may ask for. A game is built on the event
+# loop, in time that grows with the square of its size.
+MAX_BOARD_SIZE = 19
+
+# A watcher with more than this many bytes of pushes waiting to be sent is
+# too slow to keep up, and stops being sent them.
+WATCHER_BUFFER_LIMIT = 1 << 20
+
+
+def engine_move(state, time_budget):
+    """
+    Returns the move code the search engine picks for state. Runs in a worker
+    process.
+    """
+    return SearchEngine(time_budget=time_budget).choose_move(state)
+
+
+def board_size(request):
+    """
+    Returns the board size a request asks for (9 if none), or raises
+    ValueError if it isn't an int from MIN_BOARD_SIZE to MAX_BOARD_SIZE.
+    """
+    size = request.get("size", 9)
+    if isinstance(size, bool) or not isinstance(size, int) or not MIN_BOARD_SIZE <= size <= MAX_BOARD_SIZE:
+        raise ValueError("size must be an int from " + str(MIN_BOARD_SIZE) + " to " + str(MAX_BOARD_SIZE))
+    return size
+
+
+def coordinate(request, key):
+    """
+    Returns the [x, y] pair under key in a request as a tuple, or raises
+    ValueError if it isn't a pair of ints.
+    """
+    value = request[key]
+    if not isinstance(value, list) or len(value) != 2 or \
+            any(isinstance(part, bool) or not isinstance(part, int) for part in value):
+        raise ValueError(key + " must be an [x, y] pair of ints")
+    return tuple(value)
+
+
+def player_of(request):
+    """
+    Returns the player number of a request, or raises ValueError if it isn't
+    the int 1 or 2.
+    """
+    player = request["player"]
+    if isinstance(player, bool) or not isinstance(player, int) or player not in (1, 2):
+        raise ValueError("player must be 1 or 2")
+    return player
+
+
+async def read_request(reader):
+    """
+    Returns the next request line of a client, b"" once it has disconnected,
+    or None for a line over the reader's limit. Such a line is read to its
+    end and thrown away, so the next request is read whole.
+    """
+    try:
+        return await reader.readuntil(b"\n")
+    except asyncio.IncompleteReadError as error:
+        return error.partial
+    except asyncio.LimitOverrunError as error:
+        consumed = error.consumed
+    while True:
+        await reader.readexactly(consumed)
+        try:
+            await reader.readuntil(b"\n")
+            return None
+        except asyncio.LimitOverrunError as error:
+            consumed = error.consumed
+
+
+def describe_game(game):
+    """
+    Returns the public state of a game as a JSON-ready dict.
+    """
+    players = (game.get_player_1(), game.get_player_2())
+    return {"pawns": [list(player.get_current_position()) for player in players],
+            "fences_left": [player.get_no_of_fences() for player in players],
+            "fences": [[list(end) for end in zip(*segment)]
+                       for player in players for segment in player.get_fences()],
+            "whose_move": game.get_whose_move(), "winner": game.get_winner(),
+            "moves": len(game.get_history())}
+
+
+class GameServer:
+    """
+    Represents a TCP server hosting QuoridorGame sessions. Each request is a
+    JSON object with an "op" and is answered with a JSON object with "ok";
+    a request's "id", if any, is echoed in its answer.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, workers=None, engine_budget=0.1,
+                 watcher_buffer_limit=WATCHER_BUFFER_LIMIT):
+        """
+        Creates a server for host and port (0 picks a free port). Engine moves
+        are searched on workers processes for engine_budget seconds, and
+        watchers are dropped once watcher_buffer_limit bytes back up.
+        """
+        self._host = host
+        self._port = port
+        self._engine_budget = engine_budget
+        self._watcher_buffer_limit = watcher_buffer_limit
+        self._executor = concurrent.futures.ProcessPoolExecutor(workers)
+        self._server = None
+
+        # The task serving each connected client.
+        self._clients = set()
+
+        self._games = dict()
+        self._watchers = dict()
+        self._game_ids = itertools.count(1)
+
+        self._handlers = {"new": self.new_game, "state": self.get_state, "move": self.move_pawn,
+                          "fence": self.place_fence, "engine": self.engine_move, "watch": self.watch,
+                          "end": self.end_game}
+
+    async def start(self):
+        """
+        Starts listening for clients.
+        """
+        self._server = await asyncio.start_server(self.serve_client, self._host, self._port)
+        self._port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        """
+        Stops listening and shuts down the engine workers.
+        """
+        if self._server is not None:
+            self._server.close()
+        for task in list(self._clients):
+            task.cancel()
+        await asyncio.gather(*self._clients, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+        self._executor.shutdown(cancel_futures=True)
+
+    def get_port(self):
+        """Returns the port the server listens on"""
+        return self._port
+
+    def get_game(self, game_id):
+        """Returns the QuoridorGame of a game id, or None"""
+        return self._games.get(game_id)
+
+    def get_watchers(self, game_id):
+        """Returns the stream writers of everyone watching a game"""
+        return frozenset(self._watchers.get(game_id, ()))
+
+    def add_watcher(self, game_id, writer):
+        """Sends a game's new state to a stream writer after every move"""
+        self._watchers[game_id].add(writer)
+
+    async def serve_client(self, reader, writer):
+        """
+        Answers one client's requests until it disconnects or the server
+        closes.
+        """
+        task = asyncio.current_task()
+        self._clients.add(task)
+        try:
+            while True:
+                line = await read_request(reader)
+                if line is None:
+                    await self.send(writer, {"ok": False, "error": "request line too long"})
+                    continue
+                if not line:
+                    break
+                answer = await self.handle(line, writer)
+                await self.send(writer, answer)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            self._clients.discard(task)
+            for watchers in self._watchers.values():
+                watchers.discard(writer)
+            writer.close()
+
+    async def handle(self, line, writer):
+        """
+        Returns the answer to one request line.
+        """
+        request = None
+        try:
+            request = json.loads(line)
+            handler = self._handlers[request["op"]]
+            answer = await handler(request, writer)
+        except (ValueError, KeyError, TypeError) as error:
+            answer = {"ok": False, "error": "bad request: " + repr(error)}
+        except Exception as error:
+            # Whatever went wrong, the client gets an answer and keeps its
+            # connection.
+            answer = {"ok": False, "error": "server error: " + repr(error)}
+
+        if isinstance(request, dict) and "id" in request:
+            answer["id"] = request["id"]
+        return answer
+
+    async def send(self, writer, message):
+        """Writes one JSON message to a client"""
+        writer.write(json.dumps(message).encode() + b"\n")
+        await writer.drain()
+
+    async def new_game(self, request, writer):
+        """Starts a new game and answers with its id and state"""
+        size = board_size(request)
+        game_id = next(self._game_ids)
+        self._games[game_id] = QuoridorGame(size)
+        self._watchers[game_id] = set()
+        return {"ok": True, "game": game_id, "state": describe_game(self._games[game_id])}
+
+    async def get_state(self, request, writer):
+        """Answers with a game's state"""
+        return {"ok": True, "game": request["game"], "state": describe_game(self._games[request["game"]])}
+
+    async def watch(self, request, writer):
+        """Sends the client a game's state after every move from now on"""
+        self.add_watcher(request["game"], writer)
+        return await self.get_state(request, writer)
+
+    async def end_game(self, request, writer):
+        """
+        Ends a game: its watchers are told, and the server forgets it.
+        """
+        game_id = request["game"]
+        state = describe_game(self._games[game_id])
+        self.push_to_watchers(game_id, {"event": "end", "game": game_id, "state": state})
+        del self._games[game_id]
+        del self._watchers[game_id]
+        return {"ok": True, "game": game_id, "state": state}
+
+    async def move_pawn(self, request, writer):
+        """Plays a pawn move; answers with what move_pawn returned"""
+        game = self._games[request["game"]]
+        played = game.move_pawn(player_of(request), coordinate(request, "to"))
+        return await self.after_move(request["game"], played)
+
+    async def place_fence(self, request, writer):
+        """Places a fence; answers with what place_fence returned"""
+        game = self._games[request["game"]]
+        played = game.place_fence(player_of(request), request["direction"], coordinate(request, "at"))
+        return await self.after_move(request["game"], played)
+
+    async def engine_move(self, request, writer):
+        """
+        Has the search engine play for whoever is to move. The search runs in
+        a worker process; if the game moved on or ended in the meantime, the
+        engine's move is dropped.
+        """
+        game_id = request["game"]
+        game = self._games[game_id]
+        state = game.to_state()
+        loop = asyncio.get_running_loop()
+        move = await loop.run_in_executor(self._executor, engine_move, state, self._engine_budget)
+
+        if move < 0 or self._games.get(game_id) is not game or game.get_zobrist_key() != state.get_zobrist_key():
+            return {"ok": False, "game": game_id, "error": "no engine move for this position"}
+
+        kind, coord_tuple = state.get_geometry().describe_move(move)
+        if kind == "pawn":
+            played = game.move_pawn(state.get_whose_move(), coord_tuple)
+        else:
+            played = game.place_fence(state.get_whose_move(), kind, coord_tuple)
+        answer = await self.after_move(game_id, played)
+        answer["move"] = [kind, list(coord_tuple)]
+        return answer
+
+    async def after_move(self, game_id, played):
+        """
+        Returns the answer to a move request. If the move was played, the
+        watchers are sent the new state once the answer is on its way.
+        """
+        state = describe_game(self._games[game_id])
+        if played is True and self._watchers[game_id]:
+            push = {"event": "state", "game": game_id, "state": state}
+            asyncio.get_running_loop().call_soon(self.push_to_watchers, game_id, push)
+        return {"ok": played is True, "game": game_id, "result": played, "state": state}
+
+    def push_to_watchers(self, game_id, message):
+        """
+        Writes one JSON message to everyone watching a game, without waiting
+        for any of them to take it. Watchers that have disconnected, or that
+        have more than the buffer limit still unsent, are dropped.
+        """
+        data = json.dumps(message).encode() + b"\n"
+        watchers = self._watchers[game_id]
+        for watcher in list(watchers):
+            if watcher.is_closing() or watcher.transport.get_write_buffer_size() > self._watcher_buffer_limit:
+                watchers.discard(watcher)
+            else:
+                watcher.write(data)
+
+
+async def serve(host="127.0.0.1", port=8765, workers=None):
+    """Runs a server until it is cancelled"""
+    server = GameServer(host, port, workers)
+    await server.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(serve())
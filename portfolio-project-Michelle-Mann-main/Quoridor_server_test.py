@@ -0,0 +1,191 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Unit Test for the Quoridor game server
+
+import asyncio
+import json
+import unittest
+from Quoridor_server import WATCHER_BUFFER_LIMIT, GameServer
+
+
+class StalledWatcher:
+    """
+    Stands in for the stream writer of a watcher who never reads: its drain
+    never finishes, and buffered bytes are waiting to be sent to it.
+    """
+
+    def __init__(self, buffered):
+        """Creates a watcher with buffered bytes unsent"""
+        self.transport = self
+        self._buffered = buffered
+        self._messages = []
+
+    def get_messages(self):
+        """Returns the messages written to the watcher"""
+        return self._messages
+
+    def get_write_buffer_size(self):
+        """Returns the bytes waiting to be sent"""
+        return self._buffered
+
+    def is_closing(self):
+        """Returns False: the watcher never disconnects"""
+        return False
+
+    def write(self, data):
+        """Keeps a message written to the watcher"""
+        self._messages.append(json.loads(data))
+
+    async def drain(self):
+        """Waits forever"""
+        await asyncio.Event().wait()
+
+
+class TestServer(unittest.IsolatedAsyncioTestCase):
+    """Contains the unit test for the game server"""
+
+    async def asyncSetUp(self):
+        """Starts a server on a free local port"""
+        self._server = GameServer(workers=1, engine_budget=0.02)
+        await self._server.start()
+        self._clients = []
+
+    async def asyncTearDown(self):
+        """Disconnects the test's clients and stops the server"""
+        for _, writer in self._clients:
+            writer.close()
+        await self._server.close()
+
+    async def connect(self):
+        """Returns a new client connection as a (reader, writer) pair"""
+        client = await asyncio.open_connection("127.0.0.1", self._server.get_port())
+        self._clients.append(client)
+        return client
+
+    async def ask(self, client, request):
+        """Sends a request and returns the next message from the server"""
+        client[1].write(json.dumps(request).encode() + b"\n")
+        await client[1].drain()
+        return json.loads(await client[0].readline())
+
+    async def test_play_a_game(self):
+        """
+        Tests starting a game, playing moves and fences into it and getting
+        the README's answers back.
+        """
+        client = await self.connect()
+        game_id = (await self.ask(client, {"op": "new", "id": 7}))["game"]
+
+        answer = await self.ask(client, {"op": "move", "game": game_id, "player": 1, "to": [4, 1], "id": 8})
+        self.assertEqual([answer["ok"], answer["id"], answer["state"]["pawns"]], [True, 8, [[4, 1], [4, 8]]])
+
+        answer = await self.ask(client, {"op": "move", "game": game_id, "player": 1, "to": [4, 2]})
+        self.assertEqual([answer["ok"], answer["result"]], [False, False])
+
+        answer = await self.ask(client, {"op": "fence", "game": game_id, "player": 2,
+                                         "direction": "h", "at": [6, 5]})
+        self.assertEqual(answer["state"]["fences_left"], [10, 9])
+        self.assertEqual(answer["state"]["fences"], [[[6, 5], [7, 5]]])
+
+        answer = await self.ask(client, {"op": "move", "game": 99, "player": 1, "to": [4, 2]})
+        self.assertFalse(answer["ok"])
+        self.assertIn("bad request", answer["error"])
+
+    async def test_bad_requests(self):
+        """
+        Tests that malformed coordinates and board sizes are answered with an
+        error, and that the client's connection stays open after them.
+        """
+        client = await self.connect()
+        game_id = (await self.ask(client, {"op": "new", "size": 5}))["game"]
+
+        for request in ({"op": "move", "game": game_id, "player": 1, "to": [4]},
+                        {"op": "move", "game": game_id, "player": 1, "to": [2.0, 1]},
+                        {"op": "move", "game": game_id, "player": 1, "to": "21"},
+                        {"op": "fence", "game": game_id, "player": 1, "direction": "h", "at": [4]},
+                        {"op": "fence", "game": game_id, "player": 1, "direction": "h", "at": [1, True]},
+                        {"op": "move", "game": game_id, "player": True, "to": [2, 1]},
+                        {"op": "move", "game": game_id, "player": 3, "to": [2, 1]},
+                        {"op": "fence", "game": game_id, "player": "1", "direction": "h", "at": [1, 1]},
+                        {"op": "new", "size": 0},
+                        {"op": "new", "size": 100000},
+                        {"op": "new", "size": "9"},
+                        ["op", "new"]):
+            answer = await self.ask(client, request)
+            self.assertFalse(answer["ok"], request)
+            self.assertIn("bad request", answer["error"])
+
+        answer = await self.ask(client, {"op": "move", "game": game_id, "player": 1, "to": [2, 1]})
+        self.assertEqual([answer["ok"], answer["state"]["pawns"]], [True, [[2, 1], [2, 4]]])
+        self.assertIsNone(self._server.get_game(game_id + 1))
+
+    async def test_slow_watchers(self):
+        """
+        Tests that a watcher who doesn't read can't hold up the answer to a
+        move, and that one with too much unsent is dropped.
+        """
+        player = await self.connect()
+        watcher = await self.connect()
+        game_id = (await self.ask(player, {"op": "new"}))["game"]
+        await self.ask(watcher, {"op": "watch", "game": game_id})
+        stalled = StalledWatcher(0)
+        full = StalledWatcher(WATCHER_BUFFER_LIMIT + 1)
+        self._server.add_watcher(game_id, stalled)
+        self._server.add_watcher(game_id, full)
+
+        request = {"op": "move", "game": game_id, "player": 1, "to": [4, 1]}
+        answer = await asyncio.wait_for(self.ask(player, request), 1)
+        self.assertTrue(answer["ok"])
+
+        push = json.loads(await asyncio.wait_for(watcher[0].readline(), 1))
+        self.assertEqual(push["state"], answer["state"])
+        self.assertEqual([message["state"] for message in stalled.get_messages()], [answer["state"]])
+        self.assertEqual(full.get_messages(), [])
+        self.assertEqual(len(self._server.get_watchers(game_id)), 2)
+        self.assertNotIn(full, self._server.get_watchers(game_id))
+
+    async def test_long_line_and_end(self):
+        """
+        Tests that a request line over the reader's limit is answered and
+        skipped, and that an ended game is forgotten and its watchers told.
+        """
+        client = await self.connect()
+        client[1].write(b"x" * (1 << 18) + b"\n")
+        answer = json.loads(await asyncio.wait_for(client[0].readline(), 1))
+        self.assertEqual([answer["ok"], answer["error"]], [False, "request line too long"])
+        self.assertTrue((await asyncio.wait_for(self.ask(client, {"op": "new"}), 1))["ok"])
+
+        player = await self.connect()
+        watcher = await self.connect()
+        game_id = (await self.ask(player, {"op": "new"}))["game"]
+        await self.ask(watcher, {"op": "watch", "game": game_id})
+
+        answer = await self.ask(player, {"op": "end", "game": game_id})
+        self.assertTrue(answer["ok"])
+        push = json.loads(await asyncio.wait_for(watcher[0].readline(), 1))
+        self.assertEqual([push["event"], push["game"]], ["end", game_id])
+        self.assertIsNone(self._server.get_game(game_id))
+        self.assertEqual(self._server.get_watchers(game_id), frozenset())
+
+        answer = await self.ask(player, {"op": "move", "game": game_id, "player": 1, "to": [4, 1]})
+        self.assertIn("bad request", answer["error"])
+        self.assertFalse((await self.ask(player, {"op": "end", "game": game_id}))["ok"])
+
+    async def test_watch_and_engine(self):
+        """
+        Tests that watchers are sent each new state, and that an engine move
+        is searched off the event loop and played.
+        """
+        player = await self.connect()
+        watcher = await self.connect()
+        game_id = (await self.ask(player, {"op": "new"}))["game"]
+        await self.ask(watcher, {"op": "watch", "game": game_id})
+
+        answer = await self.ask(player, {"op": "engine", "game": game_id})
+        self.assertTrue(answer["ok"])
+        self.assertEqual(answer["state"]["whose_move"], 2)
+
+        push = json.loads(await watcher[0].readline())
+        self.assertEqual([push["event"], push["game"]], ["state", game_id])
+        self.assertEqual(push["state"], answer["state"])
+        self.assertEqual(len(self._server.get_game(game_id).get_history()), 1)
@@ -0,0 +1,301 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Headless Quoridor self-play simulator.
+# Plays batches of games between two policies on GameState positions, so no
+# linked-list board is ever built, and spreads the games over a process pool.
+# Reports win rates, game lengths and fence usage, and can write them as JSON.
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import time
+from collections import Counter
+
+from Quoridor_state import GameState
+from Quoridor_engine import SearchEngine, fences_across, opponent_route
+
+
+class RandomPolicy:
+    """
+    Represents a player that moves its pawn at random, and now and then tries
+    a random fence slot instead.
+    """
+
+    def __init__(self, fence_rate=0.1):
+        """
+        Creates a policy that tries a fence on fence_rate of its moves.
+        """
+        self._fence_rate = fence_rate
+
+    def new_game(self):
+        """Forgets anything kept from the last game"""
+        pass
+
+    def choose_move(self, state, rng):
+        """
+        Returns a move code for the player to move in state, or -1 if it has
+        no legal move.
+        """
+        geometry = state.get_geometry()
+        if state.get_no_of_fences(state.get_whose_move()) > 0 and rng.random() < self._fence_rate:
+            move = geometry.get_square_count() * rng.randint(1, 2) + \
+                rng.randrange(geometry.get_square_count())
+            if state.is_legal(move):
+                return move
+        return rng.choice(state.pawn_moves() or state.fence_moves() or [-1])
+
+
+class GreedyPolicy:
+    """
+    Represents a player that walks its pawn down its shortest path. When the
+    opponent is closer to their goal, it fences them off with the fence across
+    their path that sets them back the most, if one sets them back at all.
+    """
+
+    def __init__(self, max_fences=3):
+        """
+        Creates a policy that looks at fences across the first max_fences
+        steps of the opponent's path.
+        """
+        self._max_fences = max_fences
+        self._fields = dict()
+
+    def new_game(self):
+        """Forgets the distance fields of the last game"""
+        self._fields.clear()
+
+    def choose_move(self, state, rng):
+        """
+        Returns a move code for the player to move in state, or -1 if it has
+        no legal move.
+        """
+        player = state.get_whose_move()
+        h_walls, v_walls = state.get_h_walls(), state.get_v_walls()
+        own = self.get_field(state, h_walls, v_walls, player)[state.get_pawn_square(player)]
+        opponent = self.get_field(state, h_walls, v_walls, 3 - player)[state.get_pawn_square(3 - player)]
+
+        if opponent < own:
+            move = self.best_fence(state, opponent - own)
+            if move >= 0:
+                return move
+
+        # Break ties at random so games between greedy players differ.
+        field = self.get_field(state, h_walls, v_walls, player)
+        pawn_moves = state.pawn_moves()
+        if not pawn_moves:
+            # A pawn boxed in by the other pawn and the fences can't step, so
+            # it has to place a fence.
+            return rng.choice(state.fence_moves() or [-1])
+        nearest = min(field[move] for move in pawn_moves)
+        return rng.choice([move for move in pawn_moves if field[move] == nearest])
+
+    def best_fence(self, state, margin):
+        """
+        Returns the legal fence that most improves the player to move's lead
+        over margin, or -1 if none improves it.
+        """
+        player = state.get_whose_move()
+        best_move = -1
+        route = opponent_route(state) or []
+        for move in fences_across(state, route, self._max_fences):
+            child = state.copy()
+            child.make_move(move)
+            own, opponent = child.shortest_path(player), child.shortest_path(3 - player)
+
+            # A path of -1 means the fence breaks the fair play rule.
+            gain = opponent - own
+            if own >= 0 and opponent >= 0 and gain > margin:
+                best_move, margin = move, gain
+        return best_move
+
+    def get_field(self, state, h_walls, v_walls, player):
+        """
+        Returns player's distance field for a set of fences, reusing the one
+        from an earlier move while no fence has gone up since.
+        """
+        key = (h_walls, v_walls, player)
+        field = self._fields.get(key)
+        if field is None:
+            field = state.get_geometry().distance_field(h_walls, v_walls, player)
+            self._fields[key] = field
+        return field
+
+
+class SearchPolicy:
+    """
+    Represents a player backed by the alpha-beta SearchEngine.
+    """
+
+    def __init__(self, time_budget=0.01, max_depth=2):
+        """
+        Creates a policy that searches for time_budget seconds per move.
+        """
+        self._engine = SearchEngine(time_budget=time_budget, max_depth=max_depth)
+
+    def new_game(self):
+        """Clears the engine's transposition table"""
+        self._engine.get_table().clear()
+
+    def choose_move(self, state, rng):
+        """
+        Returns a move code for the player to move in state.
+        """
+        return self._engine.choose_move(state)
+
+
+# Policies by the name the simulator is given.
+POLICIES = {"random": RandomPolicy, "greedy": GreedyPolicy, "search": SearchPolicy}
+
+
+def make_policy(name):
+    """
+    Returns a new policy of the given name, or raises ValueError if there is
+    no policy by that name.
+    """
+    if name not in POLICIES:
+        raise ValueError("unknown policy " + repr(name) + ", pick one of " + ", ".join(POLICIES))
+    return POLICIES[name]()
+
+
+def play_game(policies, rng, size=9, max_moves=400):
+    """
+    Plays one game between policies, a (player 1, player 2) pair. Returns the
+    winner, the number of moves played and the fences each player placed.
+    The game is a draw (winner 0) if max_moves run out first, or if the
+    player to move has no legal move.
+    """
+    state = GameState(size)
+    no_of_fences = state.get_no_of_fences(1)
+    for policy in policies:
+        policy.new_game()
+
+    moves = 0
+    while not state.get_winner() and moves < max_moves:
+        move = policies[state.get_whose_move() - 1].choose_move(state, rng)
+        if move < 0:
+            break
+        state.make_move(move)
+        moves += 1
+    return state.get_winner(), moves, (no_of_fences - state.get_no_of_fences(1),
+                                        no_of_fences - state.get_no_of_fences(2))
+
+
+def run_shard(job):
+    """
+    Plays a shard of games and returns their raw totals. job is a
+    (player 1 policy name, player 2 policy name, games, seed, size, max_moves)
+    tuple so it can be sent to a worker process.
+    """
+    first, second, games, seed, size, max_moves = job
+    rng = random.Random(seed)
+    policies = (make_policy(first), make_policy(second))
+    totals = {"wins": [0, 0, 0], "lengths": Counter(), "fences": [0, 0]}
+
+    for _ in range(games):
+        winner, moves, fences = play_game(policies, rng, size, max_moves)
+        totals["wins"][winner] += 1
+        totals["lengths"][moves] += 1
+        totals["fences"][0] += fences[0]
+        totals["fences"][1] += fences[1]
+    return totals
+
+
+def simulate(games, first="greedy", second="greedy", workers=None, seed=0, size=9,
+             max_moves=400, shard_size=100):
+    """
+    Plays games between two policies, sharded over workers processes (every
+    core by default; 1 plays in this process), and returns their statistics.
+    """
+    make_policy(first)
+    make_policy(second)
+    workers = workers or os.cpu_count() or 1
+    shards = [min(shard_size, games - start) for start in range(0, games, shard_size)]
+    jobs = [(first, second, count, seed * 1000003 + index, size, max_moves)
+            for index, count in enumerate(shards)]
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = [run_shard(job) for job in jobs]
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            results = pool.map(run_shard, jobs)
+    elapsed = time.perf_counter() - start
+
+    stats = summarize(results, games)
+    stats.update({"policies": [first, second], "size": size, "workers": workers,
+                  "seconds": elapsed, "games_per_second": games / elapsed if elapsed else 0.0})
+    return stats
+
+
+def summarize(results, games):
+    """
+    Merges the totals of every shard into win rates, game lengths and fence
+    usage.
+    """
+    wins = [0, 0, 0]
+    lengths = Counter()
+    fences = [0, 0]
+    for totals in results:
+        wins = [a + b for a, b in zip(wins, totals["wins"])]
+        lengths.update(totals["lengths"])
+        fences = [a + b for a, b in zip(fences, totals["fences"])]
+
+    played = max(games, 1)
+    return {"games": games,
+            "wins": {"1": wins[1], "2": wins[2], "draws": wins[0]},
+            "win_rate": {"1": wins[1] / played, "2": wins[2] / played},
+            "length": length_stats(lengths),
+            "fences_per_game": {"1": fences[0] / played, "2": fences[1] / played}}
+
+
+def length_stats(lengths):
+    """
+    Returns the mean, median, shortest and longest game length from a Counter
+    of lengths.
+    """
+    if not lengths:
+        return {"mean": 0.0, "median": 0, "min": 0, "max": 0}
+
+    count = sum(lengths.values())
+    seen = 0
+    median = 0
+    for length in sorted(lengths):
+        seen += lengths[length]
+        if 2 * seen >= count:
+            median = length
+            break
+    return {"mean": sum(k * v for k, v in lengths.items()) / count, "median": median,
+            "min": min(lengths), "max": max(lengths)}
+
+
+def write_stats(stats, path):
+    """
+    Writes simulation statistics to a JSON file.
+    """
+    with open(path, "w") as out:
+        json.dump(stats, out, indent=2, sort_keys=True)
+
+
+def main():
+    """Runs a simulation from the command line, will not run if imported"""
+    parser = argparse.ArgumentParser(description="Play Quoridor games between two policies.")
+    parser.add_argument("games", type=int)
+    parser.add_argument("--p1", default="greedy", choices=sorted(POLICIES))
+    parser.add_argument("--p2", default="greedy", choices=sorted(POLICIES))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--size", type=int, default=9)
+    parser.add_argument("--max-moves", type=int, default=400)
+    parser.add_argument("--out", default=None, help="write the statistics to this JSON file")
+    args = parser.parse_args()
+
+    stats = simulate(args.games, args.p1, args.p2, args.workers, args.seed, args.size, args.max_moves)
+    if args.out:
+        write_stats(stats, args.out)
+    print(json.dumps(stats, indent=2, sort_keys=True))
+
+
+if __name__ == '__main__':
+    main()
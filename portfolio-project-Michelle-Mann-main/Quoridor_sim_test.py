@@ -0,0 +1,90 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Unit Test for the Quoridor self-play simulator
+
+import json
+import os
+import random
+import tempfile
+import unittest
+from Quoridor_state import GameState
+from Quoridor_sim import make_policy, play_game, simulate, write_stats
+
+
+class TestSimulator(unittest.TestCase):
+    """Contains the unit test for the self-play simulator"""
+
+    def test_policies_play_legal_moves(self):
+        """
+        Tests that every policy only picks legal moves.
+        """
+        rng = random.Random(2)
+
+        for name in ("random", "greedy", "search"):
+            state = GameState()
+            policy = make_policy(name)
+            policy.new_game()
+            for _ in range(12):
+                move = policy.choose_move(state, rng)
+                self.assertTrue(state.is_legal(move), name)
+                state.make_move(move)
+
+        self.assertRaises(ValueError, make_policy, "perfect")
+
+    def test_play_game(self):
+        """
+        Tests that a greedy player beats a random one, and that fences are
+        counted.
+        """
+        winner, moves, fences = play_game((make_policy("random"), make_policy("greedy")),
+                                           random.Random(4))
+
+        self.assertEqual(winner, 2)
+        self.assertGreater(moves, 0)
+        self.assertTrue(0 <= fences[0] <= 10 and 0 <= fences[1] <= 10)
+
+    def test_no_legal_move(self):
+        """
+        Tests a position random play reaches where player 1's pawn is boxed
+        in by player 2's and the fences: with no fences left it's a draw, and
+        with one left every policy places it.
+        """
+        state = GameState()
+        state.set_position((43, 42), 9804345768998338560, 2343016399481422944, (0, 0), 1)
+        self.assertEqual(state.legal_moves(), [])
+
+        rng = random.Random(1)
+        for name in ("random", "greedy", "search"):
+            self.assertEqual(make_policy(name).choose_move(state, rng), -1, name)
+
+            fenced = state.copy()
+            fenced.set_position((43, 42), state.get_h_walls(), state.get_v_walls(), (1, 0), 1)
+            self.assertIn(make_policy(name).choose_move(fenced, rng), fenced.fence_moves(), name)
+
+        # Every game of a seed that reaches the position finishes.
+        stats = simulate(2000, "random", "random", workers=1, seed=3)
+        self.assertEqual(sum(stats["wins"].values()), 2000)
+        self.assertGreater(stats["wins"]["draws"], 0)
+
+    def test_simulate(self):
+        """
+        Tests the statistics of a batch of games, in one process and sharded
+        over two, and writing them as JSON.
+        """
+        stats = simulate(30, "greedy", "random", workers=1, seed=1, shard_size=7)
+
+        self.assertEqual(stats["games"], 30)
+        self.assertEqual(sum(stats["wins"].values()), 30)
+        self.assertEqual(stats["wins"]["1"], 30)
+        self.assertLessEqual(stats["length"]["min"], stats["length"]["median"])
+        self.assertLessEqual(stats["length"]["median"], stats["length"]["max"])
+
+        # The same seed gives the same games however they are sharded out.
+        self.assertEqual(simulate(30, "greedy", "random", workers=2, seed=1, shard_size=7)["wins"],
+                         stats["wins"])
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "stats.json")
+            write_stats(stats, path)
+            with open(path) as saved:
+                self.assertEqual(json.load(saved)["win_rate"], stats["win_rate"])
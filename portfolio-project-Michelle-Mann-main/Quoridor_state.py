@@ -0,0 +1,1063 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Compact Quoridor game state.
+# Keeps a whole position in a handful of integers: each pawn is a square
+# index, and the horizontal and vertical fences are two bit masks. States
+# copy and hash in constant time, which the linked-list board cannot do.
+# Also keeps the shortest path distances of both players to their goal row.
+
+import heapq
+import random
+import struct
+from collections import deque
+
+# The four directions a pawn can step in. Up and down cross horizontal
+# fences, left and right cross vertical fences.
+UP = 0
+DOWN = 1
+LEFT = 2
+RIGHT = 3
+
+DIRECTIONS = (UP, DOWN, LEFT, RIGHT)
+
+# Stands in for the distance of a square that can't reach the goal row.
+UNREACHABLE = 1 << 30
+
+# The smallest board two pawns can start and race on: below it the home
+# rows meet, or the pawns start on the same square.
+MIN_BOARD_SIZE = 3
+
+# A packed position starts with the format version, the board size, both
+# pawn squares, both players' fences left and whose move it is. Then come
+# the horizontal and vertical fence masks and the masks of which of those
+# fences player 2 placed, each in (size * size + 7) // 8 bytes.
+POSITION_HEADER = struct.Struct("<BBHHBBB")
+POSITION_VERSION = 1
+
+
+class BoardGeometry:
+    """
+    Represents the read-only lookup tables of a square board of a given size.
+    Square s is the coordinate (s % size, s // size). Bit s of the horizontal
+    mask is the fence on the up side of square s, and bit s of the vertical
+    mask is the fence on the left side of square s. One geometry is built per
+    board size and shared by every state of that size.
+    """
+
+    _shared = dict()
+
+    def __init__(self, size):
+        """
+        Builds the step and edge tables for a size x size board.
+        """
+        self._size = size
+        self._square_count = size * size
+        self._coords = tuple((s % size, s // size) for s in range(self._square_count))
+
+        # For every direction, the square one step away (-1 if off the board)
+        # and the fence bit that blocks that step.
+        self._steps = tuple(tuple(self._neighbor(s, d) for s in range(self._square_count))
+                            for d in DIRECTIONS)
+        self._edge_bits = (tuple(1 << s for s in range(self._square_count)),
+                           tuple(1 << (s + size) for s in range(self._square_count)),
+                           tuple(1 << s for s in range(self._square_count)),
+                           tuple(1 << (s + 1) for s in range(self._square_count)))
+
+        # The same steps per square, as (target, 0 for horizontal or 1 for
+        # vertical fences, blocking bit) triples, for the searches to loop over.
+        self._links = tuple(tuple((self._steps[d][s], d >= LEFT, self._edge_bits[d][s])
+                                  for d in DIRECTIONS if self._steps[d][s] >= 0)
+                            for s in range(self._square_count))
+
+        # The fence anchors that are inside the board. The outer edges are
+        # already fences and can't take another one.
+        self._h_anchors = sum(1 << s for s in range(size, self._square_count))
+        self._v_anchors = sum(1 << s for s in range(self._square_count) if s % size != 0)
+        self._fence_anchors = {"h": tuple(self._coords[s] for s in range(size, self._square_count)),
+                               "v": tuple(self._coords[s] for s in range(self._square_count)
+                                          if s % size != 0)}
+
+        # Every square a pawn could reach in one move from each square: the
+        # eight surrounding squares and the two straight jumps up and down.
+        # Filled in as squares are asked for, which keeps big boards quick
+        # to set up.
+        self._pawn_reach = [None] * self._square_count
+
+        # Player 1 starts on the top row and races to the bottom row;
+        # player 2 does the opposite.
+        self._start_squares = (None, size // 2, (size - 1) * size + size // 2)
+        self._goal_rows = (None, size - 1, 0)
+
+        # Both players' distance fields on a board with no fences, once found.
+        self._open_fields = [None, None, None]
+
+        self._build_zobrist_keys()
+
+    def _build_zobrist_keys(self):
+        """
+        Draws the random 64-bit keys that a position's Zobrist key is the
+        exclusive or of: one per pawn per square, one per fence slot, one per
+        player per fences-left count and one for player 2 to move. The draw is
+        seeded with the board size, so keys are the same in every process.
+        """
+        rng = random.Random(self._size)
+        count = self._square_count
+        self._pawn_keys = (None, tuple(rng.getrandbits(64) for _ in range(count)),
+                           tuple(rng.getrandbits(64) for _ in range(count)))
+        self._fence_keys = tuple(rng.getrandbits(64) for _ in range(2 * count))
+        self._fences_left_keys = (None, tuple(rng.getrandbits(64) for _ in range(count)),
+                                  tuple(rng.getrandbits(64) for _ in range(count)))
+        self._turn_key = rng.getrandbits(64)
+
+    @classmethod
+    def of_size(cls, size=9):
+        """
+        Returns the shared geometry for a board size, building it on first use.
+        Raises ValueError if size isn't a board size (see check_board_size).
+        """
+        check_board_size(size)
+        geometry = cls._shared.get(size)
+        if geometry is None:
+            geometry = cls(size)
+            cls._shared[size] = geometry
+        return geometry
+
+    def _neighbor(self, square, direction):
+        """Returns the square one step from square in direction, or -1"""
+        x, y = self._coords[square]
+        if direction == UP:
+            return square - self._size if y > 0 else -1
+        elif direction == DOWN:
+            return square + self._size if y < self._size - 1 else -1
+        elif direction == LEFT:
+            return square - 1 if x > 0 else -1
+        else:
+            return square + 1 if x < self._size - 1 else -1
+
+    def _reach(self, square):
+        """Returns the coordinates a pawn move from square could land on"""
+        x, y = self._coords[square]
+        offsets = ((0, -1), (0, 1), (-1, 0), (1, 0),
+                   (-1, -1), (1, -1), (-1, 1), (1, 1), (0, -2), (0, 2))
+        return tuple((x + dx, y + dy) for dx, dy in offsets
+                     if 0 <= x + dx < self._size and 0 <= y + dy < self._size)
+
+    def get_size(self):
+        """Returns the number of rows (and columns) of the board"""
+        return self._size
+
+    def get_square_count(self):
+        """Returns the number of squares on the board"""
+        return self._square_count
+
+    def get_h_anchors(self):
+        """Returns the mask of squares that can take a horizontal fence"""
+        return self._h_anchors
+
+    def get_v_anchors(self):
+        """Returns the mask of squares that can take a vertical fence"""
+        return self._v_anchors
+
+    def get_fence_anchors(self, direction):
+        """Returns the coordinates that can take an 'h' or 'v' fence"""
+        return self._fence_anchors[direction]
+
+    def get_pawn_reach(self, square):
+        """Returns every coordinate a pawn move from square could land on"""
+        if self._pawn_reach[square] is None:
+            self._pawn_reach[square] = self._reach(square)
+        return self._pawn_reach[square]
+
+    def get_start_square(self, player):
+        """Returns the square a player's pawn starts on"""
+        return self._start_squares[player]
+
+    def get_goal_row(self, player):
+        """Returns the row a player's pawn must reach to win"""
+        return self._goal_rows[player]
+
+    def zobrist_pawn(self, player, square):
+        """Returns the Zobrist key of player's pawn standing on square"""
+        return self._pawn_keys[player][square]
+
+    def zobrist_fence(self, move):
+        """Returns the Zobrist key of the fence placed by a fence move code"""
+        return self._fence_keys[move - self._square_count]
+
+    def zobrist_fences_left(self, player, count):
+        """Returns the Zobrist key of player having count fences left"""
+        return self._fences_left_keys[player][count % self._square_count]
+
+    def zobrist_turn(self, whose_move):
+        """Returns the Zobrist key of whose move it is"""
+        return self._turn_key if whose_move == 2 else 0
+
+    def zobrist_key(self, pawns, h_walls, v_walls, fences, whose_move):
+        """
+        Returns the Zobrist key of a whole position from scratch. pawns and
+        fences are (p1, p2) pairs of squares and fences left.
+        """
+        key = self.zobrist_turn(whose_move)
+        for player in (1, 2):
+            key ^= self._pawn_keys[player][pawns[player - 1]]
+            key ^= self.zobrist_fences_left(player, fences[player - 1])
+        for offset, walls in ((self._square_count, h_walls), (2 * self._square_count, v_walls)):
+            while walls:
+                low_bit = walls & -walls
+                key ^= self.zobrist_fence(offset + low_bit.bit_length() - 1)
+                walls ^= low_bit
+        return key
+
+    def square_of(self, coord_tuple):
+        """
+        Returns the square index of an (x, y) coordinate, or -1 if the
+        coordinate is not on the board.
+        """
+        try:
+            x, y = coord_tuple
+            if 0 <= x < self._size and 0 <= y < self._size:
+                return int(y) * self._size + int(x)
+        except (TypeError, ValueError):
+            pass
+        return -1
+
+    def coord_of(self, square):
+        """Returns the (x, y) coordinate of a square index"""
+        return self._coords[square]
+
+    def row_of(self, square):
+        """Returns the row of a square index"""
+        return square // self._size
+
+    def step(self, square, direction):
+        """Returns the square one step away in direction, ignoring fences"""
+        return self._steps[direction][square]
+
+    def open_step(self, square, direction, h_walls, v_walls):
+        """
+        Returns the square one step away in direction, or -1 if that step
+        leaves the board or crosses a fence in h_walls/v_walls.
+        """
+        target = self._steps[direction][square]
+        walls = h_walls if direction < LEFT else v_walls
+        if target < 0 or walls & self._edge_bits[direction][square]:
+            return -1
+        return target
+
+    def fence_edge(self, direction, square):
+        """
+        Returns the two squares an 'h' or 'v' fence anchored on square separates.
+        """
+        if direction == "h":
+            return square - self._size, square
+        return square - 1, square
+
+    def get_goal_squares(self, player):
+        """Returns the squares of a player's goal row"""
+        row = self._goal_rows[player] * self._size
+        return range(row, row + self._size)
+
+    def shortest_path(self, h_walls, v_walls, start, goal_row):
+        """
+        Returns the number of steps from square start to the nearest square of
+        goal_row, ignoring pawns, or -1 if the fences cut start off from it.
+        """
+        if start // self._size == goal_row:
+            return 0
+
+        walls = (h_walls, v_walls)
+        links = self._links
+        distances = [-1] * self._square_count
+        distances[start] = 0
+        goal_low = goal_row * self._size
+        goal_high = goal_low + self._size
+        queue = deque((start,))
+        while queue:
+            square = queue.popleft()
+            distance = distances[square] + 1
+            for target, vertical, bit in links[square]:
+                if distances[target] < 0 and not walls[vertical] & bit:
+                    if goal_low <= target < goal_high:
+                        return distance
+                    distances[target] = distance
+                    queue.append(target)
+        return -1
+
+    def path_steps(self, h_walls, v_walls, start, goal_row):
+        """
+        Returns one shortest path from square start to goal_row as a list of
+        (square, direction) steps in walking order, or None if there is no path.
+        """
+        parents = {start: None}
+        queue = deque((start,))
+        while queue:
+            square = queue.popleft()
+            if square // self._size == goal_row:
+                return self._trace_steps(parents, square)
+            for direction in DIRECTIONS:
+                target = self.open_step(square, direction, h_walls, v_walls)
+                if target >= 0 and target not in parents:
+                    parents[target] = (square, direction)
+                    queue.append(target)
+        return None
+
+    def _trace_steps(self, parents, square):
+        """Follows parents back from square and returns the steps in walking order"""
+        steps = []
+        while parents[square] is not None:
+            square, direction = parents[square]
+            steps.append((square, direction))
+        steps.reverse()
+        return steps
+
+    def path_edges(self, h_walls, v_walls, start, goal_row):
+        """
+        Returns one shortest path from square start to goal_row as a pair of
+        (horizontal, vertical) masks of the fence slots it crosses, or None if
+        there is no path.
+        """
+        steps = self.path_steps(h_walls, v_walls, start, goal_row)
+        if steps is None:
+            return None
+
+        crossed = [0, 0]
+        for square, direction in steps:
+            crossed[direction >= LEFT] |= self._edge_bits[direction][square]
+        return crossed[0], crossed[1]
+
+    def blocking_fence(self, square, direction):
+        """
+        Returns the move code of the fence that blocks the step from square in
+        direction.
+        """
+        anchor = self._edge_bits[direction][square].bit_length() - 1
+        return (1 if direction < LEFT else 2) * self._square_count + anchor
+
+    def distance_field(self, h_walls, v_walls, player):
+        """
+        Returns the distance of every square to player's goal row, found by one
+        breadth first search outward from the goal row. Squares cut off from it
+        are UNREACHABLE. The fields of a board with no fences are kept, and
+        copies of them handed out, since every new game starts with them.
+        """
+        if not h_walls and not v_walls and self._open_fields[player] is not None:
+            return self._open_fields[player][:]
+
+        walls = (h_walls, v_walls)
+        links = self._links
+        distances = [UNREACHABLE] * self._square_count
+        queue = deque(self.get_goal_squares(player))
+        for square in queue:
+            distances[square] = 0
+
+        while queue:
+            square = queue.popleft()
+            distance = distances[square] + 1
+            for target, vertical, bit in links[square]:
+                if distances[target] == UNREACHABLE and not walls[vertical] & bit:
+                    distances[target] = distance
+                    queue.append(target)
+
+        if not h_walls and not v_walls:
+            self._open_fields[player] = distances[:]
+        return distances
+
+    def bridges(self, h_walls, v_walls):
+        """
+        Returns the (horizontal, vertical) masks of the fence slots whose step is
+        a bridge: the only link between two parts of the board. Only a fence on
+        a bridge can cut a pawn off from its goal row. Uses an iterative depth
+        first search so large boards don't hit the recursion limit.
+        """
+        order = [-1] * self._square_count
+        low = [0] * self._square_count
+        found = [0, 0]
+        for root in range(self._square_count):
+            if order[root] < 0:
+                order[root] = low[root] = root
+                self._bridge_search(root, h_walls, v_walls, order, low, found)
+        return found[0], found[1]
+
+    def _bridge_search(self, root, h_walls, v_walls, order, low, found):
+        """Runs the bridge search over the part of the board holding root"""
+        walls = (h_walls, v_walls)
+        links = self._links
+        counter = max(order) + 1
+
+        # Each entry is [square, parent, (vertical, bit) of the step in from
+        # the parent, index of the next link to explore].
+        stack = [[root, -1, None, 0]]
+        while stack:
+            entry = stack[-1]
+            square = entry[0]
+            if entry[3] < len(links[square]):
+                target, vertical, bit = links[square][entry[3]]
+                entry[3] += 1
+                if target == entry[1] or walls[vertical] & bit:
+                    continue
+                if order[target] < 0:
+                    order[target] = low[target] = counter
+                    counter += 1
+                    stack.append([target, square, (vertical, bit), 0])
+                elif order[target] < low[square]:
+                    low[square] = order[target]
+                continue
+
+            # Every step out of square is explored; report back to its parent.
+            stack.pop()
+            parent = entry[1]
+            if parent >= 0:
+                if low[square] < low[parent]:
+                    low[parent] = low[square]
+                if low[square] > order[parent]:
+                    found[entry[2][0]] |= entry[2][1]
+
+    def pawn_move(self, coord_tuple):
+        """Returns the move code for a pawn moving to coord_tuple"""
+        return self.square_of(coord_tuple)
+
+    def fence_move(self, direction, coord_tuple):
+        """
+        Returns the move code for a fence, or -1 if direction is not 'h'/'v'
+        or coord_tuple is not on the board.
+        """
+        square = self.square_of(coord_tuple)
+        if square < 0 or direction not in ("h", "v"):
+            return -1
+        offset = self._square_count if direction == "h" else 2 * self._square_count
+        return offset + square
+
+    def describe_move(self, move):
+        """
+        Returns a move code as a ("pawn" | "h" | "v", (x, y)) pair.
+        """
+        kind, square = divmod(move, self._square_count)
+        return ("pawn", "h", "v")[kind], self._coords[square]
+
+
+class GameState:
+    """
+    Represents one Quoridor position: pawn squares, fence masks, fences left
+    and whose move it is. Follows the same rules as QuoridorGame, so a pawn
+    may jump or go diagonally only around a pawn directly above or below it.
+    Moves are integer codes (see BoardGeometry.describe_move).
+    """
+
+    __slots__ = ("_geometry", "_pawns", "_h_walls", "_v_walls", "_fences",
+                 "_whose_move", "_winner", "_zobrist_key")
+
+    def __init__(self, size=9, no_of_fences=10):
+        """
+        Creates the starting position of a size x size game.
+        """
+        self._geometry = BoardGeometry.of_size(size)
+        self._pawns = [None, self._geometry.get_start_square(1), self._geometry.get_start_square(2)]
+        self._h_walls = 0
+        self._v_walls = 0
+        self._fences = [None, no_of_fences, no_of_fences]
+        self._whose_move = 1
+
+        # 0 until a pawn reaches its goal row, then that player's number.
+        self._winner = 0
+        self._zobrist_key = self._geometry.zobrist_key(self._pawns[1:], 0, 0, self._fences[1:], 1)
+
+    def __repr__(self):
+        """The representation of a GameState object"""
+        return "GameState(P1: " + repr(self.get_pawn(1)) + ", P2: " + repr(self.get_pawn(2)) + \
+               ", to move: " + repr(self._whose_move) + ")"
+
+    def __eq__(self, other):
+        """Two states are equal when every part of the position matches"""
+        if not isinstance(other, GameState):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        """Hashes the position by its Zobrist key"""
+        return hash(self._zobrist_key)
+
+    def __reduce__(self):
+        """
+        Pickles a state as its position alone; the shared geometry is looked up
+        again by board size when it is unpickled.
+        """
+        return restore_state, self._key()
+
+    def to_bytes(self):
+        """
+        Returns the position as a fixed-size record (see pack_position). A
+        GameState doesn't know who placed each fence, so all are player 1's.
+        """
+        return pack_position(self._geometry.get_size(), self._pawns[1:], self._fences[1:],
+                             self._whose_move, (self._h_walls, self._v_walls, 0, 0))
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Returns the GameState of a record made by to_bytes or
+        QuoridorGame.to_bytes. Raises ValueError if data isn't one.
+        """
+        size, pawns, fences, whose_move, masks = unpack_position(data)
+        state = cls(size)
+        state.set_position(pawns, masks[0], masks[1], fences, whose_move)
+        return state
+
+    def _key(self):
+        """Returns the position as a tuple of integers"""
+        return (self._geometry.get_size(), self._pawns[1], self._pawns[2], self._h_walls,
+                self._v_walls, self._fences[1], self._fences[2], self._whose_move)
+
+    def copy(self):
+        """
+        Returns an independent copy of the state.
+        """
+        clone = GameState.__new__(GameState)
+        clone._geometry = self._geometry
+        clone._pawns = self._pawns[:]
+        clone._h_walls = self._h_walls
+        clone._v_walls = self._v_walls
+        clone._fences = self._fences[:]
+        clone._whose_move = self._whose_move
+        clone._winner = self._winner
+        clone._zobrist_key = self._zobrist_key
+        return clone
+
+    def get_geometry(self):
+        """Returns the shared geometry of the board"""
+        return self._geometry
+
+    def get_size(self):
+        """Returns the number of rows (and columns) of the board"""
+        return self._geometry.get_size()
+
+    def get_pawn_square(self, player):
+        """Returns the square a player's pawn is on"""
+        return self._pawns[player]
+
+    def get_pawn(self, player):
+        """Returns the (x, y) coordinate a player's pawn is on"""
+        return self._geometry.coord_of(self._pawns[player])
+
+    def get_h_walls(self):
+        """Returns the horizontal fence mask"""
+        return self._h_walls
+
+    def get_v_walls(self):
+        """Returns the vertical fence mask"""
+        return self._v_walls
+
+    def get_no_of_fences(self, player):
+        """Returns the number of fences a player has left"""
+        return self._fences[player]
+
+    def get_whose_move(self):
+        """Returns the player whose turn it is"""
+        return self._whose_move
+
+    def get_zobrist_key(self):
+        """Returns the 64-bit Zobrist key of the position"""
+        return self._zobrist_key
+
+    def get_winner(self):
+        """Returns the player who has won, or 0 if nobody has yet"""
+        return self._winner
+
+    def is_winner(self, player):
+        """Returns True if player has won the game"""
+        return self._winner == player
+
+    def set_position(self, pawns, h_walls, v_walls, fences, whose_move):
+        """
+        Overwrites the position. pawns and fences are (p1, p2) pairs of
+        squares and fence counts.
+        """
+        self._pawns = [None, pawns[0], pawns[1]]
+        self._h_walls = h_walls
+        self._v_walls = v_walls
+        self._fences = [None, fences[0], fences[1]]
+        self._whose_move = whose_move
+        self._zobrist_key = self._geometry.zobrist_key(pawns, h_walls, v_walls, fences, whose_move)
+        self._winner = 0
+        for player in (1, 2):
+            if self._geometry.row_of(self._pawns[player]) == self._geometry.get_goal_row(player):
+                self._winner = player
+
+    def shortest_path(self, player):
+        """
+        Returns the number of steps player's pawn needs to reach its goal row,
+        ignoring pawns, or -1 if the fences cut it off.
+        """
+        return self._geometry.shortest_path(self._h_walls, self._v_walls, self._pawns[player],
+                                            self._geometry.get_goal_row(player))
+
+    def open_step(self, square, direction):
+        """
+        Returns the square one step from square in direction, or -1 if the
+        board edge or a fence is in the way.
+        """
+        return self._geometry.open_step(square, direction, self._h_walls, self._v_walls)
+
+    def pawn_moves(self):
+        """
+        Returns the move codes of every legal pawn move of the player to move.
+        """
+        return pawn_targets(self._geometry, self._h_walls, self._v_walls,
+                            self._pawns[self._whose_move], self._pawns[3 - self._whose_move])
+
+    def fence_moves(self):
+        """
+        Returns the move codes of every free fence slot that leaves both pawns
+        a way to their goal row, or an empty list if the player to move has no
+        fences left.
+        """
+        if self._fences[self._whose_move] <= 0:
+            return []
+
+        square_count = self._geometry.get_square_count()
+        path_h, path_v = self._path_edges()
+        bridge_h, bridge_v = self._geometry.bridges(self._h_walls, self._v_walls)
+        moves = []
+        free_h = self._geometry.get_h_anchors() & ~self._h_walls
+        free_v = self._geometry.get_v_anchors() & ~self._v_walls
+
+        # Only a fence on a bridge that one of the players' current shortest
+        # paths crosses can seal anyone in; the rest need no search.
+        for offset, direction, free, path in ((square_count, "h", free_h, path_h & bridge_h),
+                                              (2 * square_count, "v", free_v, path_v & bridge_v)):
+            while free:
+                low_bit = free & -free
+                square = low_bit.bit_length() - 1
+                if not low_bit & path or not self._seals(direction, square):
+                    moves.append(offset + square)
+                free ^= low_bit
+        return moves
+
+    def _path_edges(self):
+        """
+        Returns the (horizontal, vertical) masks of the fence slots crossed by
+        one shortest path of each player.
+        """
+        path_h = 0
+        path_v = 0
+        for player in (1, 2):
+            edges = self._geometry.path_edges(self._h_walls, self._v_walls, self._pawns[player],
+                                              self._geometry.get_goal_row(player))
+            if edges is not None:
+                path_h |= edges[0]
+                path_v |= edges[1]
+        return path_h, path_v
+
+    def _seals(self, direction, square):
+        """
+        Returns True if an 'h' or 'v' fence anchored on square would leave a
+        pawn with no way to its goal row.
+        """
+        h_walls = self._h_walls | (1 << square if direction == "h" else 0)
+        v_walls = self._v_walls | (1 << square if direction == "v" else 0)
+        for player in (1, 2):
+            if self._geometry.shortest_path(h_walls, v_walls, self._pawns[player],
+                                            self._geometry.get_goal_row(player)) < 0:
+                return True
+        return False
+
+    def legal_moves(self):
+        """
+        Returns the move codes of every legal move of the player to move.
+        """
+        if self._winner:
+            return []
+        return self.pawn_moves() + self.fence_moves()
+
+    def is_legal(self, move):
+        """
+        Returns True if the move code is legal for the player to move.
+        """
+        if self._winner or move < 0:
+            return False
+
+        kind, square = divmod(move, self._geometry.get_square_count())
+        if kind == 0:
+            return move in self.pawn_moves()
+        elif kind == 1:
+            free = self._geometry.get_h_anchors() & ~self._h_walls
+        elif kind == 2:
+            free = self._geometry.get_v_anchors() & ~self._v_walls
+        else:
+            return False
+
+        return self._fences[self._whose_move] > 0 and bool(free & (1 << square)) and \
+            not self._seals("h" if kind == 1 else "v", square)
+
+    def make_move(self, move):
+        """
+        Plays a move code for the player to move without checking it.
+        """
+        player = self._whose_move
+        geometry = self._geometry
+        kind, square = divmod(move, geometry.get_square_count())
+
+        if kind == 0:
+            self._zobrist_key ^= geometry.zobrist_pawn(player, self._pawns[player]) ^ \
+                geometry.zobrist_pawn(player, square)
+            self._pawns[player] = square
+            if geometry.row_of(square) == geometry.get_goal_row(player):
+                self._winner = player
+        else:
+            if kind == 1:
+                self._h_walls |= 1 << square
+            else:
+                self._v_walls |= 1 << square
+            self._zobrist_key ^= geometry.zobrist_fence(move) ^ \
+                geometry.zobrist_fences_left(player, self._fences[player]) ^ \
+                geometry.zobrist_fences_left(player, self._fences[player] - 1)
+            self._fences[player] -= 1
+
+        self._zobrist_key ^= geometry.zobrist_turn(2)
+        self._whose_move = 3 - player
+
+    def play(self, move):
+        """
+        Plays a move code if it is legal. Returns True if it was played,
+        False otherwise.
+        """
+        if self.is_legal(move):
+            self.make_move(move)
+            return True
+        return False
+
+    def move_pawn(self, player, coord_tuple):
+        """
+        Same contract as QuoridorGame.move_pawn: moves player's pawn to
+        coord_tuple and returns True, or returns False if the move is illegal.
+        """
+        if player != self._whose_move:
+            return False
+        return self.play(self._geometry.pawn_move(coord_tuple))
+
+    def place_fence(self, player, fence_direction, coord_tuple):
+        """
+        Same contract as QuoridorGame.place_fence: places player's fence and
+        returns True, or returns False if the placement is illegal.
+        """
+        if player != self._whose_move:
+            return False
+        return self.play(self._geometry.fence_move(fence_direction, coord_tuple))
+
+
+def check_board_size(size):
+    """
+    Raises ValueError unless size is an int of at least MIN_BOARD_SIZE.
+    """
+    if isinstance(size, bool) or not isinstance(size, int):
+        raise ValueError("board size must be an int, not " + repr(size))
+    if size < MIN_BOARD_SIZE:
+        raise ValueError("board size must be at least " + str(MIN_BOARD_SIZE) + ", not " + str(size))
+
+
+def pawn_targets(geometry, h_walls, v_walls, own, opponent):
+    """
+    Returns the squares a pawn on square own can move to, with the opponent's
+    pawn on square opponent. These are also the pawn's move codes.
+    """
+    targets = []
+    for direction in DIRECTIONS:
+        target = geometry.open_step(own, direction, h_walls, v_walls)
+        if target < 0:
+            continue
+        elif target != opponent:
+            targets.append(target)
+
+        # Facing the opponent vertically: jump over them, or step around
+        # them if a fence or the board edge is behind them.
+        elif direction < LEFT:
+            beyond = geometry.open_step(opponent, direction, h_walls, v_walls)
+            if beyond >= 0:
+                targets.append(beyond)
+            else:
+                targets.extend(s for s in (geometry.open_step(opponent, LEFT, h_walls, v_walls),
+                                           geometry.open_step(opponent, RIGHT, h_walls, v_walls)) if s >= 0)
+    return targets
+
+
+def pack_position(size, pawns, fences, whose_move, masks):
+    """
+    Returns a position as a fixed-size bytes record. pawns and fences are
+    (p1, p2) pairs of squares and fences left; masks is the (horizontal,
+    vertical, horizontal placed by player 2, vertical placed by player 2)
+    fence masks.
+    """
+    mask_size = (size * size + 7) // 8
+    header = POSITION_HEADER.pack(POSITION_VERSION, size, pawns[0], pawns[1],
+                                  fences[0], fences[1], whose_move)
+    return header + b"".join(mask.to_bytes(mask_size, "little") for mask in masks)
+
+
+def unpack_position(data):
+    """
+    Returns the (size, pawns, fences, whose_move, masks) of a record made by
+    pack_position, or raises ValueError if data isn't one or any of its
+    values is out of range for its board.
+    """
+    if len(data) < POSITION_HEADER.size:
+        raise ValueError("position record is too short")
+    version, size, p1, p2, p1_fences, p2_fences, whose_move = POSITION_HEADER.unpack_from(data)
+    mask_size = (size * size + 7) // 8
+    if version != POSITION_VERSION or len(data) != POSITION_HEADER.size + 4 * mask_size:
+        raise ValueError("not a version " + str(POSITION_VERSION) + " position record")
+
+    start = POSITION_HEADER.size
+    masks = tuple(int.from_bytes(data[start + i * mask_size:start + (i + 1) * mask_size], "little")
+                  for i in range(4))
+    check_position(size, (p1, p2), (p1_fences, p2_fences), whose_move, masks)
+    return size, (p1, p2), (p1_fences, p2_fences), whose_move, masks
+
+
+def check_position(size, pawns, fences, whose_move, masks):
+    """
+    Raises ValueError unless an unpacked position fits its board: a board
+    size, both pawns on distinct squares, no more fences in hand than there
+    are fence slots, 1 or 2 to move, and fences only on slots that exist,
+    owned only where there is a fence.
+    """
+    check_board_size(size)
+    count = size * size
+    if not (0 <= pawns[0] < count and 0 <= pawns[1] < count) or pawns[0] == pawns[1]:
+        raise ValueError("pawn squares " + repr(pawns) + " don't fit a " + str(size) + " x " + str(size) + " board")
+    if max(fences) > 2 * size * (size - 1):
+        raise ValueError("more fences in hand than a " + str(size) + " x " + str(size) + " board has slots")
+    if whose_move not in (1, 2):
+        raise ValueError("whose move must be 1 or 2, not " + str(whose_move))
+
+    geometry = BoardGeometry.of_size(size)
+    h_walls, v_walls, p2_h_walls, p2_v_walls = masks
+    if h_walls & ~geometry.get_h_anchors() or v_walls & ~geometry.get_v_anchors() or \
+            p2_h_walls & ~h_walls or p2_v_walls & ~v_walls:
+        raise ValueError("fence masks with fences off the board's fence slots")
+
+
+def restore_state(size, p1_square, p2_square, h_walls, v_walls, p1_fences, p2_fences, whose_move):
+    """
+    Returns the GameState of a position given as plain integers.
+    """
+    state = GameState(size)
+    state.set_position((p1_square, p2_square), h_walls, v_walls, (p1_fences, p2_fences), whose_move)
+    return state
+
+
+class PathEngine:
+    """
+    Keeps, for both players, the distance from every square to their goal row
+    on a board of fences. Adding a fence only repairs the squares whose every
+    shortest path crossed the new fence instead of searching the whole board
+    again, so most fences cost nothing at all.
+    """
+
+    def __init__(self, geometry, h_walls=0, v_walls=0):
+        """
+        Builds both players' distances for the given fence masks.
+        """
+        self._geometry = geometry
+        self.reset(h_walls, v_walls)
+
+    def reset(self, h_walls, v_walls):
+        """
+        Throws away the distances and searches the board again for new fence masks.
+        """
+        self._h_walls = h_walls
+        self._v_walls = v_walls
+        self._distances = [None, self._full_search(1), self._full_search(2)]
+
+        # The bridge masks of the current fences, found when first needed.
+        self._bridges = None
+
+    def _full_search(self, player):
+        """
+        Returns the distance of every square to player's goal row.
+        """
+        return self._geometry.distance_field(self._h_walls, self._v_walls, player)
+
+    def _open_neighbors(self, square):
+        """Returns the squares one unfenced step away from square"""
+        neighbors = []
+        for direction in DIRECTIONS:
+            target = self._geometry.open_step(square, direction, self._h_walls, self._v_walls)
+            if target >= 0:
+                neighbors.append(target)
+        return neighbors
+
+    def get_h_walls(self):
+        """Returns the horizontal fence mask the distances are for"""
+        return self._h_walls
+
+    def get_v_walls(self):
+        """Returns the vertical fence mask the distances are for"""
+        return self._v_walls
+
+    def get_distance(self, player, square):
+        """
+        Returns the number of steps from square to player's goal row, or -1 if
+        the fences cut square off from it.
+        """
+        distance = self._distances[player][square]
+        return -1 if distance == UNREACHABLE else distance
+
+    def add_fence(self, direction, square):
+        """
+        Adds an 'h' or 'v' fence anchored on square and repairs both players'
+        distances.
+        """
+        if direction == "h":
+            self._h_walls |= 1 << square
+        else:
+            self._v_walls |= 1 << square
+
+        first, second = self._geometry.fence_edge(direction, square)
+        for player in (1, 2):
+            self._repair(self._distances[player], first, second)
+        self._bridges = None
+
+    def remove_fence(self, direction, square):
+        """
+        Takes down an 'h' or 'v' fence anchored on square. Distances can only
+        shrink, so the shorter routes are spread outward from the reopened step.
+        """
+        if direction == "h":
+            self._h_walls &= ~(1 << square)
+        else:
+            self._v_walls &= ~(1 << square)
+
+        first, second = self._geometry.fence_edge(direction, square)
+        for player in (1, 2):
+            self._relax(self._distances[player], first, second)
+        self._bridges = None
+
+    def _relax(self, distances, first, second):
+        """
+        Spreads shorter distances outward after the step between first and
+        second was opened.
+        """
+        queue = deque()
+        for square, target in ((first, second), (second, first)):
+            if distances[square] + 1 < distances[target]:
+                distances[target] = distances[square] + 1
+                queue.append(target)
+
+        while queue:
+            square = queue.popleft()
+            for target in self._open_neighbors(square):
+                if distances[square] + 1 < distances[target]:
+                    distances[target] = distances[square] + 1
+                    queue.append(target)
+
+    def _repair(self, distances, first, second):
+        """
+        Repairs one player's distances after the step between first and second
+        was fenced off. Only the far square of that step, and the squares whose
+        every shortest path ran through it, can get further from the goal.
+        """
+        far, near = (first, second) if distances[first] > distances[second] else (second, first)
+        if not self._only_parent(distances, far, near):
+            return
+
+        affected = self._find_affected(distances, far)
+        for square in affected:
+            distances[square] = UNREACHABLE
+        self._settle(distances, affected)
+
+    def _only_parent(self, distances, far, near):
+        """
+        Returns True if near is the only square one step closer to the goal
+        than far that far can step to, so fencing them apart moves far away.
+        """
+        if distances[far] != distances[near] + 1:
+            return False
+        for target in self._open_neighbors(far):
+            if target != near and distances[target] == distances[far] - 1:
+                return False
+        return True
+
+    def would_seal(self, direction, square, pawn_squares):
+        """
+        Returns True if an 'h' or 'v' fence anchored on square would leave a
+        pawn with no way to its goal row. pawn_squares is indexed by player.
+        Only a fence on a bridge whose every shortest path runs through it sends
+        the board to a new search; every other fence is answered from the cache.
+        """
+        if self._bridges is None:
+            self._bridges = self._find_bridges()
+        if not self._bridges[direction == "v"] & (1 << square):
+            return False
+
+        first, second = self._geometry.fence_edge(direction, square)
+        h_walls = self._h_walls | (1 << square if direction == "h" else 0)
+        v_walls = self._v_walls | (1 << square if direction == "v" else 0)
+
+        for player in (1, 2):
+            distances = self._distances[player]
+            far, near = (first, second) if distances[first] > distances[second] else (second, first)
+            if self._only_parent(distances, far, near) and \
+                    self._seal_search(h_walls, v_walls, player, pawn_squares[player]) < 0:
+                return True
+        return False
+
+    def _find_bridges(self):
+        """Returns the bridge masks of the current fences"""
+        return self._geometry.bridges(self._h_walls, self._v_walls)
+
+    def _seal_search(self, h_walls, v_walls, player, square):
+        """
+        Returns the number of steps from square to player's goal row with
+        fence masks h_walls and v_walls, or -1 if there is no way there.
+        """
+        return self._geometry.shortest_path(h_walls, v_walls, square, self._geometry.get_goal_row(player))
+
+    def _has_parent(self, distances, square, affected):
+        """
+        Returns True if square still has an open step to a square one closer
+        to the goal that is not in affected.
+        """
+        for target in self._open_neighbors(square):
+            if distances[target] == distances[square] - 1 and target not in affected:
+                return True
+        return False
+
+    def _find_affected(self, distances, start):
+        """
+        Returns the set of squares that lost every shortest path, starting at
+        start. Squares are settled in distance order, so a square's parents are
+        always decided before the square itself.
+        """
+        affected = set()
+        heap = [(distances[start], start)]
+        while heap:
+            distance, square = heapq.heappop(heap)
+            if square in affected or (square != start and self._has_parent(distances, square, affected)):
+                continue
+            affected.add(square)
+            for target in self._open_neighbors(square):
+                if distances[target] == distance + 1:
+                    heapq.heappush(heap, (distance + 1, target))
+        return affected
+
+    def _settle(self, distances, affected):
+        """
+        Gives the affected squares their new distances, growing outward from
+        the unaffected squares around them.
+        """
+        heap = []
+        for square in affected:
+            for target in self._open_neighbors(square):
+                if target not in affected and distances[target] + 1 < distances[square]:
+                    distances[square] = distances[target] + 1
+            if distances[square] != UNREACHABLE:
+                heap.append((distances[square], square))
+        heapq.heapify(heap)
+
+        while heap:
+            distance, square = heapq.heappop(heap)
+            if distance > distances[square]:
+                continue
+            for target in self._open_neighbors(square):
+                if distance + 1 < distances[target]:
+                    distances[target] = distance + 1
+                    heapq.heappush(heap, (distance + 1, target))
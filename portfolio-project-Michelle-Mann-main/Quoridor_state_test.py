@@ -0,0 +1,255 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Unit Test for the compact Quoridor game state
+
+import random
+import unittest
+from Quoridor import QuoridorGame
+from Quoridor_state import BoardGeometry, GameState, PathEngine
+
+
+class TestGameState(unittest.TestCase):
+    """Contains the unit test for GameState"""
+
+    def test_geometry(self):
+        """
+        Tests the coordinate and move code helpers of a BoardGeometry.
+        """
+        geometry = BoardGeometry.of_size(9)
+
+        # Geometries are shared per board size.
+        self.assertIs(geometry, BoardGeometry.of_size(9))
+
+        self.assertEqual(geometry.square_of((4, 0)), 4)
+        self.assertEqual(geometry.square_of((9, 0)), -1)
+        self.assertEqual(geometry.coord_of(76), (4, 8))
+
+        # Every move of a 9 x 9 board fits in one byte.
+        self.assertEqual(geometry.describe_move(geometry.pawn_move((4, 1))), ("pawn", (4, 1)))
+        self.assertEqual(geometry.describe_move(geometry.fence_move("h", (6, 5))), ("h", (6, 5)))
+        self.assertEqual(geometry.describe_move(geometry.fence_move("v", (3, 3))), ("v", (3, 3)))
+        self.assertLess(geometry.fence_move("v", (8, 8)), 256)
+
+    def test_start_position(self):
+        """
+        Tests the starting position and its legal moves.
+        """
+        state = GameState()
+        geometry = state.get_geometry()
+
+        pawn_moves = sorted(geometry.coord_of(s) for s in state.pawn_moves())
+
+        self.assertEqual(state.get_pawn(1), (4, 0))
+        self.assertEqual(state.get_pawn(2), (4, 8))
+        self.assertEqual(state.get_whose_move(), 1)
+        self.assertEqual(pawn_moves, [(3, 0), (4, 1), (5, 0)])
+
+        # 72 horizontal and 72 vertical inner fence slots.
+        self.assertEqual(len(state.fence_moves()), 144)
+
+    def test_moves_and_fences(self):
+        """
+        Tests the README example game on a GameState.
+        """
+        state = GameState()
+
+        self.assertFalse(state.move_pawn(2, (4, 7)))
+        self.assertTrue(state.move_pawn(1, (4, 1)))
+        self.assertFalse(state.place_fence(1, "h", (6, 5)))
+        self.assertTrue(state.move_pawn(2, (4, 7)))
+        self.assertTrue(state.place_fence(1, "h", (6, 5)))
+        self.assertTrue(state.place_fence(2, "v", (3, 3)))
+
+        # The slot is taken, and outer edges can't take a fence.
+        self.assertFalse(state.place_fence(1, "h", (6, 5)))
+        self.assertFalse(state.place_fence(1, "v", (0, 3)))
+        self.assertFalse(state.place_fence(1, "h", (3, 0)))
+
+        self.assertEqual(state.get_no_of_fences(1), 9)
+        self.assertEqual(state.get_no_of_fences(2), 9)
+        self.assertFalse(state.is_winner(1))
+        self.assertFalse(state.is_winner(2))
+
+    def test_jump_and_diagonal(self):
+        """
+        Tests jumping over a facing pawn, and stepping around it when a fence
+        is behind it.
+        """
+        state = GameState()
+        geometry = state.get_geometry()
+        state.set_position((geometry.square_of((4, 3)), geometry.square_of((4, 4))),
+                           0, 0, (10, 10), 1)
+
+        self.assertIn(geometry.square_of((4, 5)), state.pawn_moves())
+
+        # A fence behind player 2 turns the jump into two diagonals.
+        state.set_position((geometry.square_of((4, 3)), geometry.square_of((4, 4))),
+                           1 << geometry.square_of((4, 5)), 0, (10, 10), 1)
+        pawn_moves = sorted(geometry.coord_of(s) for s in state.pawn_moves())
+
+        self.assertEqual(pawn_moves, [(3, 3), (3, 4), (4, 2), (5, 3), (5, 4)])
+
+    def test_copy_and_hash(self):
+        """
+        Tests that copies are independent and that equal positions hash equally.
+        """
+        state = GameState()
+        clone = state.copy()
+
+        self.assertEqual(state, clone)
+        self.assertEqual(hash(state), hash(clone))
+
+        clone.move_pawn(1, (4, 1))
+        self.assertNotEqual(state, clone)
+        self.assertEqual(state.get_pawn(1), (4, 0))
+
+        # A packed record restores the same position.
+        clone.place_fence(2, "v", (3, 3))
+        self.assertEqual(GameState.from_bytes(clone.to_bytes()), clone)
+
+    def test_winner(self):
+        """
+        Tests that reaching the goal row wins and ends the game.
+        """
+        state = GameState()
+        geometry = state.get_geometry()
+        state.set_position((geometry.square_of((4, 7)), geometry.square_of((0, 1))),
+                           0, 0, (10, 10), 1)
+
+        self.assertTrue(state.move_pawn(1, (4, 8)))
+        self.assertTrue(state.is_winner(1))
+        self.assertEqual(state.legal_moves(), [])
+        self.assertFalse(state.move_pawn(2, (0, 2)))
+
+    def test_from_game(self):
+        """
+        Tests that QuoridorGame.to_state matches the same moves played on a state.
+        """
+        game = QuoridorGame()
+        state = GameState()
+
+        for player, direction, coord in ((1, None, (4, 1)), (2, None, (4, 7)),
+                                         (1, "h", (6, 5)), (2, "v", (3, 3))):
+            if direction is None:
+                game.move_pawn(player, coord)
+                state.move_pawn(player, coord)
+            else:
+                game.place_fence(player, direction, coord)
+                state.place_fence(player, direction, coord)
+
+        self.assertEqual(game.to_state(), state)
+
+    def test_rules_match_game(self):
+        """
+        Tests that GameState and QuoridorGame agree on the legal moves of
+        every position of a few random games.
+        """
+        rng = random.Random(7)
+
+        for _ in range(8):
+            game = QuoridorGame()
+            state = GameState()
+            geometry = state.get_geometry()
+
+            for _ in range(200):
+                if state.get_winner():
+                    break
+                player = state.get_whose_move()
+                pawn_moves = sorted(geometry.coord_of(s) for s in state.pawn_moves())
+                fence_moves = sorted(geometry.describe_move(m)[::-1] for m in state.fence_moves())
+
+                self.assertEqual(sorted(game.legal_pawn_moves(player)), pawn_moves)
+                self.assertEqual(sorted((c, d) for d, c in game.legal_fence_placements(player)),
+                                 fence_moves)
+
+                # Favor pawn moves so the games end.
+                use_fence = rng.random() < 0.3 and state.fence_moves()
+                move = rng.choice(state.fence_moves() if use_fence else state.pawn_moves())
+                kind, coord = geometry.describe_move(move)
+                if kind == "pawn":
+                    self.assertTrue(game.move_pawn(player, coord))
+                else:
+                    self.assertTrue(game.place_fence(player, kind, coord))
+                state.make_move(move)
+                self.assertEqual(game.get_zobrist_key(), state.get_zobrist_key())
+
+            self.assertEqual(game.to_state(), state)
+
+    def test_path_engine(self):
+        """
+        Tests that a PathEngine repaired fence by fence matches one built from
+        scratch, and agrees with a direct search from any square.
+        """
+        rng = random.Random(11)
+        geometry = BoardGeometry.of_size(9)
+        engine = PathEngine(geometry)
+
+        self.assertEqual(engine.get_distance(1, geometry.square_of((4, 0))), 8)
+        self.assertEqual(engine.get_distance(2, geometry.square_of((4, 0))), 0)
+
+        anchors = [("h", geometry.square_of(c)) for c in geometry.get_fence_anchors("h")] + \
+                  [("v", geometry.square_of(c)) for c in geometry.get_fence_anchors("v")]
+        rng.shuffle(anchors)
+
+        for direction, square in anchors[:80]:
+            engine.add_fence(direction, square)
+            fresh = PathEngine(geometry, engine.get_h_walls(), engine.get_v_walls())
+
+            for player in (1, 2):
+                for check in range(geometry.get_square_count()):
+                    self.assertEqual(engine.get_distance(player, check), fresh.get_distance(player, check))
+
+        # Take half the fences down again in a different order.
+        placed = anchors[:80]
+        rng.shuffle(placed)
+        for direction, square in placed[:40]:
+            engine.remove_fence(direction, square)
+        fresh = PathEngine(geometry, engine.get_h_walls(), engine.get_v_walls())
+
+        for check in range(geometry.get_square_count()):
+            self.assertEqual(engine.get_distance(2, check), fresh.get_distance(2, check))
+
+        # Spot check against a plain search from each square.
+        for check in range(0, geometry.get_square_count(), 7):
+            expected = geometry.shortest_path(engine.get_h_walls(), engine.get_v_walls(), check,
+                                              geometry.get_goal_row(1))
+            self.assertEqual(engine.get_distance(1, check), expected)
+
+    def test_fair_play(self):
+        """
+        Tests that fences sealing a pawn in are not legal, and that a player
+        with no fences left can't place one.
+        """
+        state = GameState(no_of_fences=3)
+        geometry = state.get_geometry()
+
+        # Box player 1 into the top left corner, leaving one gap.
+        state.set_position((geometry.square_of((0, 0)), geometry.square_of((4, 8))),
+                           1 << geometry.square_of((0, 1)), 0, (2, 3), 2)
+        sealing = geometry.fence_move("v", (1, 0))
+
+        self.assertFalse(state.is_legal(sealing))
+        self.assertNotIn(sealing, state.fence_moves())
+        self.assertTrue(state.place_fence(2, "v", (2, 0)))
+
+        # Spend the rest of both players' fences.
+        for player, coord in ((1, (5, 5)), (2, (6, 5)), (1, (7, 5)), (2, (8, 5))):
+            self.assertTrue(state.place_fence(player, "h", coord))
+
+        self.assertEqual(state.fence_moves(), [])
+        self.assertFalse(state.place_fence(1, "h", (2, 2)))
+
+    def test_bridges(self):
+        """
+        Tests that only the steps that are the sole link between two parts of
+        the board are reported as bridges.
+        """
+        geometry = BoardGeometry.of_size(9)
+
+        self.assertEqual(geometry.bridges(0, 0), (0, 0))
+
+        # Fence (0, 0) in on its right; its step down is now a bridge.
+        bridge_h, bridge_v = geometry.bridges(0, 1 << geometry.square_of((1, 0)))
+
+        self.assertEqual(bridge_h, 1 << geometry.square_of((0, 1)))
+        self.assertEqual(bridge_v, 0)
@@ -0,0 +1,256 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Endgame tablebase for Quoridor positions without fences.
+# Once neither player has a fence left the fences can't change, and the
+# game is a pawn race on a fixed wall layout. Every position of that race
+# (both pawns and whose move) is solved exactly by retrograde analysis:
+# starting from the won positions and working back to the ones that lead
+# to them. Solved layouts are kept in memory and, optionally, in a folder
+# of table files named by a hash of the walls.
+
+import hashlib
+import os
+import struct
+import sys
+from array import array
+from collections import OrderedDict
+
+from Quoridor_state import BoardGeometry, pawn_targets
+
+# The file header: magic, format version and board size. The two fence
+# masks follow, then one distance per position.
+TABLE_HEADER = struct.Struct("<4sBB")
+MAGIC = b"QRTB"
+VERSION = 1
+
+# A position's value is the number of plies to the end of the game with
+# best play: odd when the player to move wins, even when they lose (0 for
+# a game already lost). DRAW marks positions neither player can force.
+DRAW = -1
+
+SWAP_BYTES = sys.byteorder != "little"
+
+
+def position_index(count, whose_move, p1_square, p2_square):
+    """
+    Returns the index of a position in the table of a board of count squares.
+    """
+    return ((whose_move - 1) * count + p1_square) * count + p2_square
+
+
+def wall_hash(size, h_walls, v_walls):
+    """
+    Returns the hex hash a wall layout's table file is named by.
+    """
+    mask_size = (size * size + 7) // 8
+    data = bytes([size]) + h_walls.to_bytes(mask_size, "little") + v_walls.to_bytes(mask_size, "little")
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def link_positions(geometry, h_walls, v_walls):
+    """
+    Returns the starting values of every position, the number of moves out
+    of each and the positions each one can be reached from. Finished games
+    start at 0 and the rest at DRAW.
+    """
+    count = geometry.get_square_count()
+    values = array("h", [DRAW]) * (2 * count * count)
+    moves_left = array("H", [0]) * (2 * count * count)
+    sources = [[] for _ in range(2 * count * count)]
+    goal_rows = (None, geometry.get_goal_row(1), geometry.get_goal_row(2))
+
+    for p1 in range(count):
+        for p2 in range(count):
+            if p1 == p2:
+                continue
+            finished = geometry.row_of(p1) == goal_rows[1] or geometry.row_of(p2) == goal_rows[2]
+            for whose_move in (1, 2):
+                index = position_index(count, whose_move, p1, p2)
+                if finished:
+                    values[index] = 0
+                    continue
+                own, opponent = (p1, p2) if whose_move == 1 else (p2, p1)
+                targets = pawn_targets(geometry, h_walls, v_walls, own, opponent)
+                moves_left[index] = len(targets)
+                for target in targets:
+                    pawns = (target, p2) if whose_move == 1 else (p1, target)
+                    sources[position_index(count, 3 - whose_move, *pawns)].append(index)
+    return values, moves_left, sources
+
+
+def solve(size, h_walls, v_walls):
+    """
+    Returns the values of every position of a wall layout, as an array
+    indexed by position_index.
+    """
+    values, moves_left, sources = link_positions(BoardGeometry.of_size(size), h_walls, v_walls)
+
+    # Positions are settled in order of distance. A position is won as soon
+    # as one move leads to a lost one, and lost once every move leads to a
+    # won one; the last of those is the furthest away.
+    queue = [index for index, value in enumerate(values) if value == 0]
+    for index in queue:
+        distance = values[index] + 1
+        for source in sources[index]:
+            if values[source] != DRAW or moves_left[source] == 0:
+                continue
+            if distance % 2:
+                values[source] = distance
+                moves_left[source] = 0
+                queue.append(source)
+            else:
+                moves_left[source] -= 1
+                if moves_left[source] == 0:
+                    values[source] = distance
+                    queue.append(source)
+    return values
+
+
+def move_order(value):
+    """
+    Sorts moves by the value they leave the opponent: a loss for them first,
+    the quickest first, then a draw, then a win for them, the slowest first.
+    """
+    if value == DRAW:
+        return 1, 0
+    return (0, value) if value % 2 == 0 else (2, -value)
+
+
+class Tablebase:
+    """
+    Represents the solved fenceless endgames of any wall layouts. Layouts are
+    solved on first use, and kept in memory (up to memory_size of them) and
+    in folder, if one is given.
+    """
+
+    def __init__(self, folder=None, memory_size=64):
+        """
+        Creates a tablebase that caches table files in folder (None for no
+        disk cache).
+        """
+        self._folder = folder
+        self._memory_size = memory_size
+        self._tables = OrderedDict()
+        if folder is not None:
+            os.makedirs(folder, exist_ok=True)
+
+    def __len__(self):
+        """Returns the number of wall layouts held in memory"""
+        return len(self._tables)
+
+    def get_folder(self):
+        """Returns the folder table files are cached in, or None"""
+        return self._folder
+
+    def table_path(self, size, h_walls, v_walls):
+        """Returns the path of a wall layout's table file, or None"""
+        if self._folder is None:
+            return None
+        return os.path.join(self._folder, str(size) + "-" + wall_hash(size, h_walls, v_walls) + ".qtb")
+
+    def has_table(self, size, h_walls, v_walls):
+        """
+        Returns True if a wall layout's table is in memory.
+        """
+        return (size, h_walls, v_walls) in self._tables
+
+    def get_table(self, size, h_walls, v_walls):
+        """
+        Returns the values of a wall layout, from memory, from its table file
+        or by solving it.
+        """
+        key = (size, h_walls, v_walls)
+        values = self._tables.get(key)
+        if values is not None:
+            self._tables.move_to_end(key)
+            return values
+
+        path = self.table_path(size, h_walls, v_walls)
+        values = read_table(path, size, h_walls, v_walls) if path is not None else None
+        if values is None:
+            values = solve(size, h_walls, v_walls)
+            if path is not None:
+                write_table(path, size, h_walls, v_walls, values)
+
+        self._tables[key] = values
+        if len(self._tables) > self._memory_size:
+            self._tables.popitem(last=False)
+        return values
+
+    def covers(self, state):
+        """
+        Returns True if a GameState is a fenceless endgame.
+        """
+        return state.get_no_of_fences(1) == 0 and state.get_no_of_fences(2) == 0
+
+    def value(self, state):
+        """
+        Returns the value of a fenceless GameState: plies to the end with best
+        play, odd if the player to move wins and even if they lose, or DRAW.
+        """
+        geometry = state.get_geometry()
+        values = self.get_table(state.get_size(), state.get_h_walls(), state.get_v_walls())
+        return values[position_index(geometry.get_square_count(), state.get_whose_move(),
+                                     state.get_pawn_square(1), state.get_pawn_square(2))]
+
+    def best_move(self, state):
+        """
+        Returns the best pawn move of a fenceless GameState, or -1 if the game
+        is over.
+        """
+        if state.get_winner():
+            return -1
+        geometry = state.get_geometry()
+        values = self.get_table(state.get_size(), state.get_h_walls(), state.get_v_walls())
+        count = geometry.get_square_count()
+        whose_move = state.get_whose_move()
+        pawns = [state.get_pawn_square(1), state.get_pawn_square(2)]
+
+        def after(move):
+            moved = list(pawns)
+            moved[whose_move - 1] = move
+            return move_order(values[position_index(count, 3 - whose_move, *moved)])
+
+        return min(state.pawn_moves(), key=after, default=-1)
+
+
+def read_table(path, size, h_walls, v_walls):
+    """
+    Returns the values in a table file, or None if there is no such file or
+    it isn't the table of this wall layout.
+    """
+    mask_size = (size * size + 7) // 8
+    header = TABLE_HEADER.pack(MAGIC, VERSION, size) + h_walls.to_bytes(mask_size, "little") + \
+        v_walls.to_bytes(mask_size, "little")
+    try:
+        with open(path, "rb") as table_file:
+            data = table_file.read()
+    except FileNotFoundError:
+        return None
+
+    count = size * size
+    if data[:len(header)] != header or len(data) != len(header) + 4 * count * count:
+        return None
+    values = array("h")
+    values.frombytes(data[len(header):])
+    if SWAP_BYTES:
+        values.byteswap()
+    return values
+
+
+def write_table(path, size, h_walls, v_walls, values):
+    """
+    Writes the values of a wall layout to a table file. The file is written
+    under a temporary name and then renamed, so readers in other processes
+    never see half a table.
+    """
+    mask_size = (size * size + 7) // 8
+    if SWAP_BYTES:
+        values = array("h", values)
+        values.byteswap()
+    temporary = path + "." + str(os.getpid()) + ".tmp"
+    with open(temporary, "wb") as table_file:
+        table_file.write(TABLE_HEADER.pack(MAGIC, VERSION, size))
+        table_file.write(h_walls.to_bytes(mask_size, "little") + v_walls.to_bytes(mask_size, "little"))
+        table_file.write(values.tobytes())
+    os.replace(temporary, path)
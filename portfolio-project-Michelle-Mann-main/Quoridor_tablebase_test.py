@@ -0,0 +1,85 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Unit Test for the Quoridor endgame tablebase
+
+import os
+import tempfile
+import unittest
+from Quoridor_engine import SearchEngine
+from Quoridor_state import GameState
+from Quoridor_tablebase import DRAW, Tablebase, position_index, read_table, solve, wall_hash
+
+
+def fenceless(size, p1, p2, h_walls=0, v_walls=0, whose_move=1):
+    """Returns a GameState with no fences in hand, at the given position"""
+    state = GameState(size)
+    geometry = state.get_geometry()
+    state.set_position((geometry.square_of(p1), geometry.square_of(p2)), h_walls, v_walls, (0, 0), whose_move)
+    return state
+
+
+class TestTablebase(unittest.TestCase):
+    """Contains the unit test for the endgame tablebase"""
+
+    def test_solved_values(self):
+        """
+        Tests some values of a solved layout, and that playing the best moves
+        ends the game in exactly as many plies as the table says.
+        """
+        values = solve(5, 0, 0)
+        self.assertEqual(values[position_index(25, 1, 22, 2)], 0)
+        self.assertEqual(values[position_index(25, 1, 17, 12)], 1)
+        self.assertEqual(values[position_index(25, 2, 17, 12)], 2)
+        self.assertNotIn(DRAW, [values[position_index(25, whose_move, p1, p2)] for whose_move in (1, 2)
+                                for p1 in range(25) for p2 in range(25) if p1 != p2])
+
+        tablebase = Tablebase()
+        walls = (1 << 11) | (1 << 12), 1 << 16
+        for state in (fenceless(9, (4, 0), (4, 8)), fenceless(5, (0, 1), (3, 2), *walls, whose_move=2)):
+            plies = tablebase.value(state)
+            winner = state.get_whose_move() if plies % 2 else 3 - state.get_whose_move()
+            for _ in range(plies):
+                state.make_move(tablebase.best_move(state))
+            self.assertEqual(state.get_winner(), winner)
+            self.assertEqual(tablebase.best_move(state), -1)
+        self.assertEqual(len(tablebase), 2)
+
+    def test_disk_cache(self):
+        """
+        Tests that solved layouts are written to files named by their wall
+        hash, read back by another tablebase, and solved again if damaged.
+        """
+        state = fenceless(5, (2, 0), (2, 4), 1 << 12, 1 << 8)
+        with tempfile.TemporaryDirectory() as folder:
+            first = Tablebase(folder)
+            value = first.value(state)
+            path = first.table_path(5, 1 << 12, 1 << 8)
+            self.assertEqual(os.path.basename(path), "5-" + wall_hash(5, 1 << 12, 1 << 8) + ".qtb")
+            self.assertEqual(read_table(path, 5, 1 << 12, 1 << 8), solve(5, 1 << 12, 1 << 8))
+            self.assertIsNone(read_table(path, 5, 1 << 12, 0))
+
+            second = Tablebase(folder)
+            self.assertFalse(second.has_table(5, 1 << 12, 1 << 8))
+            self.assertEqual(second.value(state), value)
+            self.assertTrue(second.has_table(5, 1 << 12, 1 << 8))
+
+            with open(path, "r+b") as table_file:
+                table_file.truncate(100)
+            self.assertEqual(Tablebase(folder).value(state), value)
+            self.assertEqual(os.path.getsize(path), 6 + 2 * 4 + 4 * 625)
+
+    def test_engine_uses_tablebase(self):
+        """
+        Tests that the search engine answers fenceless positions from the
+        tablebase without searching, and keeps searching while fences last.
+        """
+        tablebase = Tablebase()
+        engine = SearchEngine(time_budget=None, max_depth=2, tablebase=tablebase)
+        state = fenceless(9, (4, 3), (4, 5))
+
+        self.assertEqual(engine.choose_move(state), tablebase.best_move(state))
+        self.assertEqual(engine.get_node_count(), 0)
+
+        state.set_position((state.get_pawn_square(1), state.get_pawn_square(2)), 0, 0, (1, 0), 1)
+        self.assertIn(engine.choose_move(state), state.legal_moves())
+        self.assertGreater(engine.get_node_count(), 0)
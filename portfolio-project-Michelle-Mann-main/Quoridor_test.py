@@ -4,6 +4,7 @@
 
 import unittest
 from Quoridor import Node, GameBoard, Fence, Player, QuoridorGame
+from Quoridor_state import POSITION_HEADER, GameState
 
 
 class TestQuoridor(unittest.TestCase):
@@ -49,6 +50,29 @@ class TestQuoridor(unittest.TestCase):
         self.assertEqual(result, test)
         self.assertEqual(result_2, test_2)
 
+    def test_shared_node_tables(self):
+        """
+        Tests that nearby nodes and wall lists are read-only views shared by
+        every node, and that walls are set and cleared one side at a time.
+        """
+        node_1 = QuoridorGame().get_game_board().find_board_node((3, 3))
+        node_2 = QuoridorGame().get_game_board().find_board_node((3, 3))
+
+        self.assertIs(node_1.get_nearby_nodes(), node_2.get_nearby_nodes())
+        self.assertIs(node_1.get_list_of_walls(), node_2.get_list_of_walls())
+
+        with self.assertRaises(TypeError):
+            node_1.get_list_of_walls()["up"] = True
+
+        self.assertIs(node_1.set_left_wall(), True)
+        self.assertEqual(node_1.set_left_wall(), "Wall already exists")
+        self.assertEqual(node_1.get_list_of_walls(),
+                         {"up": False, "down": False, "left": True, "right": False})
+        self.assertFalse(node_2.get_left_wall())
+
+        node_1.clear_left_wall()
+        self.assertIs(node_1.get_left_wall(), False)
+
     def test_game_board_object(self):
         """
         Tests all get/set methods for a game board object.
@@ -117,6 +141,21 @@ class TestQuoridor(unittest.TestCase):
 
         self.assertEqual(result, test_1)
 
+    def test_create_gameboard_2(self):
+        """
+        Tests that a board built with other dimensions than its size is read
+        back and walled in with those dimensions by default.
+        """
+        board_1 = GameBoard()
+        board_1.create_board(cols=4, rows=3)
+        board_1.establish_outer_fences()
+
+        self.assertEqual(board_1.to_plain_board(), [[(0, 0), (1, 0), (2, 0), (3, 0)],
+                                                    [(0, 1), (1, 1), (2, 1), (3, 1)],
+                                                    [(0, 2), (1, 2), (2, 2), (3, 2)]])
+        self.assertTrue(board_1.find_board_node((3, 1)).get_right_wall())
+        self.assertTrue(board_1.find_board_node((1, 2)).get_down_wall())
+
     def test_game_board_walls(self):
         """
         Tests whether GameBoard class initializes walls correctly. Tests
@@ -207,6 +246,120 @@ class TestQuoridor(unittest.TestCase):
         self.assertEqual(result, test_1)
         self.assertEqual(result_2, test_2)
 
+    def test_board_index(self):
+        """
+        Tests that the grid and player indexes of a GameBoard agree with
+        the linked list they are built from.
+        """
+        board_1 = GameBoard()
+        board_1.create_board()
+
+        # Every node in the list can be found by its own name.
+        pos = board_1.get_head()
+        while pos is not None:
+            self.assertIs(board_1.find_board_node(pos.get_node_name()), pos)
+            pos = pos.get_next()
+
+        # Moving a player through the board keeps the player index current.
+        node_1 = board_1.find_board_node((4, 0))
+        node_2 = board_1.find_board_node((4, 1))
+        board_1.set_player_node(1, node_1)
+        board_1.set_player_node(1, node_2)
+
+        self.assertIs(board_1.find_player_node(1), node_2)
+        self.assertIsNone(node_1.get_player_data())
+
+        # Off-board and malformed coordinates do not exist.
+        test_1 = "The node coordinate you're looking for does not exist."
+        self.assertEqual(board_1.find_board_node((-1, 0)), test_1)
+        self.assertEqual(board_1.find_board_node(None), test_1)
+
+    def test_board_size(self):
+        """
+        Tests that boards larger than the recursion limit allows build, fence
+        their edges and play, and that winning areas follow the size.
+        """
+        board_1 = GameBoard(40)
+        board_1.create_board()
+        board_1.establish_outer_fences()
+
+        result = board_1.to_plain_board()
+
+        self.assertEqual(len(result), 40)
+        self.assertEqual(result[39][:2], [(0, 39), (1, 39)])
+        self.assertEqual(board_1.get_p1_winning_area()[0], (0, 39))
+        self.assertEqual(board_1.get_outer_bounds(), [(0, 0), (39, 39)])
+
+        # The bottom right corner is fenced on its own outer sides only.
+        corner = board_1.find_board_node((39, 39))
+        self.assertEqual(corner.get_list_of_walls(),
+                         {"up": False, "down": True, "left": False, "right": True})
+
+        # A 5 x 5 game starts in the middle and ends on the far row.
+        q = QuoridorGame(5)
+
+        self.assertEqual(q.get_player_2().get_current_position(), (2, 4))
+        for player, coord in ((1, (2, 1)), (2, (2, 3)), (1, (2, 2)), (2, (1, 3)),
+                              (1, (2, 3)), (2, (1, 2)), (1, (2, 4))):
+            self.assertTrue(q.move_pawn(player, coord))
+        self.assertTrue(q.is_winner(1))
+
+        q = QuoridorGame(50)
+
+        self.assertTrue(q.place_fence(1, "h", (25, 49)))
+        self.assertFalse(q.move_pawn(2, (25, 48)))
+        self.assertEqual(q.get_path_distance(2), 50)
+
+    def test_winner(self):
+        """
+        Tests that the winner is kept up to date by pawn moves of either
+        player, by unmake and redo, and by load_position.
+        """
+        q = QuoridorGame(5)
+        for player, coord in ((1, (2, 1)), (2, (2, 3)), (1, (2, 2)), (2, (1, 3)),
+                              (1, (2, 3)), (2, (1, 2)), (1, (2, 4))):
+            self.assertEqual(q.get_winner(), 0)
+            self.assertTrue(q.move_pawn(player, coord))
+        self.assertEqual([q.winner, q.is_winner(1), q.is_winner(2)], [1, True, False])
+        self.assertFalse(q.move_pawn(2, (1, 1)))
+        self.assertFalse(q.place_fence(2, "h", (3, 3)))
+
+        # Taking the winning move back reopens the game; redoing it ends it again.
+        q.unmake()
+        self.assertEqual([q.winner, q.is_winner(1)], [0, False])
+        q.redo()
+        self.assertEqual(q.get_winner(), 1)
+
+        # Player 2 wins on reaching the top row while player 1 walks about.
+        q = QuoridorGame(5)
+        for player, coord in ((1, (1, 0)), (2, (2, 3)), (1, (0, 0)), (2, (2, 2)),
+                              (1, (1, 0)), (2, (2, 1)), (1, (0, 0)), (2, (2, 0))):
+            self.assertTrue(q.move_pawn(player, coord))
+        self.assertEqual([q.winner, q.is_winner(1), q.is_winner(2)], [2, False, True])
+
+        # A loaded position is won if a pawn already stands on its goal row.
+        for pawns, winner in ((((2, 2), (3, 0)), 2), (((2, 4), (3, 3)), 1), (((2, 2), (3, 3)), 0)):
+            q = QuoridorGame(5)
+            q.load_position(pawns, [], (10, 10), 1)
+            self.assertEqual(q.get_winner(), winner)
+        self.assertTrue(q.move_pawn(1, (2, 3)))
+
+    def test_bad_board_size(self):
+        """
+        Tests that a game or a board can't be made with a size that isn't an
+        int of at least 3, and that a 3 x 3 game still plays.
+        """
+        for size in (0, 1, 2, -4, 9.0, "9", None, True):
+            self.assertRaises(ValueError, QuoridorGame, size)
+            self.assertRaises(ValueError, GameBoard, size)
+
+        q = QuoridorGame(3)
+        self.assertEqual(q.get_player_1().get_current_position(), (1, 0))
+        self.assertTrue(q.move_pawn(1, (1, 1)))
+        self.assertTrue(q.move_pawn(2, (0, 2)))
+        self.assertTrue(q.move_pawn(1, (1, 2)))
+        self.assertTrue(q.is_winner(1))
+
     def test_create_fence(self):
         """
         Tests all the get/set methods on a Fence object
@@ -254,6 +407,33 @@ class TestQuoridor(unittest.TestCase):
 
         self.assertEqual(result_1, test_1)
 
+    def test_compact_objects(self):
+        """
+        Tests that nodes, players and fences carry no per-object dict, that
+        fence codes round trip, and that boards share coordinate tuples.
+        """
+        for item in (Node((0, 0)), Player(1, (4, 0)), Fence("v", (1, 1))):
+            self.assertFalse(hasattr(item, "__dict__"))
+
+        fence_1 = Fence.from_code(Fence("v", (7, 3)).to_code())
+        fence_2 = Fence.from_code(Fence("h", (0, 8)).to_code())
+
+        self.assertEqual([fence_1.get_direction(), fence_1.get_creation_point()], ["v", (7, 3)])
+        self.assertEqual([fence_2.get_direction(), fence_2.get_creation_point()], ["h", (0, 8)])
+        self.assertEqual(fence_2.get_segment(), [[0, 1], [8, 8]])
+
+        player_1 = Player(1, (4, 0))
+        player_1.add_new_fence("h", (2, 5))
+        player_1.add_new_fence("v", (3, 3))
+        player_1.take_back_fence()
+
+        self.assertEqual(list(player_1.get_fence_codes()), [Fence("h", (2, 5)).to_code()])
+        self.assertEqual(player_1.get_fences(), [[[2, 3], [5, 5]]])
+
+        node_1 = QuoridorGame().get_game_board().find_board_node((5, 5))
+        node_2 = QuoridorGame().get_game_board().find_board_node((5, 5))
+        self.assertIs(node_1.get_node_name(), node_2.get_node_name())
+
     def test_create_player_fences(self):
         """
         Tests all the functionality of a player's Fence list.
@@ -297,6 +477,243 @@ class TestQuoridor(unittest.TestCase):
         self.assertEqual(result_3, test_3)
         self.assertEqual(result_4, test_4)
 
+    def test_legal_moves(self):
+        """
+        Tests the legal move generators of QuoridorGame, including jumping
+        over a facing pawn.
+        """
+        q = QuoridorGame()
+
+        # Player 1 opens with three pawn moves and every fence slot.
+        result_1 = sorted(q.legal_pawn_moves(1))
+        result_2 = len(q.legal_fence_placements(1))
+        test_1 = [(3, 0), (4, 1), (5, 0)]
+        test_2 = 144
+
+        self.assertEqual(result_1, test_1)
+        self.assertEqual(result_2, test_2)
+
+        # Nothing is legal out of turn.
+        self.assertEqual(q.legal_pawn_moves(2), [])
+        self.assertEqual(q.legal_fence_placements(2), [])
+
+        # Walk the pawns until they face each other, then jump.
+        for player, coord in ((1, (4, 1)), (2, (4, 7)), (1, (4, 2)), (2, (4, 6)),
+                              (1, (4, 3)), (2, (4, 5)), (1, (4, 4))):
+            q.move_pawn(player, coord)
+
+        self.assertIn((4, 3), q.legal_pawn_moves(2))
+        self.assertTrue(q.move_pawn(2, (4, 3)))
+
+        # A fence between the pawns stops the jump back.
+        q.place_fence(1, "h", (4, 3))
+        result_3 = sorted(q.legal_pawn_moves(2))
+        test_3 = [(3, 3), (4, 5), (5, 3)]
+
+        self.assertEqual(result_3, test_3)
+
+        # A fence behind the facing pawn allows the diagonals instead.
+        q.place_fence(2, "h", (4, 5))
+        result_4 = sorted(q.legal_pawn_moves(1))
+        test_4 = [(3, 3), (3, 4), (5, 3), (5, 4)]
+
+        self.assertEqual(result_4, test_4)
+        self.assertTrue(q.move_pawn(1, (5, 3)))
+
+    def test_path_distance(self):
+        """
+        Tests that the shortest path to each winning area follows fence placement.
+        """
+        q = QuoridorGame()
+
+        result_1 = [q.get_path_distance(1), q.get_path_distance(2)]
+        test_1 = [8, 8]
+
+        # A fence right in front of player 1 forces a one step detour. Player 2
+        # races up the same column and has to go around it too.
+        q.place_fence(1, "h", (4, 1))
+        result_2 = [q.get_path_distance(1), q.get_path_distance(2)]
+        test_2 = [9, 9]
+
+        self.assertEqual(result_1, test_1)
+        self.assertEqual(result_2, test_2)
+        self.assertEqual(q.get_path_distance(1), q.to_state().shortest_path(1))
+
+    def test_fence_rules(self):
+        """
+        Tests the fair play rule and running out of fences.
+        """
+        q = QuoridorGame()
+
+        # Player 2 walls player 1 into the top left corner, one gap at a time.
+        for player, action in ((1, (3, 0)), (2, ("v", (1, 1))), (1, (2, 0)), (2, ("h", (1, 1))),
+                               (1, (1, 0)), (2, ("h", (0, 1))), (1, (0, 0))):
+            if isinstance(action[0], str):
+                self.assertTrue(q.place_fence(player, *action))
+            else:
+                self.assertTrue(q.move_pawn(player, action))
+
+        result_1 = q.place_fence(2, "v", (2, 0))
+        test_1 = "breaks the fair play rule"
+
+        self.assertEqual(result_1, test_1)
+        self.assertNotIn(("v", (2, 0)), q.legal_fence_placements(2))
+        self.assertEqual(q.get_whose_move(), 2)
+
+        # Player 2 spends the rest of their fences; the eleventh is refused.
+        for column in range(7):
+            self.assertTrue(q.place_fence(2, "h", (column, 6)))
+            self.assertTrue(q.place_fence(1, "h", (column, 3)))
+
+        self.assertEqual(q.get_player_2().get_no_of_fences(), 0)
+        self.assertFalse(q.place_fence(2, "h", (7, 6)))
+        self.assertEqual(q.legal_fence_placements(2), [])
+
+    def test_unmake_and_redo(self):
+        """
+        Tests that unmake takes moves back to the starting position and that
+        redo plays them again.
+        """
+        q = QuoridorGame()
+        start = q.to_state()
+
+        moves = [(1, None, (4, 1)), (2, None, (4, 7)), (1, "h", (6, 5)), (2, "v", (3, 3)),
+                 (1, None, (4, 2)), (2, "h", (4, 2))]
+        for player, direction, coord in moves:
+            if direction is None:
+                self.assertTrue(q.move_pawn(player, coord))
+            else:
+                self.assertTrue(q.place_fence(player, direction, coord))
+        end = q.to_state()
+        end_distances = [q.get_path_distance(1), q.get_path_distance(2)]
+
+        # Take everything back.
+        while q.unmake():
+            pass
+
+        self.assertEqual(q.to_state(), start)
+        self.assertEqual(q.get_player_1().get_fences(), [])
+        self.assertEqual(q.get_player_2().get_no_of_fences(), 10)
+        self.assertEqual([q.get_path_distance(1), q.get_path_distance(2)], [8, 8])
+        self.assertFalse(q.get_game_board().find_board_node((4, 2)).get_up_wall())
+
+        # Play everything again.
+        while q.redo():
+            pass
+
+        self.assertEqual(q.to_state(), end)
+        self.assertEqual([q.get_path_distance(1), q.get_path_distance(2)], end_distances)
+
+        # A new move after unmake drops the redo stack.
+        q.unmake()
+        q.move_pawn(2, (4, 6))
+        self.assertFalse(q.redo())
+        self.assertEqual(len(q.get_history()), 6)
+
+    def test_zobrist_key(self):
+        """
+        Tests that the Zobrist key follows the position, not the move order.
+        """
+        q_1 = QuoridorGame()
+        q_2 = QuoridorGame()
+        start = q_1.get_zobrist_key()
+
+        # The same fence and pawn moves, in two different orders.
+        q_1.place_fence(1, "h", (6, 5))
+        q_1.move_pawn(2, (4, 7))
+        q_1.move_pawn(1, (4, 1))
+
+        q_2.move_pawn(1, (4, 1))
+        q_2.move_pawn(2, (4, 7))
+        q_2.place_fence(1, "h", (6, 5))
+
+        self.assertEqual(q_1.get_zobrist_key(), q_2.get_zobrist_key())
+        self.assertEqual(q_1.get_zobrist_key(), q_1.to_state().get_zobrist_key())
+        self.assertNotEqual(q_1.get_zobrist_key(), start)
+
+        # Taking the moves back brings the starting key back.
+        while q_1.unmake():
+            pass
+        self.assertEqual(q_1.get_zobrist_key(), start)
+
+    def test_snapshot_and_restore(self):
+        """
+        Tests that a game restored from bytes or JSON is at the same position,
+        with the same fences per player, and plays on by the same rules.
+        """
+        q = QuoridorGame()
+        q.move_pawn(1, (4, 1))
+        q.place_fence(2, "h", (4, 2))
+        q.place_fence(1, "v", (5, 7))
+        q.place_fence(2, "v", (4, 1))
+
+        data = q.to_bytes()
+        self.assertEqual(len(data), 53)
+
+        for restored in (QuoridorGame.from_bytes(data), QuoridorGame.from_json(q.to_json())):
+            self.assertEqual(restored.to_state(), q.to_state())
+            self.assertEqual(restored.get_zobrist_key(), q.get_zobrist_key())
+            self.assertEqual(restored.get_player_2().get_no_of_fences(), 8)
+            self.assertEqual(sorted(restored.get_player_2().get_fences()), sorted(q.get_player_2().get_fences()))
+            self.assertEqual(restored.get_path_distance(1), q.get_path_distance(1))
+            self.assertEqual(restored.to_bytes(), data)
+
+            # Player 1 is fenced in above and to the left.
+            self.assertFalse(restored.move_pawn(1, (4, 2)))
+            self.assertFalse(restored.move_pawn(1, (3, 1)))
+            self.assertTrue(restored.move_pawn(1, (5, 1)))
+
+        self.assertRaises(ValueError, QuoridorGame.from_bytes, data[:-1])
+
+    def test_snapshot_many_fences(self):
+        """
+        Tests that a game whose player placed more than 10 fences, from a
+        start with 15, keeps all of them through JSON and bytes round trips.
+        """
+        q = QuoridorGame()
+        q.load_position(((4, 0), (4, 8)), [], (15, 15), 1)
+        for x in range(6):
+            for y in (2, 6):
+                self.assertTrue(q.place_fence(1, "h", (x, y)))
+                self.assertTrue(q.move_pawn(2, (4, 7) if q.get_player_2().get_current_position() == (4, 8)
+                                            else (4, 8)))
+        self.assertEqual(q.get_player_1().get_no_of_fences(), 3)
+
+        for restored in (QuoridorGame.from_json(QuoridorGame.from_json(q.to_json()).to_json()),
+                         QuoridorGame.from_bytes(QuoridorGame.from_bytes(q.to_bytes()).to_bytes())):
+            self.assertEqual(len(restored.get_placed_fences()), 12)
+            self.assertEqual(restored.get_player_1().get_no_of_fences(), 3)
+            self.assertEqual(restored.to_state(), q.to_state())
+
+    def test_corrupted_snapshot(self):
+        """
+        Tests that a snapshot with a value out of range for its board raises
+        ValueError, for a game and for a GameState.
+        """
+        q = QuoridorGame(5)
+        q.place_fence(1, "h", (2, 2))
+        data = q.to_bytes()
+        self.assertEqual(QuoridorGame.from_bytes(data).to_bytes(), data)
+
+        def corrupted(offset, value):
+            record = bytearray(data)
+            record[offset] = value
+            return bytes(record)
+
+        mask_start = POSITION_HEADER.size
+        for record in (corrupted(2, 25),                     # player 1 off the board
+                       corrupted(4, 200),                    # player 2 off the board
+                       corrupted(4, 2),                      # both pawns on one square
+                       corrupted(6, 250),                    # more fences than slots
+                       corrupted(8, 0),                      # nobody to move
+                       corrupted(8, 3),
+                       corrupted(mask_start, 1),             # h fence on the top edge
+                       corrupted(mask_start + 7, 2),         # v fence anchored past the board
+                       corrupted(mask_start + 8, 1 << 3),    # player 2 owns a missing fence
+                       b"\x01\x00" + data[2:9]):            # a size 0 board
+            self.assertRaises(ValueError, QuoridorGame.from_bytes, record)
+            self.assertRaises(ValueError, GameState.from_bytes, record)
+
     def test_game_play(self):
         """
         Tests the initialization of the game play.
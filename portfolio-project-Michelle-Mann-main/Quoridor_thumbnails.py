@@ -0,0 +1,105 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Batch thumbnails of recorded Quoridor games.
+# Draws the final position of every finished game of a record file, each
+# player's fences in their own colour. SVG thumbnails are written directly;
+# PNG ones are drawn with one reused matplotlib figure per worker process,
+# so no figure is built per game. Games are replayed on GameState, which is
+# much quicker than building a QuoridorGame for each.
+
+import argparse
+import multiprocessing
+import os
+
+from Quoridor_records import RecordReader
+from Quoridor_render import BoardFigure, fence_segment, render_svg
+from Quoridor_state import GameState
+
+
+def picture_of_moves(moves, size=9, no_of_fences=10):
+    """
+    Returns the picture (see Quoridor_render.picture_of) of the position a
+    list of move codes leads to, with each fence given to the player who
+    placed it, or None if one of the moves is illegal.
+    """
+    state = GameState(size, no_of_fences)
+    geometry = state.get_geometry()
+    fences = ([], [], [])
+    for move in moves:
+        player = state.get_whose_move()
+        if not state.play(move):
+            return None
+        kind, coord_tuple = geometry.describe_move(move)
+        if kind != "pawn":
+            fences[player].append(fence_segment(kind, coord_tuple))
+    return size, (state.get_pawn(1), state.get_pawn(2)), fences
+
+
+def thumbnail_name(index, image_format):
+    """Returns the file name of the thumbnail of game number index"""
+    return "game-%06d.%s" % (index, image_format)
+
+
+def render_range(job):
+    """
+    Writes the thumbnails of games start to stop of a record file and
+    returns how many were written. job is a (path, folder, image_format,
+    cell, start, stop) tuple so it can be sent to a worker process.
+    """
+    path, folder, image_format, cell, start, stop = job
+    figure = None
+    written = 0
+    with RecordReader(path) as reader:
+        for index in range(start, stop):
+            moves, winner = reader[index]
+            picture = picture_of_moves(moves, reader.get_size(), reader.get_no_of_fences()) if winner else None
+            if picture is None:
+                continue
+
+            target = os.path.join(folder, thumbnail_name(index, image_format))
+            if image_format == "svg":
+                with open(target, "w") as image_file:
+                    image_file.write(render_svg(picture, cell))
+            else:
+                if figure is None:
+                    figure = BoardFigure(reader.get_size(), inches=cell * reader.get_size() / 100, dpi=100)
+                figure.draw(picture)
+                figure.save(target, image_format)
+            written += 1
+    return written
+
+
+def render_archive(path, folder, image_format="svg", cell=32, workers=1, chunk_size=1000):
+    """
+    Writes a thumbnail of the final position of every finished game of a
+    record file into folder, named by game index. Games with an illegal
+    move are skipped. Returns the number of thumbnails written.
+    """
+    os.makedirs(folder, exist_ok=True)
+    with RecordReader(path) as reader:
+        count = len(reader)
+
+    jobs = [(path, folder, image_format, cell, start, min(start + chunk_size, count))
+            for start in range(0, count, chunk_size)]
+    if workers == 1:
+        return sum(map(render_range, jobs))
+    with multiprocessing.Pool(workers) as pool:
+        return sum(pool.map(render_range, jobs))
+
+
+def main():
+    """Writes the thumbnails of a record file from the command line, will not run if imported"""
+    parser = argparse.ArgumentParser(description="Draw thumbnails of the games of a Quoridor record file.")
+    parser.add_argument("path")
+    parser.add_argument("folder")
+    parser.add_argument("--format", default="svg", help="svg, or png (needs matplotlib)")
+    parser.add_argument("--cell", type=int, default=32, help="pixels per square")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    count = render_archive(args.path, args.folder, args.format, args.cell, args.workers)
+    print(str(count) + " thumbnails written to " + args.folder)
+
+
+if __name__ == '__main__':
+    main()
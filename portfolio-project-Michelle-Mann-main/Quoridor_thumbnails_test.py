@@ -0,0 +1,65 @@
+# Author: Michelle Mann
+# Date: 10/17/2026
+# Description: Unit Test for the Quoridor game thumbnails
+
+import importlib.util
+import os
+import tempfile
+import unittest
+from Quoridor_records import RecordReader, RecordWriter, load_game
+from Quoridor_records_test import random_games
+from Quoridor_render import picture_of
+from Quoridor_thumbnails import picture_of_moves, render_archive, thumbnail_name
+
+HAS_MATPLOTLIB = importlib.util.find_spec("matplotlib") is not None
+
+
+class TestThumbnails(unittest.TestCase):
+    """Contains the unit test for the game thumbnails"""
+
+    def setUp(self):
+        """Writes a record file of six finished games, an unfinished and an illegal one"""
+        self._folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self._folder.cleanup)
+        self._path = os.path.join(self._folder.name, "games.qr")
+        self._games = random_games(6, 31)
+        with RecordWriter(self._path) as writer:
+            for moves, winner in self._games:
+                writer.write_game(moves, winner)
+            writer.write_game(self._games[0][0][:4], 0)
+            writer.write_game([0, 0], 1)
+
+    def test_pictures(self):
+        """
+        Tests that a game replayed on a GameState gives the same picture,
+        fence owners included, as the game replayed through QuoridorGame.
+        """
+        with RecordReader(self._path) as reader:
+            pictures = [picture_of_moves(reader[index][0]) for index in range(6)]
+            for index in range(6):
+                self.assertEqual(pictures[index], picture_of(load_game(reader, index)))
+        self.assertTrue(any(picture[2][1] or picture[2][2] for picture in pictures))
+        self.assertIsNone(picture_of_moves([0, 0]))
+
+    def test_svg_archive(self):
+        """
+        Tests that every finished legal game gets an SVG thumbnail, in one
+        process and over two.
+        """
+        for workers, folder in ((1, "one"), (2, "two")):
+            folder = os.path.join(self._folder.name, folder)
+            self.assertEqual(render_archive(self._path, folder, workers=workers, chunk_size=3), 6)
+            self.assertEqual(sorted(os.listdir(folder)), [thumbnail_name(index, "svg") for index in range(6)])
+
+        with open(os.path.join(self._folder.name, "one", "game-000002.svg")) as image_file:
+            self.assertTrue(image_file.read().startswith("<svg "))
+
+    @unittest.skipIf(not HAS_MATPLOTLIB, "matplotlib is not installed")
+    def test_png_archive(self):
+        """
+        Tests PNG thumbnails drawn with one reused figure.
+        """
+        folder = os.path.join(self._folder.name, "png")
+        self.assertEqual(render_archive(self._path, folder, "png", cell=8), 6)
+        with open(os.path.join(folder, "game-000000.png"), "rb") as image_file:
+            self.assertEqual(image_file.read(4), b"\x89PNG")